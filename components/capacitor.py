@@ -35,37 +35,30 @@ class Capacitor(CircuitComponent):
         
         pass
         
-    def stamp(self, A, b, n1, n2, ctx: StampContext):
+    def companion(self, ctx: StampContext):
         """
-        Objective: Update A matrix and b vector to solve the network problem
+        Objective: Discretized companion model of the capacitor. The branch 
+        current from n1 to n2 is G*(v1 - v2) + J.
+        TR-BDF2 steps reach the component as a trapezoidal and a BDF2 stage.
 
         Parameters
         ----------
-        A : Float, Array
-            Coefficient array characterizing the network.
-        b : Float, Vector
-            Source vector characterizing the network.
-        n1 : Integer, Scalar
-            Index for for the first node associated with this component.
-        n2 : Integer, Scalar
-            Index for for the second node associated with this component.
         ctx : StampContext, custom data class
-            Additional calculation information for capacitors, inductors, 
-            voltage sources, etc.
+            Timestep and discretization information.
 
         Raises
         ------
         ValueError
-            Capacitor has None or Negative Capacitance. Cap
+            Capacitor has None or Negative Capacitance, or no valid dt.
 
         Returns
         -------
-        None.
+        G : Float, Scalar
+            Companion conductance.
+        J : Float, Scalar
+            Companion history current.
 
         """
-        # Objective: Update A matrix and b vector to solve the network problem
-
-        # Used for matrix formulation in network class
         
         if ctx.dt is None:
             raise ValueError("Invalid dt for Capacitor calculation")
@@ -80,26 +73,73 @@ class Capacitor(CircuitComponent):
                 Ieq = G*self.component.discrete_data.lpv1_voltage
             else:
                 if ctx.discretization == DiscretizationType.BDF2:
-                    tmp_qty = self.component.capacitance / (2*ctx.dt)
+                    a0, a1, a2 = self._bdf2_coefficients(ctx.dt)
+                    tmp_qty = self.component.capacitance / ctx.dt
                     
-                    G = 3*tmp_qty
-                    Ieq = (4*self.component.discrete_data.lpv1_voltage - 
-                           self.component.discrete_data.lpv2_voltage) * tmp_qty
+                    G = a0*tmp_qty
+                    Ieq = (a1*self.component.discrete_data.lpv1_voltage - 
+                           a2*self.component.discrete_data.lpv2_voltage
+                           ) * tmp_qty
+                elif ctx.discretization == DiscretizationType.TRAPEZOIDAL:
+                    G = 2*self.component.capacitance / ctx.dt
+                    Ieq = (G*self.component.discrete_data.lpv1_voltage + 
+                           self.component.discrete_data.lpv1_current)
+                elif ctx.discretization == DiscretizationType.BDF_VARIABLE:
+                    alpha0, voltage_terms, _ = self._bdf_terms(ctx.dt, 
+                                                               ctx.bdf_order)
+                    G = alpha0*self.component.capacitance
+                    Ieq = -voltage_terms*self.component.capacitance
                 else:
                     raise ValueError("Specify valid discretization scheme")
             
-            # Update A array, assumes A / b passed as references
-            A[n1, n1] += G
-            A[n2, n2] += G
-            A[n1, n2] -= G
-            A[n2, n1] -= G
-            
-            # b vector
-            b[n1] += Ieq
-            b[n2] -= Ieq
+            # History current opposes the n1 -> n2 branch current
+            return G, -Ieq
         
         else:
             raise ValueError("Capacitor has None or Negative capacitance")
+        
+    def stamp(self, A, b, n1, n2, ctx: StampContext):
+        """
+        Objective: Update A matrix and b vector to solve the network problem
+
+        Parameters
+        ----------
+        A : Float, Array
+            Coefficient array characterizing the network.
+        b : Float, Vector
+            Source vector characterizing the network.
+        n1 : Integer, Scalar
+            Index for for the first node associated with this component.
+        n2 : Integer, Scalar
+            Index for for the second node associated with this component.
+        ctx : StampContext, custom data class
+            Additional calculation information for capacitors, inductors, 
+            voltage sources, etc.
+
+        Raises
+        ------
+        ValueError
+            Capacitor has None or Negative Capacitance. Cap
+
+        Returns
+        -------
+        None.
+
+        """
+        # Objective: Update A matrix and b vector to solve the network problem
+
+        # Used for matrix formulation in network class
+        G, J = self.companion(ctx)
+            
+        # Update A array, assumes A / b passed as references
+        A[n1, n1] += G
+        A[n2, n2] += G
+        A[n1, n2] -= G
+        A[n2, n1] -= G
+        
+        # b vector
+        b[n1] -= J
+        b[n2] += J
     
     def post_solve(self, voltage_new: float, ctx: StampContext):
         
@@ -117,13 +157,31 @@ class Capacitor(CircuitComponent):
 
             lpv1_voltage = self.component.discrete_data.lpv1_voltage
             lpv2_voltage = self.component.discrete_data.lpv2_voltage
+            a0, a1, a2 = self._bdf2_coefficients(ctx.dt)
             
             self.component.current = ((self.component.capacitance / 
-                                       (2*ctx.dt)) * (3*voltage_new - 
-                                                      4*lpv1_voltage + 
-                                                      lpv2_voltage))
+                                       ctx.dt) * (a0*voltage_new - 
+                                                  a1*lpv1_voltage + 
+                                                  a2*lpv2_voltage))
+        
+        elif ctx.discretization == DiscretizationType.TRAPEZOIDAL:
+
+            lpv1_voltage = self.component.discrete_data.lpv1_voltage
+            lpv1_current = self.component.discrete_data.lpv1_current
+            
+            self.component.current = ((2*self.component.capacitance / 
+                                       ctx.dt) * (voltage_new - 
+                                                  lpv1_voltage) - 
+                                      lpv1_current)
+        
+        elif ctx.discretization == DiscretizationType.BDF_VARIABLE:
+            
+            alpha0, voltage_terms, _ = self._bdf_terms(ctx.dt, ctx.bdf_order)
+            
+            self.component.current = (self.component.capacitance * 
+                                      (alpha0*voltage_new + voltage_terms))
         # Store lpvs
-        self._store_lpv()
+        self._store_lpv(ctx.dt)
                                                       
     def voltage(self):
         raise ValueError("Capacitor has no voltage method")
@@ -12,7 +12,7 @@ Created on Fri Sep  5 21:42:02 2025
 from abc import ABC, abstractmethod
 
 # Custom classes
-from data_classes.component_data import ComponentData
+from data_classes.component_data import BDF_HISTORY, ComponentData
 from data_classes.stamp_context import StampContext
 # -----------------------------------------------------------------------------
 # Define class
@@ -23,16 +23,74 @@ class CircuitComponent(ABC):
         self.component = component_data
         self.source = False
     
-    def _store_lpv(self):
+    def _store_lpv(self, dt=0.0):
         # Store lpv for circuit component discretization (ie inductors, 
-        # capacitors)
+        # capacitors), with the step that produced them
         if self.component.discrete_data is not None:
             d = self.component.discrete_data
             
+            # Variable order BDF history - seeded with the state the first 
+            # step started from
+            if dt:
+                d.history_voltage = ([self.component.voltage] + 
+                                     (d.history_voltage or 
+                                      [d.lpv1_voltage]))[:BDF_HISTORY]
+                d.history_current = ([self.component.current] + 
+                                     (d.history_current or 
+                                      [d.lpv1_current]))[:BDF_HISTORY]
+                d.history_dt = ([dt] + d.history_dt)[:BDF_HISTORY - 1]
+            
             d.lpv2_voltage = d.lpv1_voltage
             d.lpv1_voltage = self.component.voltage
             d.lpv2_current = d.lpv1_current
             d.lpv1_current = self.component.current
+            d.lpv1_dt = dt
+    
+    def _bdf2_coefficients(self, dt):
+        # Variable step BDF2, x' ~ (a0 x_new - a1 lpv1 + a2 lpv2) / dt with
+        # w = dt / lpv1_dt - (3/2, 2, 1/2) on a constant step
+        dt_prev = self.component.discrete_data.lpv1_dt
+        w = dt / dt_prev if dt_prev > 0 else 1.0
+        
+        return (1 + 2*w)/(1 + w), 1 + w, w*w/(1 + w)
+    
+    def _bdf_terms(self, dt, order):
+        """
+        Objective: Variable step BDF of the given order (capped by the 
+        stored history), x' ~ alpha0 x_new + sum_j alpha_j x_j over the 
+        history points - the derivative of the polynomial through the new 
+        and the history points at the new point.
+
+        Returns
+        -------
+        alpha0 : Float
+            Coefficient of the new value.
+        voltage_terms, current_terms : Float
+            sum_j alpha_j x_j over the voltage and the current history.
+        """
+        
+        d = self.component.discrete_data
+        voltages = d.history_voltage or [d.lpv1_voltage]
+        currents = d.history_current or [d.lpv1_current]
+        order = max(1, min(order, len(voltages)))
+        
+        # Point times relative to the new one
+        tau = [0.0, -dt]
+        for h in d.history_dt[:order - 1]:
+            tau.append(tau[-1] - h)
+        
+        # Lagrange basis derivatives at tau[0]
+        alpha0 = sum(-1.0/t for t in tau[1:])
+        voltage_terms = current_terms = 0.0
+        for j in range(1, order + 1):
+            alpha = 1.0 / (tau[j] - tau[0])
+            for m in range(1, order + 1):
+                if m != j:
+                    alpha *= (tau[0] - tau[m]) / (tau[j] - tau[m])
+            voltage_terms += alpha*voltages[j - 1]
+            current_terms += alpha*currents[j - 1]
+        
+        return alpha0, voltage_terms, current_terms
     
     # @abstractmethod forces an error at subclass creation instead of runtime 
     # for improperly created components
@@ -42,6 +100,13 @@ class CircuitComponent(ABC):
         # Overwrite with subclass implementation
         raise NotImplementedError('Components must implement this method')
     
+    @abstractmethod
+    def companion(self, ctx: StampContext):
+        # Purpose: return (G, J), the companion model of the component where
+        # the branch current from node1 to node2 is G*(v1 - v2) + J
+        # Overwrite with subclass implementation
+        raise NotImplementedError('Components must implement this method')
+    
     @abstractmethod
     def stamp(self, A, b, n1, n2, ctx: StampContext):
         # Purpose: populate A, b from Ax = b formulation in networks class
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 21:02:37 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Custom classes
+from components.circuit_component import CircuitComponent
+from enums.component_type import ComponentType
+from data_classes.stamp_context import StampContext
+
+# -----------------------------------------------------------------------------
+# Define class
+# -----------------------------------------------------------------------------
+
+class CurrentSource(CircuitComponent):
+    def __init__(self, component_data):
+
+        # Inherit superclass prop
+        super().__init__(component_data)
+
+        # Enforce type setting
+        self.component.ctype = ComponentType.CURRENT_SOURCE
+        self.source = True
+
+    def update(self):
+        # The current is fixed by the source, the voltage across it comes
+        # from the network solve
+        self.current()
+
+    def companion(self, ctx: StampContext):
+        # Ideal current source - no conductance, the source current flows
+        # from node1 to node2 through the source
+
+        if self.component.ideal_params is None:
+            raise ValueError('Error: Specify current source ideal parameters')
+
+        return 0.0, self.component.ideal_params.ideal_current
+
+    def stamp(self, A, b, n1, n2, ctx: StampContext):
+        # Used for matrix formulation in network class
+
+        _, J = self.companion(ctx)
+
+        # Current leaves n1, enters n2 - right hand side only
+        b[n1] -= J
+        b[n2] += J
+
+    def post_solve(self, voltage_new: float, ctx: StampContext):
+
+        self.component.voltage = voltage_new
+        self.current()
+
+    def voltage(self):
+        raise ValueError("Current source has no voltage method")
+
+    def current(self):
+        # Current through the source
+        if self.component.ideal_params is None:
+            raise ValueError('Error: Specify current source ideal parameters')
+
+        self.component.current = self.component.ideal_params.ideal_current
+
+    def resistance(self):
+        raise ValueError("Current source has no resistance method")
@@ -35,36 +35,30 @@ class Inductor(CircuitComponent):
     
         pass
         
-    def stamp(self, A, b, n1, n2, ctx: StampContext):
+    def companion(self, ctx: StampContext):
         """
-        Objective: Update A matrix and b vector to solve the network problem
+        Objective: Discretized companion model of the inductor. The branch 
+        current from n1 to n2 is G*(v1 - v2) + J.
+        TR-BDF2 steps reach the component as a trapezoidal and a BDF2 stage.
 
         Parameters
         ----------
-        A : Float, Array
-            Coefficient array characterizing the network.
-        b : Float, Vector
-            Source vector characterizing the network.
-        n1 : Integer, Scalar
-            Index for for the first node associated with this component.
-        n2 : Integer, Scalar
-            Index for for the second node associated with this component.
         ctx : StampContext, custom data class
-            Additional calculation information for capacitors, inductors, 
-            voltage sources, etc.
+            Timestep and discretization information.
 
         Raises
         ------
         ValueError
-            Capacitor has None or Negative Capacitance. Cap
+            Inductor has None or Negative Inductance, or no valid dt.
 
         Returns
         -------
-        None.
+        G : Float, Scalar
+            Companion conductance.
+        J : Float, Scalar
+            Companion history current.
 
         """
-
-        # Used for matrix formulation in network class
         
         if ctx.dt is None:
             raise ValueError("Invalid dt for Inductor calculation")
@@ -79,24 +73,68 @@ class Inductor(CircuitComponent):
                 Ieq = self.component.discrete_data.lpv1_current
             else:
                 if ctx.discretization == DiscretizationType.BDF2:
-                    G = (2*ctx.dt) / (3*self.component.inductance)
-                    Ieq = (4*self.component.discrete_data.lpv1_current - 
-                           self.component.discrete_data.lpv2_current)/3
+                    a0, a1, a2 = self._bdf2_coefficients(ctx.dt)
+                    G = ctx.dt / (a0*self.component.inductance)
+                    Ieq = (a1*self.component.discrete_data.lpv1_current - 
+                           a2*self.component.discrete_data.lpv2_current)/a0
+                elif ctx.discretization == DiscretizationType.TRAPEZOIDAL:
+                    G = ctx.dt / (2*self.component.inductance)
+                    Ieq = (self.component.discrete_data.lpv1_current + 
+                           G*self.component.discrete_data.lpv1_voltage)
+                elif ctx.discretization == DiscretizationType.BDF_VARIABLE:
+                    alpha0, _, current_terms = self._bdf_terms(ctx.dt, 
+                                                               ctx.bdf_order)
+                    G = 1.0 / (alpha0*self.component.inductance)
+                    Ieq = -current_terms/alpha0
                 else:
                     raise ValueError("Specify valid discretization scheme")
             
-            # Update A array, assumes A / b passed as references
-            A[n1, n1] += G
-            A[n2, n2] += G
-            A[n1, n2] -= G
-            A[n2, n1] -= G
-            
-            # b vector
-            b[n1] -= Ieq
-            b[n2] += Ieq
+            return G, Ieq
         
         else:
             raise ValueError("Inductor has None or Negative inductance")
+        
+    def stamp(self, A, b, n1, n2, ctx: StampContext):
+        """
+        Objective: Update A matrix and b vector to solve the network problem
+
+        Parameters
+        ----------
+        A : Float, Array
+            Coefficient array characterizing the network.
+        b : Float, Vector
+            Source vector characterizing the network.
+        n1 : Integer, Scalar
+            Index for for the first node associated with this component.
+        n2 : Integer, Scalar
+            Index for for the second node associated with this component.
+        ctx : StampContext, custom data class
+            Additional calculation information for capacitors, inductors, 
+            voltage sources, etc.
+
+        Raises
+        ------
+        ValueError
+            Capacitor has None or Negative Capacitance. Cap
+
+        Returns
+        -------
+        None.
+
+        """
+
+        # Used for matrix formulation in network class
+        G, J = self.companion(ctx)
+            
+        # Update A array, assumes A / b passed as references
+        A[n1, n1] += G
+        A[n2, n2] += G
+        A[n1, n2] -= G
+        A[n2, n1] -= G
+        
+        # b vector
+        b[n1] -= J
+        b[n2] += J
     
     def post_solve(self, voltage_new: float, ctx: StampContext):
         
@@ -114,14 +152,34 @@ class Inductor(CircuitComponent):
 
             lpv1_current = self.component.discrete_data.lpv1_current
             lpv2_current = self.component.discrete_data.lpv2_current
+            a0, a1, a2 = self._bdf2_coefficients(ctx.dt)
             
-            self.component.current = (((4*lpv1_current - lpv2_current)/3) + 
-                                      ((2*ctx.dt) / 
-                                       (3*self.component.inductance)) * 
+            self.component.current = (((a1*lpv1_current - 
+                                        a2*lpv2_current)/a0) + 
+                                      (ctx.dt / 
+                                       (a0*self.component.inductance)) * 
                                       voltage_new)
+        
+        elif ctx.discretization == DiscretizationType.TRAPEZOIDAL:
+
+            lpv1_voltage = self.component.discrete_data.lpv1_voltage
+            lpv1_current = self.component.discrete_data.lpv1_current
+            
+            self.component.current = (lpv1_current + 
+                                      (ctx.dt / 
+                                       (2*self.component.inductance)) * 
+                                      (voltage_new + lpv1_voltage))
+        
+        elif ctx.discretization == DiscretizationType.BDF_VARIABLE:
+            
+            alpha0, _, current_terms = self._bdf_terms(ctx.dt, ctx.bdf_order)
+            
+            self.component.current = ((voltage_new / 
+                                       self.component.inductance - 
+                                       current_terms) / alpha0)
 
         # Store lpvs
-        self._store_lpv()
+        self._store_lpv(ctx.dt)
                                       
     def voltage(self):
         raise ValueError("Inductor has no voltage method")
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 11:02:48 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Custom classes
+from components.circuit_component import CircuitComponent
+from enums.component_type import ComponentType
+from data_classes.stamp_context import StampContext
+
+# -----------------------------------------------------------------------------
+# Define class
+# -----------------------------------------------------------------------------
+
+class SubcircuitBranch(CircuitComponent):
+    """
+    One port pair of a subcircuit instance. The pairwise conductances of all
+    branches of an instance add up to its port admittance, the history
+    currents of the reduced internals ride on the branches leaving the first
+    port of each internal group.
+    """
+
+    def __init__(self, component_data, instance, pair: int):
+
+        # Inherit superclass prop
+        super().__init__(component_data)
+
+        # Enforce type setting
+        self.component.ctype = ComponentType.SUBCIRCUIT
+        self.instance = instance
+        self.pair = pair
+
+    def update(self):
+        # Internal history moved on - port reduction of this step is stale
+        self.instance.invalidate()
+
+    def companion(self, ctx: StampContext):
+        # Branch current from n1 to n2 is G*(v1 - v2) + J
+
+        G, J = self.instance.companion(ctx)
+
+        return G[self.pair], J[self.pair]
+
+    def stamp(self, A, b, n1, n2, ctx: StampContext):
+        # Used for matrix formulation in network class
+
+        G, J = self.companion(ctx)
+
+        A[n1, n1] += G
+        A[n2, n2] += G
+        A[n1, n2] -= G
+        A[n2, n1] -= G
+
+        b[n1] -= J
+        b[n2] += J
+
+    def post_solve(self, voltage_new: float, ctx: StampContext):
+        # Share of the port currents carried by this pair, the internals are
+        # stored by the instance once every port voltage is known
+
+        G, J = self.companion(ctx)
+
+        self.component.voltage = voltage_new
+        self.component.current = G*voltage_new + J
+
+    def voltage(self):
+        raise ValueError("Subcircuit branch has no voltage method")
+
+    def current(self):
+        raise ValueError("Subcircuit branch has no current method")
+
+    def resistance(self):
+        raise ValueError("Subcircuit branch has no resistance method")
@@ -48,23 +48,29 @@ class Switch(CircuitComponent):
             raise ValueError('Error: Specify calculation mode for Switch '+
                              self.component.name)
             
-    def stamp(self, A, b, n1, n2, ctx: StampContext):
-        # Used for matrix formulation in network class
+    def companion(self, ctx: StampContext):
+        # Companion model - pure conductance, no history current
         
         if (self.component.resistance is not None and
             self.component.resistance > 0):
 
             # Calculate conductance
-            G = 1.0 / self.component.resistance
-            
-            # Update A array, assumes A / b passed as references
-            A[n1, n1] += G
-            A[n2, n2] += G
-            A[n1, n2] -= G
-            A[n2, n1] -= G
+            return 1.0 / self.component.resistance, 0.0
         
         else:
             raise ValueError("Switch has None or Negative resistance")
+    
+    def stamp(self, A, b, n1, n2, ctx: StampContext):
+        # Used for matrix formulation in network class
+        
+        # Calculate conductance
+        G, _ = self.companion(ctx)
+            
+        # Update A array, assumes A / b passed as references
+        A[n1, n1] += G
+        A[n2, n2] += G
+        A[n1, n2] -= G
+        A[n2, n1] -= G
 
     def post_solve(self, voltage_new: float, ctx: StampContext):
         
@@ -44,9 +44,38 @@ class VoltageSource(CircuitComponent):
             raise ValueError('Error: Specify calculation mode for Voltage '+
                              self.component.name)
     
+    def companion(self, ctx: StampContext):
+        # Norton equivalent of the source - only defined for a non-zero 
+        # internal resistance. Ideal sources are stamped as MNA rows.
+        
+        if self.component.ideal_params is None:
+            raise ValueError('Error: Specify voltage source ideal parameters')
+        
+        r_int = self.component.ideal_params.int_resistance
+        if r_int is None or r_int <= 0:
+            raise ValueError(
+                f'Error: Voltage source {self.component.name} has no Norton '
+                f'equivalent for internal resistance: {r_int}')
+        
+        G = 1.0 / r_int
+        return G, G * self.component.ideal_params.ideal_voltage
+    
     def stamp(self, A, b, n1, n2, ctx: StampContext):
         # Used for matrix formulation in network class
         
+        # No MNA row assigned - source was converted to its Norton equivalent
+        if ctx.voltage_source_index is None:
+            G, J = self.companion(ctx)
+            
+            A[n1, n1] += G
+            A[n2, n2] += G
+            A[n1, n2] -= G
+            A[n2, n1] -= G
+            
+            b[n1] -= J
+            b[n2] += J
+            return
+        
         # Check for ideal parameters        
         if self.component.ideal_params is not None:
             r_int = self.component.ideal_params.int_resistance
@@ -69,9 +98,17 @@ class VoltageSource(CircuitComponent):
         # inlet node n1, and outlet node n2. 
         b[ctx.voltage_source_index] -= v_rise
     
-    def post_solve(self, current_new: float, ctx: StampContext):
+    def post_solve(self, solution_variable: float, ctx: StampContext):
+        
+        # MNA source - the solution variable is the source current
+        if ctx.voltage_source_index is not None:
+            self.component.current = solution_variable
+            return
         
-        self.component.current = current_new
+        # Norton equivalent - recover the current from the voltage drop 
+        # v1 - v2 across the source
+        G, J = self.companion(ctx)
+        self.component.current = G*solution_variable + J
     
     def voltage(self):
         # Calculate voltage across source
@@ -12,6 +12,9 @@ Created on Fri Sep  5 22:10:52 2025
 # Built in classes
 from dataclasses import dataclass
 
+# Custom enums
+from enums.solver_backend import SolverBackend
+
 # -----------------------------------------------------------------------------
 # Define class
 # -----------------------------------------------------------------------------
@@ -20,4 +23,32 @@ from dataclasses import dataclass
 class MathChecks:
     min_dt: float = 1e-6
     max_conductance: float = 1e9
-    sparse_threshold: int = 200
\ No newline at end of file
+    max_condition: float = 1e15 # 1-norm condition estimate guard on A
+    sparse_threshold: int = 200
+    norton_sources: bool = True # sources with r_int > 0 stamped as Norton
+    fixed_potentials: bool = True # grounded ideal sources moved to b
+    topology_reduction: bool = False # series / parallel merge on compile
+    node_ordering: str = 'rcm' # rcm, mindegree, none - applied on compile
+    dt_snap_rtol: float = 1e-9
+    low_rank_max_rank: int = 0 # 0 disables Sherman-Morrison-Woodbury updates
+    factor_cache_size: int = 8 # LU factorizations kept per network
+    island_workers: int = 1 # threads for solving isolated islands
+    solver_backend: SolverBackend = SolverBackend.AUTO
+    cholesky_max_spread: float = 1e6 # AUTO keeps LU above max/min |A| spread
+    superlu_ordering: str = 'COLAMD' # COLAMD, MMD_AT_PLUS_A, MMD_ATA, NATURAL
+    iterative_rtol: float = 1e-12
+    iterative_method: str = 'auto' # auto, cg, gmres, bicgstab
+    iterative_preconditioner: str = 'ilu' # ilu, jacobi, none
+    dd_parts: int = 4 # subdomains of the domain decomposition backend
+    dd_workers: int = 1 # threads factoring / solving the subdomains
+    multirate_ratio: int = 10 # micro steps per slow partition macro step
+    multirate_min_steps: float = 20.0 # macro steps per slow time constant
+    multirate_rtol: float = 1e-3 # slow state LTE, relative to its peak
+    multirate_latency: bool = True # skip fast solves while its inputs hold
+    adaptive_rtol: float = 1e-3 # solve_adaptive LTE tolerance on the
+    adaptive_atol: float = 1e-6 # capacitor voltages / inductor currents
+    adaptive_dt_max: float | None = None # None - 1/20 of the time span
+    bdf_max_order: int = 5 # BDF_VARIABLE order limit, 1 .. 5
+    event_tol: float = 1e-12 # switch edge time bisection tolerance
+    event_samples: int = 4 # interior points searched for edges per step
+    autotune_file: str | None = None # JSON written by Network.autotune()
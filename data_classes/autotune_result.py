@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 15:32:10 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built in classes
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+# Custom enums
+from enums.solver_backend import SolverBackend
+
+# -----------------------------------------------------------------------------
+# Define class
+# -----------------------------------------------------------------------------
+
+@dataclass
+class AutotuneResult:
+    fingerprint: str
+    backend: SolverBackend
+    ordering: Optional[str] = None
+    
+    # Trial cost per candidate label (seconds per simulated step)
+    timings: Dict[str, float] = field(default_factory=dict)
+    
+    # Candidates that failed during the trial, label -> error message
+    failures: Dict[str, str] = field(default_factory=dict)
+    
+    def to_dict(self):
+        return {'backend': self.backend.name,
+                'ordering': self.ordering,
+                'timings': dict(self.timings),
+                'failures': dict(self.failures)}
+    
+    @classmethod
+    def from_dict(cls, fingerprint: str, data: dict):
+        return cls(fingerprint=fingerprint,
+                   backend=SolverBackend[data['backend']],
+                   ordering=data.get('ordering'),
+                   timings=dict(data.get('timings', {})),
+                   failures=dict(data.get('failures', {})))
@@ -10,7 +10,7 @@ Created on Fri Sep  5 22:10:52 2025
 # -----------------------------------------------------------------------------
 
 # Built in classes
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 # Custom enums
@@ -28,6 +28,9 @@ class IdealComponentData:
     ideal_current: float = 0.0
     int_resistance: float = 0.0
 
+# Points kept for the variable order BDF scheme (its highest order)
+BDF_HISTORY = 5
+
 # Historical component data
 @dataclass(slots=True)
 class DiscretizationData:
@@ -35,6 +38,13 @@ class DiscretizationData:
     lpv2_voltage: float = 0.0
     lpv1_current: float = 0.0
     lpv2_current: float = 0.0
+    lpv1_dt: float = 0.0 # step that led from lpv2 to lpv1
+    
+    # Variable order BDF history, newest (lpv1) first, and the steps 
+    # between the points
+    history_voltage: list[float] = field(default_factory=list)
+    history_current: list[float] = field(default_factory=list)
+    history_dt: list[float] = field(default_factory=list)
 
 @dataclass(slots=True)
 class ComponentData:
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 14:58:10 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built in classes
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+# -----------------------------------------------------------------------------
+# Define class
+# -----------------------------------------------------------------------------
+
+@dataclass
+class DecompositionReport:
+    num_unknowns: int
+    num_parts: int
+    num_interface: int
+    part_sizes: List[int] = field(default_factory=list)
+    cpu_count: int = 1
+
+    # Factor + solve seconds per worker count, and the single threaded
+    # SuperLU reference
+    timings: Dict[int, float] = field(default_factory=dict)
+    superlu_time: float = float('nan')
+
+    @property
+    def speedup(self):
+        # Against the one worker decomposition
+        base = self.timings.get(1)
+        return {w: base / t for w, t in self.timings.items()
+                if base is not None and t > 0}
+
+    def __str__(self):
+        lines = [f"Domain decomposition ({self.num_unknowns} unknowns, "
+                 f"{self.num_parts} subdomains, {self.num_interface} "
+                 f"interface, {self.cpu_count} cores)",
+                 f"\t{'SuperLU':10s}{self.superlu_time:12.4f} s"]
+        speedup = self.speedup
+        for workers, seconds in sorted(self.timings.items()):
+            lines.append(f"\t{workers:3d} {'workers':6s}{seconds:12.4f} s"
+                         f"{speedup.get(workers, float('nan')):8.2f}x")
+
+        return '\n'.join(lines)
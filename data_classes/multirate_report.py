@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Tue Oct 20 10:02:37 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built in classes
+from dataclasses import dataclass, field
+from typing import List
+
+# -----------------------------------------------------------------------------
+# Define class
+# -----------------------------------------------------------------------------
+
+@dataclass
+class MultirateReport:
+    num_unknowns: int
+    ratio: int
+    
+    # Partition in use at the end of the run
+    fast_unknowns: int = 0
+    slow_unknowns: int = 0
+    slow_components: List[str] = field(default_factory=list)
+    
+    # Slow components moved to the fast side by the error estimate
+    demoted: List[str] = field(default_factory=list)
+    partitions: int = 0
+    
+    # Solves per partition, and unknowns summed over all solves. Micro 
+    # steps without a fast solve had a latent fast partition
+    micro_steps: int = 0
+    fast_solves: int = 0
+    slow_solves: int = 0
+    work: int = 0
+    
+    @property
+    def single_rate_work(self):
+        # Whole system at every micro step
+        return self.num_unknowns*self.micro_steps
+    
+    @property
+    def solves(self):
+        return self.fast_solves + self.slow_solves
+    
+    def __str__(self):
+        return (f"Multi-rate integration (ratio {self.ratio}, "
+                f"{self.partitions} partition(s))\n"
+                f"\t{'fast':6s}{self.fast_unknowns:8d} unknowns"
+                f"{self.fast_solves:10d} solves\n"
+                f"\t{'slow':6s}{self.slow_unknowns:8d} unknowns"
+                f"{self.slow_solves:10d} solves\n"
+                f"\tsolves {self.solves} vs {self.micro_steps}, "
+                f"unknown solves {self.work} vs {self.single_rate_work} "
+                f"single rate\n"
+                f"\tslow components {self.slow_components}, demoted "
+                f"{self.demoted}")
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 17:34:02 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built in classes
+from dataclasses import dataclass
+
+# -----------------------------------------------------------------------------
+# Define class
+# -----------------------------------------------------------------------------
+
+@dataclass
+class OrderingReport:
+    method: str
+    num_unknowns: int
+    nnz: int
+    
+    # Natural (insertion order) layout
+    bandwidth_before: int
+    envelope_before: int
+    lu_nnz_before: int
+    
+    # Reordered layout used by the solver
+    bandwidth_after: int
+    envelope_after: int
+    lu_nnz_after: int
+    
+    @property
+    def fill_before(self):
+        # Nonzeros created by the factorization
+        return self.lu_nnz_before - self.nnz
+    
+    @property
+    def fill_after(self):
+        return self.lu_nnz_after - self.nnz
+    
+    def __str__(self):
+        return (f"Unknown ordering '{self.method}' "
+                f"({self.num_unknowns} unknowns, nnz(A) = {self.nnz})\n"
+                f"\t{'':10s}{'before':>12s}{'after':>12s}\n"
+                f"\t{'bandwidth':10s}{self.bandwidth_before:12d}"
+                f"{self.bandwidth_after:12d}\n"
+                f"\t{'envelope':10s}{self.envelope_before:12d}"
+                f"{self.envelope_after:12d}\n"
+                f"\t{'nnz(L+U)':10s}{self.lu_nnz_before:12d}"
+                f"{self.lu_nnz_after:12d}\n"
+                f"\t{'fill-in':10s}{self.fill_before:12d}"
+                f"{self.fill_after:12d}")
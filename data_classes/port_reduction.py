@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 11:10:33 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built in classes
+from dataclasses import dataclass
+from typing import Any
+import numpy as np
+
+# -----------------------------------------------------------------------------
+# Define class
+# -----------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class PortReduction:
+    """
+    Schur complement of a subcircuit onto its ports for one (dt, scheme).
+    With A = [[A_pp, A_pi], [A_ip, A_ii]] over ports then internal nodes
+    the port admittance is A_pp - A_pi Z, Z = inv(A_ii) A_ip.
+    """
+    # Port admittance, k by k
+    admittance: np.ndarray
+
+    # Z = inv(A_ii) A_ip, m by k - history currents reach the ports through
+    # Z^T, internal voltages are inv(A_ii) b_i - Z v_p
+    coupling: np.ndarray
+
+    # Factorization of A_ii and the solver owning it
+    factor: Any
+    solver: Any
+
+    # Conductance of every port pair branch
+    pair_g: np.ndarray
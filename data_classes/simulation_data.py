@@ -32,4 +32,14 @@ class SimulationData:
     # Results
     node_v: Optional[np.ndarray] = None
     branch_v: Optional[np.ndarray] = None
-    branch_i: Optional[np.ndarray] = None
\ No newline at end of file
+    branch_i: Optional[np.ndarray] = None
+    
+    # Linear solver statistics per step (iterative backends)
+    solver_iterations: Optional[np.ndarray] = None
+    solver_residual: Optional[np.ndarray] = None
+    
+    # Adaptive stepping - rejected attempts before each accepted step
+    rejected_steps: Optional[np.ndarray] = None
+    
+    # Order of the integration scheme on each step (variable order BDF)
+    integration_order: Optional[np.ndarray] = None
\ No newline at end of file
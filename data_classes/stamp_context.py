@@ -25,4 +25,5 @@ class StampContext:
     dt: Optional[float] = None
     default_dt: bool = True
     discretization: DiscretizationType = DiscretizationType.BACKWARD_EULER
-    voltage_source_index: Optional[int] = None
\ No newline at end of file
+    voltage_source_index: Optional[int] = None
+    bdf_order: int = 1
\ No newline at end of file
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 08:12:41 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built in classes
+from dataclasses import dataclass
+import hashlib
+from types import MappingProxyType
+from typing import Any, Mapping, Tuple
+import numpy as np
+
+# Custom enums
+from enums.component_type import ComponentType
+
+# -----------------------------------------------------------------------------
+# Define class
+# -----------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class TopologyPlan:
+    """
+    Immutable snapshot of a compiled network topology. Built once by
+    Network.compile() and reused by every solve until the network topology
+    version changes.
+    """
+    # Topology version the plan was compiled against
+    version: int
+    ground_node: Any
+
+    # Node information
+    node_list: Tuple[Any, ...]
+    node_indices: Mapping[Any, int]
+
+    # Branch information (graph edge order)
+    branch_list: Tuple[tuple, ...]
+    branch_n1: np.ndarray
+    branch_n2: np.ndarray
+
+    # Ideal voltage sources (MNA extra unknowns)
+    v_source_list: Tuple[tuple, ...]
+    v_source_branch: np.ndarray
+
+    # Lookups
+    components_by_name: Mapping[str, Any]
+    type_masks: Mapping[ComponentType, np.ndarray]
+
+    # Unknown vector layout - row of each node (-1 for the eliminated ground
+    # and fixed potentials)
+    # and of each voltage source current
+    node_unknown: np.ndarray
+    vs_unknown: np.ndarray
+
+    # Voltage sources with internal resistance converted to Norton
+    # equivalents - stamped as conductances, no extra unknowns
+    norton_branch: np.ndarray | None = None
+
+    # Ideal voltage sources with one terminal on an island reference - the
+    # other terminal is a known potential fixed_sign * V, neither it nor the
+    # source current is an unknown
+    fixed_branch: np.ndarray | None = None
+    fixed_node: np.ndarray | None = None
+    fixed_sign: np.ndarray | None = None
+
+    # Fill reducing ordering applied to the unknowns - unknown_perm[k] is the
+    # natural (node list, then sources) unknown placed at row k
+    ordering: str = 'none'
+    unknown_perm: np.ndarray | None = None
+
+    # Galvanically isolated islands - each has its own eliminated reference
+    # node and a contiguous block [start, stop) of unknowns, island 0 holds
+    # ground_node
+    island_grounds: Tuple[Any, ...] = ()
+    island_slices: Tuple[Tuple[int, int], ...] = ()
+    branch_island: np.ndarray | None = None
+
+    # Series / parallel reduction of the conductance branches - eliminated
+    # nodes are not unknowns, their voltages are rebuilt after each solve
+    reduction: Any = None
+
+    # (Norton, ideal) per voltage source in branch order - the stamping of
+    # a source is fixed at compile, the plan is stale once either moves
+    source_modes: Tuple[Tuple[bool, bool], ...] = ()
+
+    @property
+    def num_islands(self):
+        return len(self.island_slices)
+
+    @property
+    def num_nodes(self):
+        return len(self.node_list)
+
+    @property
+    def num_v_sources(self):
+        return len(self.v_source_list)
+
+    @property
+    def num_branches(self):
+        return len(self.branch_list)
+
+    @property
+    def is_symmetric(self):
+        # Only two terminal conductance stamps remain once every voltage
+        # source is a Norton equivalent or a fixed potential. Companion
+        # conductances are positive and every island has a reference, so A
+        # is then symmetric positive definite.
+        return self.num_v_sources == 0
+
+    @property
+    def num_unknowns(self):
+        return int(np.count_nonzero(self.node_unknown >= 0) + 
+                   len(self.vs_unknown))
+
+    def fingerprint(self):
+        """
+        Structural hash of the topology - component types and terminal
+        unknowns in plan order. Component values and names do not enter, so
+        networks built the same way share tuning data.
+        """
+        
+        ctypes = [c.component.ctype.name for _, _, c in self.branch_list]
+        rows = zip(ctypes,
+                   self.node_unknown[self.branch_n1].tolist(),
+                   self.node_unknown[self.branch_n2].tolist())
+        key = f'{self.num_unknowns}|' + ';'.join(f'{t},{a},{b}' 
+                                                for t, a, b in rows)
+        
+        return hashlib.sha1(key.encode()).hexdigest()
+
+    @staticmethod
+    def freeze_array(values, dtype=np.int64):
+        # Read only copy so cached plans cannot be edited in place
+        arr = np.array(values, dtype=dtype)
+        arr.setflags(write=False)
+        return arr
+
+    @staticmethod
+    def freeze_mapping(values: dict):
+        return MappingProxyType(dict(values))
@@ -23,4 +23,5 @@ class ComponentType(Enum):
     SWITCH = 'switch'
     NODE = 'node'
     CAPACITOR='capacitor'
-    INDUCTOR='inductor'
\ No newline at end of file
+    INDUCTOR='inductor'
+    SUBCIRCUIT='subcircuit'
@@ -18,4 +18,7 @@ from enum import Enum
 
 class DiscretizationType(Enum):
     BACKWARD_EULER = 'Backward Euler'
-    BDF2 = 'Backward Difference Formula 2'
\ No newline at end of file
+    BDF2 = 'Backward Difference Formula 2'
+    TRAPEZOIDAL = 'Trapezoidal'
+    TR_BDF2 = 'Trapezoidal / Backward Difference Formula 2'
+    BDF_VARIABLE = 'Variable order Backward Difference Formula'
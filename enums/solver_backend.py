@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 14:31:07 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built in
+from enum import Enum
+
+# -----------------------------------------------------------------------------
+# Define class
+# -----------------------------------------------------------------------------
+
+class SolverBackend(Enum):
+    AUTO = ('Dense below the sparse threshold, sparse above - Cholesky for '
+            'symmetric networks, LU otherwise')
+    DENSE_LU = 'LAPACK LU'
+    CHOLESKY = 'LAPACK Cholesky'
+    SPARSE_CHOLESKY = 'CHOLMOD (scikit-sparse) or symmetric mode SuperLU'
+    SUPERLU = 'SciPy SuperLU'
+    UMFPACK = 'UMFPACK (scikit-umfpack)'
+    ITERATIVE = 'Preconditioned Krylov'
+    DOMAIN_DECOMPOSITION = 'Subdomain LU with interface Schur complement'
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 13:25:40 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Custom modules
+from networks.network import Network
+from components.resistor import Resistor
+from components.voltage_source import VoltageSource
+from components.capacitor import Capacitor
+from components.switch import Switch
+from config_classes.numeric_checks import MathChecks
+from data_classes.component_data import ComponentData, IdealComponentData, DiscretizationData
+from enums.calculation_mode import CalculationMode
+from enums.component_type import ComponentType
+from enums.switch_condition import SwitchCondition
+from enums.discretization_type import DiscretizationType
+
+# -----------------------------------------------------------------------------
+# Make simple network
+# -----------------------------------------------------------------------------
+
+def build_switched_ladder_network(sections=5,
+                                  num_switches=2,
+                                  capacitance=None,
+                                  numerics: MathChecks | None = None,
+                                  discretization=
+                                  DiscretizationType.BACKWARD_EULER):
+    """
+    Resistor ladder driven by V1 (n0 -> n1). Section i has a series resistor
+    Rs<i> (n<i> -> n<i+1>) and a shunt resistor Rp<i> (n<i+1> -> n0), with an
+    optional shunt capacitor C<i>. Switch S<j> bypasses series resistor
+    Rs<j+1>, all switches start open.
+    """
+
+    # Generate network
+    ladder_net = Network(node_reporting=False,
+                         branch_reporting=False,
+                         numerics=numerics,
+                         discretization=discretization)
+
+    # Add components
+    ladder_net.add_component('n0', 'n1', VoltageSource(ComponentData(
+        name='V1',
+        node1='n0',
+        node2='n1',
+        resistance=None,
+        voltage=0,
+        current=0,
+        mode=CalculationMode.CURRENT,
+        scond=SwitchCondition.CLOSED,
+        ctype=ComponentType.VOLTAGE_SOURCE,
+        ideal_params=IdealComponentData(ideal_voltage=12,
+                                        int_resistance=0.5))))
+
+    for i in range(1, sections + 1):
+
+        n_in, n_out = f'n{i}', f'n{i+1}'
+
+        ladder_net.add_component(n_in, n_out, Resistor(ComponentData(
+            name=f'Rs{i}',
+            node1=n_in,
+            node2=n_out,
+            resistance=1.0 + 0.1*i,
+            voltage=0,
+            current=0,
+            mode=CalculationMode.VOLTAGE,
+            ctype=ComponentType.RESISTOR)))
+
+        ladder_net.add_component(n_out, 'n0', Resistor(ComponentData(
+            name=f'Rp{i}',
+            node1=n_out,
+            node2='n0',
+            resistance=10.0 + i,
+            voltage=0,
+            current=0,
+            mode=CalculationMode.VOLTAGE,
+            ctype=ComponentType.RESISTOR)))
+
+        if capacitance is not None:
+            ladder_net.add_component(n_out, 'n0', Capacitor(ComponentData(
+                name=f'C{i}',
+                node1=n_out,
+                node2='n0',
+                resistance=None,
+                voltage=0,
+                current=0,
+                capacitance=capacitance,
+                discrete_data=DiscretizationData())))
+
+    for j in range(1, min(num_switches, sections) + 1):
+
+        n_in, n_out = f'n{j}', f'n{j+1}'
+
+        ladder_net.add_component(n_in, n_out, Switch(ComponentData(
+            name=f'S{j}',
+            node1=n_in,
+            node2=n_out,
+            voltage=0,
+            current=0,
+            mode=CalculationMode.CURRENT,
+            scond=SwitchCondition.OPEN,
+            ctype=ComponentType.SWITCH)))
+
+    return ladder_net
+
+
+if __name__ == '__main__':
+    ladder_net = build_switched_ladder_network()
+    ladder_net.solve()
@@ -0,0 +1,340 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 09:05:17 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built-in
+import numpy as np
+from scipy.sparse import csr_matrix
+
+# Custom modules
+from enums.component_type import ComponentType
+from enums.switch_condition import SwitchCondition
+from data_classes.stamp_context import StampContext
+from data_classes.topology_plan import TopologyPlan
+from config_classes.numeric_checks import MathChecks
+
+# -----------------------------------------------------------------------------
+# Define class
+# -----------------------------------------------------------------------------
+
+class AssemblyEngine:
+    """
+    Vectorized MNA assembly. The (row, col, sign) triplets of every component
+    class are precomputed once from a TopologyPlan; each assembly then only
+    gathers one conductance vector per class and scatters it with a few NumPy
+    operations. The ground node is not an unknown - triplets on it are
+    dropped - so A is (n-1+m) by (n-1+m), m counting the ideal voltage
+    sources only. Sources with internal resistance are stamped as Norton
+    conductances and current sources only reach b. Nodes fixed by a grounded
+    ideal source are not unknowns either, their couplings move to b. With a
+    topology reduction on the plan the conductance triplets belong to the
+    equivalent edges of the reduced network.
+    """
+
+    # Component classes stamped as two terminal conductances
+    CONDUCTANCE_TYPES = (ComponentType.RESISTOR,
+                         ComponentType.SWITCH,
+                         ComponentType.CAPACITOR,
+                         ComponentType.INDUCTOR,
+                         ComponentType.SUBCIRCUIT)
+
+    def __init__(self, plan: TopologyPlan, numerics: MathChecks,
+                 sparse: bool | None = None):
+
+        self.plan = plan
+        self.num_nodes = plan.num_nodes
+        self.num_v_sources = plan.num_v_sources
+        self.size = plan.num_unknowns
+
+        # Solver backend decides the storage, else the size threshold
+        if sparse is None:
+            sparse = self.size >= numerics.sparse_threshold
+        self.sparse = sparse
+
+        # Conductance components, grouped per class, Norton equivalents of
+        # voltage sources after the passive classes
+        groups = self.conductance_branches(plan.type_masks,
+                                           plan.norton_branch)
+        self.groups = [(ctype, [plan.branch_list[k][2] for k in idx])
+                       for ctype, idx in groups]
+        branch_idx = np.concatenate([idx for _, idx in groups])
+        self._num_branch_g = len(branch_idx)
+
+        # Slots of the switch conductances in G, merged into equivalent
+        # edges (no slots) once the topology is reduced
+        ends = np.cumsum([len(idx) for _, idx in groups])
+        s = self.CONDUCTANCE_TYPES.index(ComponentType.SWITCH)
+        self.switch_g = (np.arange(ends[s] - len(groups[s][1]), ends[s])
+                         if plan.reduction is None
+                         else np.zeros(0, dtype=np.int64))
+
+        # Series / parallel reduction - equivalent edges replace the
+        # branches in A
+        self.reduction = plan.reduction
+        self._trace = None
+        if self.reduction is None:
+            e_n1 = plan.branch_n1[branch_idx]
+            e_n2 = plan.branch_n2[branch_idx]
+        else:
+            e_n1, e_n2 = self.reduction.surviving_nodes()
+
+        # Terminal unknowns of every conductance (-1 on ground)
+        self.g_n1 = plan.node_unknown[e_n1]
+        self.g_n2 = plan.node_unknown[e_n2]
+        self.num_g = len(e_n1)
+        self._g_nodes = (e_n1, e_n2)
+
+        # Current sources - injections into b, in J after the conductances
+        i_idx = np.flatnonzero(plan.type_masks[ComponentType.CURRENT_SOURCE])
+        self.i_sources = [plan.branch_list[k][2] for k in i_idx]
+        self.is_n1 = plan.node_unknown[plan.branch_n1[i_idx]]
+        self.is_n2 = plan.node_unknown[plan.branch_n2[i_idx]]
+
+        # Ideal voltage sources
+        self.v_sources = [vs for _, _, vs in plan.v_source_list]
+        self.vs_n1 = plan.node_unknown[plan.branch_n1[plan.v_source_branch]]
+        self.vs_n2 = plan.node_unknown[plan.branch_n2[plan.v_source_branch]]
+        self.vs_row = np.asarray(plan.vs_unknown)
+
+        # Grounded ideal sources - known potentials, v_rise after the MNA
+        # sources
+        fixed = (np.zeros(0, dtype=np.int64) if plan.fixed_branch is None
+                 else np.asarray(plan.fixed_branch, dtype=np.int64))
+        self.fixed_sources = [plan.branch_list[k][2] for k in fixed]
+        self.fixed_sign = (np.zeros(0) if plan.fixed_sign is None
+                           else np.asarray(plan.fixed_sign, dtype=float))
+
+        self._build_triplets()
+        self._build_fixed_couplings()
+
+    @classmethod
+    def conductance_branches(cls, type_masks, norton_branch=None):
+        """
+        Objective: Branch indices stamped as two terminal conductances, one
+        (ctype, indices) pair per class in assembly order.
+        """
+
+        groups = [(ctype, np.flatnonzero(type_masks[ctype]))
+                  for ctype in cls.CONDUCTANCE_TYPES]
+        norton = (np.zeros(0, dtype=np.int64) if norton_branch is None
+                  else np.asarray(norton_branch, dtype=np.int64))
+        groups.append((ComponentType.VOLTAGE_SOURCE, norton))
+
+        return groups
+
+    def assemble(self, ctx: StampContext):
+        """
+        Objective: Build A, b for the current component state
+
+        Parameters
+        ----------
+        ctx : StampContext, custom data class
+            Timestep and discretization information.
+
+        Returns
+        -------
+        A : Float, Array (dense ndarray or CSR matrix)
+            Coefficient array characterizing the network.
+        b : Float, Vector
+            Source vector characterizing the network.
+        """
+
+        G, J, r_int, v_rise = self.gather(ctx)
+        values = self.triplet_values(G, r_int)
+
+        return self.build_A(values), self.build_b(G, J, v_rise)
+
+    def build_A(self, values):
+
+        if self.sparse:
+            # Pattern locked CSR - only the data array is rewritten
+            self._csr.data[:] = np.bincount(self._csr_pos, weights=values,
+                                            minlength=self._csr.nnz)
+            return self._csr
+
+        A = np.bincount(self.rows*self.size + self.cols, weights=values,
+                        minlength=self.size*self.size)
+        return A.reshape(self.size, self.size)
+
+    def build_b(self, G, J, v_rise):
+
+        # History and source currents leave n1, enter n2. Ground entries are
+        # shifted to a trailing slot that is dropped.
+        b = (np.bincount(self._b_n2, weights=J, minlength=self.size + 1) -
+             np.bincount(self._b_n1, weights=J, minlength=self.size + 1))
+        b = b[:self.size]
+
+        # Voltage source rows
+        m = self.num_v_sources
+        b[self.vs_row] = -v_rise[:m]
+
+        # Known potentials times the couplings dropped from A
+        if self.fixed_sources:
+            v_fixed = self.fixed_sign * v_rise[m:]
+            b += np.bincount(self._fix_rows,
+                             weights=G[self._fix_g]*v_fixed[self._fix_f],
+                             minlength=self.size)
+            b[self.vs_row] += (
+                np.where(self._fix_vs2 >= 0, v_fixed[self._fix_vs2], 0.0) -
+                np.where(self._fix_vs1 >= 0, v_fixed[self._fix_vs1], 0.0))
+
+        return b
+
+    def fixed_potentials(self):
+        # Voltage of every node fixed by a grounded ideal source
+        return self.fixed_sign * np.array(
+            [vs.component.ideal_params.ideal_voltage
+             for vs in self.fixed_sources], dtype=float)
+
+    def gather(self, ctx: StampContext):
+        """
+        Objective: Collect the companion model of every component, one
+        vector per quantity, in triplet order. J holds the conductance
+        history currents followed by the current source currents.
+        """
+
+        num_g = self._num_branch_g
+        G = np.empty(num_g, dtype=float)
+        J = np.empty(num_g + len(self.i_sources), dtype=float)
+
+        k = 0
+        for _, comps in self.groups:
+            for c_obj in comps:
+                G[k], J[k] = c_obj.companion(ctx)
+                k += 1
+
+        for c_obj in self.i_sources:
+            _, J[k] = c_obj.companion(ctx)
+            k += 1
+
+        # Equivalent edges of the reduced topology
+        if self.reduction is not None:
+            G, J_g, self._trace = self.reduction.apply(G, J[:num_g])
+            J = np.concatenate((J_g, J[num_g:]))
+
+        r_int = np.empty(self.num_v_sources, dtype=float)
+        v_rise = np.empty(self.num_v_sources + len(self.fixed_sources),
+                          dtype=float)
+
+        for k, vs in enumerate(self.v_sources):
+            params = vs.component.ideal_params
+            if params is None:
+                raise ValueError(
+                    'Error: Specify voltage source ideal parameters')
+            r_int[k] = max(params.int_resistance or 0.0, 0.0)
+            v_rise[k] = params.ideal_voltage
+
+        for k, vs in enumerate(self.fixed_sources, start=self.num_v_sources):
+            params = vs.component.ideal_params
+            if params.int_resistance > 0:
+                raise ValueError(
+                    f'Error: Voltage source {vs.component.name} fixes a node '
+                    f'potential and must stay ideal, recompile for internal '
+                    f'resistance: {params.int_resistance}')
+            v_rise[k] = params.ideal_voltage
+
+        return G, J, r_int, v_rise
+
+    def reconstruct(self, node_v):
+        # Eliminated node voltages of the last gather, in place
+        if self.reduction is not None:
+            self.reduction.reconstruct(node_v, self._trace)
+
+        return node_v
+
+    def switch_states(self):
+        # Closed / open state of every switch packed into an integer
+        # bitmask, bit k set when the k-th switch (plan order) is closed
+        switches = self.groups[
+            self.CONDUCTANCE_TYPES.index(ComponentType.SWITCH)][1]
+        closed = np.array([c.component.scond == SwitchCondition.CLOSED
+                           for c in switches], dtype=bool)
+
+        return int.from_bytes(np.packbits(closed, bitorder='little'),
+                              'little')
+
+    def triplet_values(self, G, r_int):
+
+        values = np.concatenate((G, G, -G, -G,
+                                 self._vs_values,
+                                 -r_int))
+
+        return values[self._keep]
+
+    def _build_triplets(self):
+
+        n1, n2 = self.g_n1, self.g_n2
+        vs_n1, vs_n2, vs_row = self.vs_n1, self.vs_n2, self.vs_row
+
+        # Conductances, voltage source incidence, internal resistance
+        rows = np.concatenate((n1, n2, n1, n2,
+                               vs_n1, vs_row, vs_n2, vs_row,
+                               vs_row))
+        cols = np.concatenate((n1, n2, n2, n1,
+                               vs_row, vs_n1, vs_row, vs_n2,
+                               vs_row))
+
+        m = self.num_v_sources
+        self._vs_values = np.concatenate((np.ones(2*m), -np.ones(2*m)))
+
+        # Ground is eliminated - drop every triplet on its row / column
+        keep = (rows >= 0) & (cols >= 0)
+
+        # b scatter indices, ground mapped to the dropped trailing slot
+        b_n1 = np.concatenate((n1, self.is_n1))
+        b_n2 = np.concatenate((n2, self.is_n2))
+        self._b_n1 = np.where(b_n1 >= 0, b_n1, self.size)
+        self._b_n2 = np.where(b_n2 >= 0, b_n2, self.size)
+
+        self._keep = keep
+        self.rows = rows[keep].astype(np.int64)
+        self.cols = cols[keep].astype(np.int64)
+
+        if self.sparse:
+            self._build_csr_pattern()
+
+    def _build_fixed_couplings(self):
+
+        # Fixed potential (index into fixed_sources) of every node, -1 else
+        plan = self.plan
+        fixed_of = np.full(self.num_nodes, -1, dtype=np.int64)
+        if self.fixed_sources:
+            fixed_of[np.asarray(plan.fixed_node)] = np.arange(
+                len(self.fixed_sources))
+
+        # Conductance rows coupled to a known potential, G*v_fixed moves to
+        # the right hand side of the other terminal
+        f1 = fixed_of[self._g_nodes[0]]
+        f2 = fixed_of[self._g_nodes[1]]
+        side1 = (f2 >= 0) & (self.g_n1 >= 0)
+        side2 = (f1 >= 0) & (self.g_n2 >= 0)
+
+        self._fix_rows = np.concatenate((self.g_n1[side1], self.g_n2[side2]))
+        self._fix_g = np.concatenate((np.flatnonzero(side1),
+                                      np.flatnonzero(side2)))
+        self._fix_f = np.concatenate((f2[side1], f1[side2]))
+
+        # MNA source rows with a terminal on a known potential
+        self._fix_vs1 = fixed_of[plan.branch_n1[plan.v_source_branch]]
+        self._fix_vs2 = fixed_of[plan.branch_n2[plan.v_source_branch]]
+
+    def _build_csr_pattern(self):
+
+        # Unique (row, col) pairs in row major order define the CSR pattern,
+        # _csr_pos maps every triplet onto its slot in the data array
+        flat = self.rows*self.size + self.cols
+        pattern, self._csr_pos = np.unique(flat, return_inverse=True)
+
+        indices = pattern % self.size
+        indptr = np.searchsorted(pattern // self.size, 
+                                 np.arange(self.size + 1))
+
+        self._csr = csr_matrix((np.zeros(len(pattern)), indices, indptr),
+                               shape=(self.size, self.size))
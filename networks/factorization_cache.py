@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 10:20:33 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built-in
+from collections import OrderedDict
+import numpy as np
+
+# -----------------------------------------------------------------------------
+# Define class
+# -----------------------------------------------------------------------------
+
+class FactorizationCache:
+    """
+    LRU cache of LU factorizations of the MNA matrix. Entries are looked up
+    by (dt, discretization phase, switch state bitmask) and only returned when
+    the stored A matrix values match the requested ones exactly, so any
+    component value change forces a refactorization. Networks cycling through
+    a few switch configurations (PWM) only pay a back-substitution once each
+    configuration has been factored.
+    """
+
+    def __init__(self, capacity: int = 2):
+
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, values: np.ndarray):
+
+        entry = self._entries.get(key)
+
+        if entry is None or not np.array_equal(entry[0], values):
+            self.misses += 1
+            return None
+
+        # Most recently used entry moves to the back
+        self._entries.move_to_end(key)
+        self.hits += 1
+
+        return entry[1]
+
+    def put(self, key, values: np.ndarray, factor):
+
+        self._entries[key] = (values.copy(), factor)
+        self._entries.move_to_end(key)
+
+        # Evict least recently used entries
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
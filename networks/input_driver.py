@@ -10,8 +10,9 @@ Created on Wed Feb 18 07:30:40 2026
 # -----------------------------------------------------------------------------
 
 # Built in classes
-from typing import Callable, Dict, Optional, Union
+from typing import Callable, Dict, Iterable, Optional, Union
 import numpy as np
+from enums.component_type import ComponentType
 from enums.switch_condition import SwitchCondition
 
 # -----------------------------------------------------------------------------
@@ -20,25 +21,116 @@ from enums.switch_condition import SwitchCondition
 
 tfx = Callable[[float], float]
 bfx = Callable[[float], bool]
+efx = Callable[[float, float], Iterable[float]]
 
 class InputDriver:
     
-    def __init__(self, sources=None, states=None):
+    def __init__(self, sources=None, states=None, breakpoints=None,
+                 locate_events=False):
                 
         self.sources: Dict[str, Union[tfx, np.ndarray]] = sources or {}
         self.states: Dict[str, Union[bfx, np.ndarray]] = states or {}
+        
+        # Switch edge times per state - an array, or f(t0, t1) giving the
+        # edges in (t0, t1]. Callable states without breakpoints are root
+        # found (next_event) with locate_events, else sampled at the step
+        self.breakpoints: Dict[str, Union[efx, np.ndarray]] = \
+            breakpoints or {}
+        self.locate_events = locate_events
                 
-    def apply(self, net, t: float, k: Optional[int] = None):
+    def apply(self, net, t: float, k: Optional[int] = None,
+              state_time: Optional[float] = None):
         
         for name, src in self.sources.items():
             comp = net.components_by_name[name].component
-            comp.ideal_params.ideal_voltage = float(self._eval(src,t,k))
+            value = float(self._eval(src,t,k))
+            if comp.ctype == ComponentType.CURRENT_SOURCE:
+                comp.ideal_params.ideal_current = value
+            else:
+                comp.ideal_params.ideal_voltage = value
             
+        # States held at state_time (just before an event the step lands on)
+        t_state = t if state_time is None else state_time
         for name, state in self.states.items():
             comp = net.components_by_name[name].component
-            comp_state = bool(self._eval(state, t, k))
+            comp_state = bool(self._eval(state, t_state, k))
             comp.scond = SwitchCondition.CLOSED if comp_state else SwitchCondition.OPEN
     
+    def has_events(self):
+
+        # Switch edges that can be located between the grid times
+        return bool(self.breakpoints) or bool(self._searched_states())
+
+    def next_event(self, t0: float, t1: float, tol: float, samples: int = 4):
+        """
+        Objective: First switch edge in (t0, t1]. Declared breakpoints are
+        taken as given; with locate_events, callable states without 
+        breakpoints are sampled at `samples` interior points and the first 
+        change is bisected down to tol. Other states change on the grid 
+        only.
+
+        Parameters
+        ----------
+        t0, t1 : Float
+            Step interval.
+        tol : Float
+            Bisection tolerance on the edge time, relative beyond t = 1.
+        samples : Integer, optional
+            Interior sample points per step - pulses shorter than the
+            spacing can be missed.
+
+        Returns
+        -------
+        None or (t_event, t_left)
+            Edge time and a time just before it with the states of the
+            step up to the edge. None without an edge.
+        """
+
+        events = []
+        for name, points in self.breakpoints.items():
+            times = np.asarray(points(t0, t1) if callable(points) else points,
+                               dtype=float)
+            times = times[(times > t0) & (times <= t1)]
+            if len(times):
+                t_event = float(times.min())
+                events.append((t_event, 0.5*(t0 + t_event)))
+
+        # Edge times resolved to the float spacing at large t
+        tol = tol*max(1.0, abs(t0), abs(t1))
+        grid = np.linspace(t0, t1, samples + 2)
+        for state in self._searched_states():
+            values = [bool(state(t)) for t in grid]
+            for a, b, before, after in zip(grid[:-1], grid[1:], values[:-1],
+                                           values[1:]):
+                if before == after:
+                    continue
+
+                # Bracket [a, b] around the edge, state(a) == before
+                a, b = float(a), float(b)
+                while b - a > tol:
+                    mid = 0.5*(a + b)
+                    if mid <= a or mid >= b:
+                        break
+                    if bool(state(mid)) == before:
+                        a = mid
+                    else:
+                        b = mid
+                events.append((b, a))
+                break
+
+        if not events:
+            return None
+
+        return min(events)
+    
+    def _searched_states(self):
+
+        # Callable states root found by next_event
+        if not self.locate_events:
+            return []
+        return [state for name, state in self.states.items()
+                if callable(state) and name not in self.breakpoints]
+
     @staticmethod
     def _eval(src: Union[tfx, bfx, np.ndarray], t: float, k: Optional[int]):
         
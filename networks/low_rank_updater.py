@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 13:02:11 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built-in
+import numpy as np
+
+# Custom modules
+from enums.circuit_resistance import CircuitResistance
+from networks.assembly_engine import AssemblyEngine
+
+# -----------------------------------------------------------------------------
+# Define class
+# -----------------------------------------------------------------------------
+
+class LowRankUpdater:
+    """
+    Sherman-Morrison-Woodbury corrections on top of a base factorization of
+    A. Every conductance that differs from the base is a rank one update
+    dG * u u^T with u = e_n1 - e_n2 (internal resistances of voltage sources
+    update their diagonal entry), so
+
+        A = A0 + U C U^T
+        x = y - Z (C^-1 + U^T Z)^-1 U^T y,  y = A0^-1 b,  Z = A0^-1 U
+
+    The base is always factored with every switch open. A closed switch is
+    then a rank one update of weight g_closed - g_open > 0, and the
+    capacitance entry 1/dG + u^T A0^-1 u adds two positive terms - no
+    cancellation however large dG is. Removing a closed switch from a base
+    would instead subtract two near equal resistances (1e-10 ohm), so
+    switch toggles update the open base rather than each other.
+
+    Columns of Z are cached per component until the base changes. Returns
+    None when the rank exceeds max_rank, the base or a non-switch weight is
+    badly scaled or the corrected solution fails a componentwise residual
+    check, the caller then refactors and sets a new base.
+    """
+
+    def __init__(self, engine: AssemblyEngine, solve, factor, max_rank: int,
+                 residual_rtol: float = 1e-10, refine_steps: int = 2,
+                 max_weight_ratio: float = 1e6):
+
+        self.engine = engine
+        self.solve_fn = solve
+        self.factor_fn = factor
+        self.max_rank = max_rank
+        self.residual_rtol = residual_rtol
+        self.refine_steps = refine_steps
+        self.max_weight_ratio = max_weight_ratio
+        self.num_updates = 0
+        self.reset()
+
+    def reset(self):
+
+        self.base_key = None
+        self._lu = None
+        self._A0 = None
+        self._A0_abs = None
+        self._A0_diag = None
+        self._well_scaled = False
+        self._G0 = None
+        self._r0 = None
+        self._Z = {}
+
+    def set_base(self, key, lu, A, G, r_int):
+
+        # Open every switch of the base, closed ones become updates
+        G0 = G.copy()
+        switch_g = self.engine.switch_g
+        g_open = 1.0 / CircuitResistance.OPEN.value
+        if np.any(G0[switch_g] > g_open):
+            G0[switch_g] = g_open
+            A = self.engine.build_A(self.engine.triplet_values(G0, r_int))
+            lu = self.factor_fn(A)
+
+        self.base_key = key
+        self._lu = lu
+        self._A0 = A.copy()
+        self._A0_abs = abs(A)
+        self._A0_diag = np.abs(A.diagonal())
+        self._G0 = G0
+        self._r0 = r_int.copy()
+        self._Z = {}
+
+        # Widely spread component values leave digits to cancellation in
+        # the correction, refactor instead while the base is badly scaled
+        diag = self._A0_diag[self._A0_diag > 0.0]
+        self._well_scaled = bool(
+            len(diag) and diag.max() <= self.max_weight_ratio*diag.min())
+
+    def solve(self, key, G, r_int, b):
+        """
+        Objective: Solve A x = b for A differing from the base by a few
+        component values.
+
+        Returns
+        -------
+        x : Float, Vector or None
+            Solution, or None if a refactorization is required.
+        """
+
+        if (self._lu is None or key != self.base_key
+                or not self._well_scaled):
+            return None
+
+        g_idx = np.flatnonzero(G != self._G0)
+        r_idx = np.flatnonzero(r_int != self._r0)
+        rank = len(g_idx) + len(r_idx)
+
+        if rank > self.max_rank:
+            return None
+
+        y = self.solve_fn(self._lu, b)
+        if rank == 0:
+            return y
+
+        # Update vectors and their weights (conductance / resistance deltas)
+        U = np.zeros((len(b), rank), dtype=float)
+        cols = [('g', k) for k in g_idx] + [('r', k) for k in r_idx]
+
+        for j, (kind, k) in enumerate(cols):
+            if kind == 'g':
+                n1, n2 = self.engine.g_n1[k], self.engine.g_n2[k]
+                if n1 >= 0:
+                    U[n1, j] = 1.0
+                if n2 >= 0:
+                    U[n2, j] = -1.0
+            else:
+                U[self.engine.vs_row[k], j] = 1.0
+
+        # A0 stamps -r_int on the source row diagonal
+        weights = np.concatenate((G[g_idx] - self._G0[g_idx],
+                                  -(r_int[r_idx] - self._r0[r_idx])))
+
+        # Compare each weight with the smallest base diagonal it touches,
+        # closing a switch on the open base is always well conditioned
+        touched = np.where(U != 0.0, self._A0_diag[:, None], np.inf).min(axis=0)
+        switch = np.isin(g_idx, self.engine.switch_g)
+        checked = np.concatenate((~switch, np.ones(len(r_idx), dtype=bool)))
+        if np.any(np.abs(weights[checked]) > 
+                  self.max_weight_ratio*touched[checked]):
+            return None
+
+        Z = self._z_columns(cols, U)
+
+        # Capacitance matrix C^-1 + U^T Z
+        S = np.diag(1.0 / weights) + U.T @ Z
+        try:
+            x = y - Z @ np.linalg.solve(S, U.T @ y)
+        except np.linalg.LinAlgError:
+            return None
+
+        # Iterative refinement against cancellation in the correction
+        for _ in range(self.refine_steps):
+            residual = b - self._A0 @ x - U @ (weights * (U.T @ x))
+            dy = self.solve_fn(self._lu, residual)
+            x = x + dy - Z @ np.linalg.solve(S, U.T @ dy)
+
+        # Componentwise residual check, rows carrying switch conductances
+        # would otherwise hide the error on the ordinary rows
+        residual = b - self._A0 @ x - U @ (weights * (U.T @ x))
+        scale = (self._A0_abs @ np.abs(x)
+                 + np.abs(U) @ (np.abs(weights) * (np.abs(U).T @ np.abs(x)))
+                 + np.abs(b))
+
+        if np.any(np.abs(residual) > self.residual_rtol*scale):
+            return None
+
+        self.num_updates += 1
+
+        return x
+
+    def _z_columns(self, cols, U):
+
+        # Solve only for update vectors not seen since the base was set
+        missing = [j for j, c in enumerate(cols) if c not in self._Z]
+
+        if missing:
+            Z_new = self.solve_fn(self._lu, U[:, missing])
+            Z_new = Z_new.reshape(U.shape[0], len(missing))
+            for i, j in enumerate(missing):
+                self._Z[cols[j]] = Z_new[:, i]
+
+        return np.column_stack([self._Z[c] for c in cols])
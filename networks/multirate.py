@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Tue Oct 20 09:14:52 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built-in
+import networkx as nx
+import numpy as np
+
+# Custom modules
+from data_classes.stamp_context import StampContext
+from enums.component_type import ComponentType
+from networks.step_control import SCHEME_ERROR, local_truncation_error
+
+# -----------------------------------------------------------------------------
+# Define functions
+# -----------------------------------------------------------------------------
+
+REACTIVE_TYPES = (ComponentType.CAPACITOR, ComponentType.INDUCTOR)
+
+def time_constants(plan, ctx: StampContext):
+    """
+    Objective: Local time constant of every reactive branch. Each node is
+    given the resistance of its non reactive branches in parallel (0 at
+    the island references and behind ideal sources), a capacitor sees the
+    resistances at both terminals in series (tau = C R), an inductor the
+    same loop (tau = L / R).
+
+    Returns
+    -------
+    tau : Float, Array
+        Time constant per branch of the plan, nan for non reactive ones.
+    """
+
+    g_node = np.zeros(plan.num_nodes)
+    for k, (_, _, c) in enumerate(plan.branch_list):
+        comp = c.component
+        if comp.ctype in REACTIVE_TYPES + (ComponentType.CURRENT_SOURCE,):
+            continue
+
+        params = comp.ideal_params
+        if (comp.ctype == ComponentType.VOLTAGE_SOURCE and
+            (params.int_resistance is None or params.int_resistance <= 0)):
+            g = np.inf
+        else:
+            g = c.companion(ctx)[0]
+
+        g_node[plan.branch_n1[k]] += g
+        g_node[plan.branch_n2[k]] += g
+
+    with np.errstate(divide='ignore'):
+        r_node = 1.0 / g_node
+    r_node[[plan.node_indices[g] for g in plan.island_grounds]] = 0.0
+
+    tau = np.full(len(plan.branch_list), np.nan)
+    r_loop = r_node[plan.branch_n1] + r_node[plan.branch_n2]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for k, (_, _, c) in enumerate(plan.branch_list):
+            comp = c.component
+            if comp.ctype == ComponentType.CAPACITOR:
+                tau[k] = comp.capacitance*r_loop[k]
+            elif comp.ctype == ComponentType.INDUCTOR:
+                tau[k] = comp.inductance/r_loop[k]
+
+    return tau
+
+# -----------------------------------------------------------------------------
+# Define classes
+# -----------------------------------------------------------------------------
+
+class MultiratePartition:
+    """
+    Split of the network into a fast and a slow partition. Slow candidates
+    are reactive branches; every other non resistive branch (sources,
+    switches, subcircuits, fast reactive branches) anchors its nodes in the
+    fast partition. Nodes reached from a slow branch through resistors
+    without crossing a fast node are slow, the rest are fast. Candidates
+    with a terminal on a fast node are moved to the fast partition until
+    the split is consistent, so the partitions only meet through resistors
+    (the interface) and the island references.
+    """
+
+    def __init__(self, plan, slow_candidates):
+
+        grounds = {plan.node_indices[g] for g in plan.island_grounds}
+        ctypes = [c.component.ctype for _, _, c in plan.branch_list]
+        n1 = np.asarray(plan.branch_n1)
+        n2 = np.asarray(plan.branch_n2)
+
+        slow_branch = set(int(k) for k in slow_candidates)
+        while True:
+            anchors = set()
+            for k, ctype in enumerate(ctypes):
+                if ctype != ComponentType.RESISTOR and k not in slow_branch:
+                    anchors.update((int(n1[k]), int(n2[k])))
+            anchors -= grounds
+
+            graph = nx.Graph()
+            graph.add_nodes_from(set(range(plan.num_nodes)) - grounds -
+                                 anchors)
+            graph.add_edges_from(
+                (int(n1[k]), int(n2[k])) for k, ctype in enumerate(ctypes)
+                if (ctype == ComponentType.RESISTOR or k in slow_branch) and
+                graph.has_node(int(n1[k])) and graph.has_node(int(n2[k])))
+
+            seeds = {int(n) for k in slow_branch for n in (n1[k], n2[k])}
+            slow_nodes = set()
+            for members in nx.connected_components(graph):
+                if members & seeds:
+                    slow_nodes |= members
+
+            # A slow branch on a fast node would couple the partitions
+            # through history - it joins the fast side
+            moved = {k for k in slow_branch
+                     if not ({int(n1[k]), int(n2[k])} - grounds) <=
+                     slow_nodes}
+            if not moved:
+                break
+            slow_branch -= moved
+
+        is_slow = np.zeros(plan.num_nodes, dtype=bool)
+        is_slow[list(slow_nodes)] = True
+        is_fast = ~is_slow
+        is_fast[list(grounds)] = False
+
+        # Branches per partition - the interface resistors are in both
+        touches_fast = is_fast[n1] | is_fast[n2]
+        touches_slow = is_slow[n1] | is_slow[n2]
+        interface = np.flatnonzero(touches_fast & touches_slow)
+
+        self.slow_branches = np.flatnonzero(touches_slow)
+        self.fast_branches = np.flatnonzero(touches_fast | ~touches_slow)
+        self.interface = interface
+        self.slow_nodes = np.flatnonzero(is_slow)
+        self.fast_nodes = np.flatnonzero(is_fast)
+        self.reactive = np.array(sorted(slow_branch), dtype=np.int64)
+
+        # Node, reference of its island - held by the other partition
+        ground_of = [plan.node_indices[plan.island_grounds[i]] for i in
+                     plan.branch_island[interface]]
+        self.fast_boundary = self._boundary(n1[interface], n2[interface],
+                                            is_slow, ground_of)
+        self.slow_boundary = self._boundary(n1[interface], n2[interface],
+                                            is_fast, ground_of)
+
+    @staticmethod
+    def _boundary(n1, n2, side, ground_of):
+
+        boundary = {}
+        for a, b, g in zip(n1.tolist(), n2.tolist(), ground_of):
+            node = a if side[a] else b
+            boundary.setdefault(node, g)
+
+        return sorted(boundary.items())
+
+
+class LocalErrorEstimate:
+    """
+    Local truncation error of the slow reactive states (capacitor voltage,
+    inductor current) over the macro points (local_truncation_error). The
+    tolerance is relative to the largest voltage / current seen in the
+    network - a state starting from rest would fail against its own peak.
+    """
+
+    def __init__(self, components, discretization, rtol):
+
+        self.components = components
+        self.order, self.constant = SCHEME_ERROR[discretization]
+        self.rtol = rtol
+        self.inductor = np.array([c.component.ctype ==
+                                  ComponentType.INDUCTOR
+                                  for c in components], dtype=bool)
+        self.history = []
+        self.times = [0.0]
+
+    def update(self, H, v_scale, i_scale):
+        """
+        Objective: Record the states after a macro step of length H.
+
+        Parameters
+        ----------
+        H : Float
+            Macro step.
+        v_scale, i_scale : Float
+            Peak node voltage and branch current of the network so far.
+
+        Returns
+        -------
+        Integer, Array
+            Positions (in components) whose error exceeds the tolerance.
+        """
+
+        x = np.array([c.component.current if ind else c.component.voltage
+                      for c, ind in zip(self.components, self.inductor)],
+                     dtype=float)
+        self.history = (self.history + [x])[-(self.order + 2):]
+        self.times = (self.times + [self.times[-1] + H])[-(self.order + 2):]
+
+        if len(self.history) < self.order + 2:
+            return np.zeros(0, dtype=np.int64)
+
+        error = local_truncation_error(self.times, self.history, self.order,
+                                       self.constant)
+        scale = np.where(self.inductor, i_scale, v_scale)
+
+        return np.flatnonzero(error > self.rtol*scale)
@@ -10,20 +10,53 @@ Created on Sat Sep 27 21:11:15 2025
 # -----------------------------------------------------------------------------
 
 # Built-in
+import copy
+import dataclasses
+import os
+from time import perf_counter
+from concurrent.futures import ThreadPoolExecutor
 import networkx as nx
 import numpy as np
-from scipy.sparse import lil_matrix, issparse
-from scipy.sparse.linalg import spsolve
+from scipy.sparse import issparse
+from scipy.sparse.linalg import LinearOperator, onenormest
 
 # Custom modules
+from components.voltage_source import VoltageSource
+from enums.calculation_mode import CalculationMode
 from enums.component_type import ComponentType
 from enums.discretization_type import DiscretizationType
+from data_classes.component_data import (BDF_HISTORY, ComponentData, 
+                                         IdealComponentData)
 from data_classes.node_data import NodeData
 from data_classes.branch_data import BranchData
 from data_classes.simulation_data import SimulationData
 from config_classes.numeric_checks import MathChecks
 from networks.input_driver import InputDriver
 from data_classes.stamp_context import StampContext
+from data_classes.topology_plan import TopologyPlan
+from networks.assembly_engine import AssemblyEngine
+from networks.factorization_cache import FactorizationCache
+from networks.low_rank_updater import LowRankUpdater
+from networks.island_system import IslandSystem
+from networks.topology_reduction import TopologyReduction
+from enums.solver_backend import SolverBackend
+from solvers.linear_solver import LinearSolver
+from solvers.solver_factory import build_solver
+from solvers.domain_decomposition_solver import DomainDecompositionSolver
+from solvers.autotuner import Autotuner, load_autotune, save_autotune
+from data_classes.autotune_result import AutotuneResult
+from data_classes.ordering_report import OrderingReport
+from data_classes.decomposition_report import DecompositionReport
+from data_classes.multirate_report import MultirateReport
+from networks.multirate import (MultiratePartition, LocalErrorEstimate,
+                                time_constants)
+from networks.step_control import (ERROR_CONSTANTS, SCHEME_ERROR, 
+                                   TR_BDF2_GAMMA, StepController, 
+                                   local_truncation_error)
+from networks.unknown_ordering import (structure_matrix, order_unknowns,
+                                       fill_statistics)
+from networks.structural_checks import (voltage_source_loops, cut_sets,
+                                        structure_edges)
 
 # -----------------------------------------------------------------------------
 # Define class
@@ -35,6 +68,7 @@ class Network:
                  branch_reporting=False,
                  numerics: MathChecks | None = None,
                  discretization=DiscretizationType.BACKWARD_EULER,
+                 solver: SolverBackend | LinearSolver | None = None,
                  verbose=False):
         
         # Setting arguments
@@ -51,20 +85,63 @@ class Network:
         self.node_indices = {} # name -> index node mapping
         self.node_list = [] # ordered list of nodes
         self.node_voltages = {}
+        self.node_v = None # node voltages in node_list order
         self.v_source_list = []
         self.num_nodes = 0
         self.num_v_sources = 0
         self.node_report = None
         self.branch_report = None
+        self.structure_warnings = []
+        self.last_condition = None
+        self.matrix_warnings = []
+        self._step_iterations = 0
+        self._step_residual = np.nan
+        
+        # Compiled topology - rebuilt only when topology_version moves on
+        self.topology_version = 0
+        self.plan = None
+        self.engine = None
+        
+        # LRU of LU factorizations of A per (dt, phase, switch states)
+        self.factor_cache = FactorizationCache(
+            capacity=self.numerics.factor_cache_size)
+        
+        # Linear solver backend - None follows numerics.solver_backend,
+        # resolved into a LinearSolver on compile
+        self.solver_choice = solver
+        self.solver = None
+        self.autotune_result = None
+        
+        # Isolated islands solved block by block (built on compile)
+        self.islands = []
+        self._executor = None
+        
+        # Rank-k corrections for component value changes (built on compile)
+        self.low_rank = None
+        
+        # Subcircuit instances by name, stamped through their port branches
+        self.subcircuits = {}
         
         # Discretization check - allows swapping between discretization schemes
         # first dt vs rest or after special spikes in data
         self.default_dt = True
         
+        # Stage scheme while a TR-BDF2 step is in progress
+        self._stage = None
+        
+        # Variable order BDF - order of the next step, accepted steps taken 
+        # at it, switch states of the last step
+        self._bdf_order = 1
+        self._bdf_steps = 0
+        self._bdf_switches = None
+        
     def add_node(self, name, pos=None):
         self.graph.add_node(name)
         if pos:
             self.graph.nodes[name]['pos'] = pos
+        
+        # Topology changed - invalidate compiled plan
+        self.topology_version += 1
             
     def add_component(self, n1, n2, component):
         
@@ -76,9 +153,84 @@ class Network:
         self.graph.add_edge(n1, n2, key=component.component.name, 
                             component=component)
         
-    def solve(self, 
-              time: np.ndarray | None = None,
-              input_driver: InputDriver | None = None):
+        # Topology changed - invalidate compiled plan
+        self.topology_version += 1
+        
+    def add_subcircuit(self, name, definition, port_nodes):
+        """
+        Objective: Place an instance of a subcircuit definition. Only its 
+        port pair branches enter the graph, the internals are condensed onto
+        the ports.
+
+        Parameters
+        ----------
+        name : String
+            Instance name, prefixes internal component names.
+        definition : Subcircuit
+            Shared definition - port reductions are cached on it.
+        port_nodes : Dictionary
+            Network node of every port.
+
+        Returns
+        -------
+        SubcircuitInstance
+            Instance handle, probe() recovers the internal voltages.
+        """
+        
+        if name in self.subcircuits:
+            raise ValueError(f"Duplicate subcircuit instance name: {name}")
+        
+        instance = definition.instantiate(name, port_nodes)
+        for branch in instance.branches:
+            self.add_component(branch.component.node1, 
+                               branch.component.node2, branch)
+        
+        self.subcircuits[name] = instance
+        
+        return instance
+        
+    def close(self, wait: bool = True):
+        """
+        Stop the worker threads of the island pool and of the solver 
+        backends. The network stays usable, pools restart on demand. With
+        wait the threads are joined before returning.
+        """
+        
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+        self._executor = None
+        
+        solvers = [self.solver] + [isl.solver for isl in self.islands]
+        for solver in solvers:
+            if solver is not None:
+                solver.close(wait=wait)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def __del__(self):
+        # Partially constructed networks have nothing to close. No joins in
+        # a finalizer - it can run on a worker thread or at interpreter exit
+        if hasattr(self, 'islands'):
+            self.close(wait=False)
+        
+    def compile(self):
+        """
+        Freeze the network topology into an immutable TopologyPlan. The plan 
+        is cached on the network and reused until add_node / add_component 
+        change the topology or the ground node is reassigned.
+
+        Returns
+        -------
+        TopologyPlan
+            Compiled topology used by solve().
+        """
+        
+        if self._plan_is_current():
+            return self.plan
         
         # Prune isolated nodes, Build node list
         self._local_print('\nPruning isolated nodes')
@@ -91,6 +243,74 @@ class Network:
         self._build_branch_list()
         self._build_component_lookup()
         
+        # Freeze into plan, point network attributes at the frozen copies
+        self.plan = self._build_plan()
+        self._apply_plan(self.plan)
+        
+        # Floating islands, source loops, cut-sets
+        self._check_structure()
+        
+        # Solver backend and assembly engine for the new topology
+        self._build_solver_state()
+        
+        return self.plan
+        
+    def autotune(self, 
+                 path: str | None = None,
+                 dt: float = 1e-3,
+                 cycles: int = 5,
+                 reuse_steps: int = 10) -> AutotuneResult:
+        """
+        Objective: Time a few assembly / factor / solve cycles for every
+        candidate solver backend and column ordering on the compiled system,
+        then switch the network to the fastest one.
+
+        Parameters
+        ----------
+        path : String, optional
+            JSON file the choice is stored in, keyed by the topology
+            fingerprint. Defaults to numerics.autotune_file, nothing is
+            written if both are None.
+        dt : Float
+            Timestep used to assemble the trial system.
+        cycles : Integer
+            Timed cycles per candidate, the fastest one counts.
+        reuse_steps : Integer
+            Back substitutions per factorization in one cycle.
+
+        Returns
+        -------
+        AutotuneResult
+            Chosen backend and per candidate cost in seconds per step.
+        """
+        
+        plan = self.compile()
+        self._update_comps()
+        
+        ctx = StampContext(dt=dt,
+                           default_dt=False,
+                           discretization=self._stamp_discretization())
+        tuner = Autotuner(self.numerics, cycles=cycles, 
+                          reuse_steps=reuse_steps)
+        result = tuner.run(plan, ctx)
+        
+        path = path or self.numerics.autotune_file
+        if path:
+            save_autotune(path, result)
+        
+        # Use the winner from now on (for this topology)
+        self.autotune_result = result
+        self._build_solver_state()
+        
+        return result
+        
+    def solve(self, 
+              time: np.ndarray | None = None,
+              input_driver: InputDriver | None = None):
+        
+        # Compile topology (cached between solves)
+        self.compile()
+        
         # Initialize output storage, sim_data
         self._get_simulation_length(time)
         sim_data = self._init_storage(time)
@@ -112,18 +332,67 @@ class Network:
             # vectorized dt check
             self._guard_dt_min_vec(dt_vec)
             
+            # Snap round-off level dt jitter so A can be reused between steps
+            dt_vec = self._snap_dt_vec(dt_vec)
+            
+            # Variable order BDF picks its order from the error estimates 
+            # over the solved points
+            variable = self.discretization == DiscretizationType.BDF_VARIABLE
+            if variable:
+                control = StepController(rtol=self.numerics.adaptive_rtol,
+                                         atol=self.numerics.adaptive_atol,
+                                         dt_min=self.numerics.min_dt,
+                                         dt_max=np.inf)
+                history_t = [float(time[0])]
+                history_x = [self._reactive_states()]
+            
+            # Switch edges between the grid times are landed on
+            locate = input_driver.has_events()
+            restart = False
+            
             # Loop over all dts - first time step will be the network solved 
             # for the given component conditions
             for k, dt in enumerate(dt_vec, start=0):
                 
                 # Get new time stamp
                 t_new = float(sim_data.time[k])
+                t_cur = float(time[k])
                 
-                # Apply inputs
-                input_driver.apply(self, t=t_new, k=k)
+                # Sub steps onto the switch edges inside the step
+                if locate:
+                    t_cur, restart = self._land_events(input_driver, t_cur,
+                                                       t_new, k, restart)
+                    if restart and variable:
+                        history_t = [t_cur]
+                        history_x = [self._reactive_states()]
                 
-                # Evaluate and store timestep
-                self._timestep(dt=dt)
+                if t_cur < t_new:
+                    
+                    # Backward Euler restart after an edge
+                    if float(time[k]) < t_cur:
+                        dt = t_new - t_cur
+                    self.default_dt = self.default_dt or restart
+                    restart = False
+                    
+                    # Apply inputs
+                    input_driver.apply(self, t=t_new, k=k)
+                    if variable and self._bdf_event():
+                        history_t, history_x = history_t[-1:], history_x[-1:]
+                    
+                    # Evaluate timestep
+                    self._timestep(dt=dt, stage_inputs=lambda lag, t=t_new, 
+                                   k=k: input_driver.apply(self, t=t - lag, 
+                                                           k=k))
+                    
+                    if variable:
+                        history_t = (history_t + [t_new]
+                                     )[-(BDF_HISTORY + 2):]
+                        history_x = (history_x + [self._reactive_states()]
+                                     )[-(BDF_HISTORY + 2):]
+                        self._bdf_select(control, history_t, history_x, 
+                                         fixed_dt=True)
+                
+                # Store timestep
                 self._write_step(sim_data, k)
                 
                 # Update default_dt
@@ -133,6 +402,390 @@ class Network:
         # Store sim_data on object
         self.sim_data = sim_data
             
+    def solve_multirate(self, 
+                        time: np.ndarray,
+                        input_driver: InputDriver,
+                        ratio: int | None = None) -> MultirateReport:
+        """
+        Objective: Transient solve with the slow reactive components on a 
+        macro step of ratio micro steps. Reactive branches whose local time 
+        constant spans numerics.multirate_min_steps macro steps form the 
+        slow partition (MultiratePartition), everything else steps on the 
+        given time vector. Per macro step the fast partition runs first, 
+        with the slow interface nodes following the linear waveform through 
+        the last two macro points; the slow partition then takes one macro 
+        step with the fast interface nodes held at their average over the 
+        micro steps. Slow states whose local error estimate exceeds 
+        numerics.multirate_rtol move to the fast side and the network is 
+        partitioned again. While the fast partition is latent - its source,
+        switch and boundary inputs within multirate_rtol of those at its 
+        last solve, which itself moved the fast nodes by less than that - 
+        its micro step solves are skipped (numerics.multirate_latency).
+
+        Parameters
+        ----------
+        time : Float, Array
+            Micro step time vector, as for solve().
+        input_driver : InputDriver
+            Source and switch inputs, applied on every micro step.
+        ratio : Integer, optional
+            Micro steps per macro step, defaults to numerics.multirate_ratio.
+
+        Returns
+        -------
+        MultirateReport
+            Partition sizes and solve counts. Slow node and branch values 
+            in sim_data are interpolated between the macro points, latent 
+            fast rows repeat the last fast solve.
+        """
+        
+        self.compile()
+        
+        if input_driver is None:
+            raise ValueError("Transient behavior needs input_driver object")
+        
+        self._get_simulation_length(time)
+        if self.num_steps < 2:
+            raise ValueError("Multi-rate integration needs a time vector")
+        
+        sim_data = self._init_storage(time)
+        time = np.asarray(time, dtype=float)
+        dt_vec = np.diff(time)
+        self._guard_dt_min_vec(dt_vec)
+        dt_vec = self._snap_dt_vec(dt_vec)
+        
+        plan = self.plan
+        ratio = ratio or self.numerics.multirate_ratio
+        report = MultirateReport(num_unknowns=plan.num_unknowns, ratio=ratio)
+        comps = [c.component for _, _, c in plan.branch_list]
+        
+        # Node voltages at the last two macro points
+        node_v = np.zeros(plan.num_nodes)
+        if self.node_v is not None and len(self.node_v) == plan.num_nodes:
+            node_v[:] = self.node_v
+        macro_t, macro_v = [time[0]], [node_v.copy()]
+        
+        demoted, part, H_prev = set(), None, None
+        v_peak = i_peak = 0.0
+        rtol = self.numerics.multirate_rtol
+        for s in range(0, len(dt_vec), ratio):
+            e = min(s + ratio, len(dt_vec))
+            
+            # Macro steps snapped like the micro steps
+            H = float(time[e] - time[s])
+            if (H_prev is not None and 
+                abs(H - H_prev) <= self.numerics.dt_snap_rtol*H_prev):
+                H = H_prev
+            H_prev = H
+            
+            if part is None:
+                part, fast, slow, monitor = self._multirate_partition(
+                    H, demoted)
+                report.partitions += 1
+                report.fast_unknowns = fast[0].plan.num_unknowns
+                report.slow_unknowns = (0 if slow is None else 
+                                        slow[0].plan.num_unknowns)
+                report.slow_components = [comps[b].name for b in 
+                                          part.reactive]
+                latent_inputs, last_move = None, 0.0
+            
+            fast_net, fast_src = fast
+            fast_idx = [fast_net.node_indices[plan.node_list[n]] 
+                        for n in part.fast_nodes]
+            held = [n for n, _ in part.fast_boundary]
+            averaged = [n for n, _ in part.slow_boundary]
+            
+            # Slow waveform through the last two macro points
+            t_b, v_b = macro_t[-1], macro_v[-1]
+            t_a, v_a = (macro_t[-2], macro_v[-2]) if len(macro_t) > 1 else \
+                       (t_b - 1.0, v_b)
+            
+            v_start = node_v.copy()
+            bv_start = np.array([c.voltage for c in comps], dtype=float)
+            bi_start = np.array([c.current for c in comps], dtype=float)
+            avg = np.zeros(len(averaged))
+            
+            for k in range(s, e):
+                t = float(time[k + 1])
+                input_driver.apply(self, t=t, k=k)
+                
+                w = (t - t_b) / (t_b - t_a)
+                for src, n in zip(fast_src, held):
+                    src.component.ideal_params.ideal_voltage = float(
+                        v_b[n] + w*(v_b[n] - v_a[n]))
+                
+                report.micro_steps += 1
+                
+                # Latent fast side - same inputs as its last solve, which 
+                # had already settled
+                inputs, switches = self._latency_inputs(fast_net)
+                if (latent_inputs is not None and 
+                    switches == latent_inputs[1] and
+                    np.all(np.abs(inputs - latent_inputs[0]) <= 
+                           rtol*latent_inputs[2])):
+                    fast_net._hold_step(dt_vec[k])
+                    sim_data.integration_order[k] = \
+                        fast_net._integration_order()
+                    sim_data.node_v[k, part.fast_nodes] = \
+                        node_v[part.fast_nodes]
+                    avg += dt_vec[k]*node_v[averaged]
+                    for b in part.fast_branches:
+                        sim_data.branch_v[k, b] = float(comps[b].voltage)
+                        sim_data.branch_i[k, b] = float(comps[b].current)
+                    continue
+                
+                fast_net._timestep(dt=dt_vec[k])
+                sim_data.integration_order[k] = \
+                    fast_net._integration_order()
+                fast_net.default_dt = False
+                report.fast_solves += 1
+                report.work += fast_net.plan.num_unknowns
+                
+                v_fast = fast_net.node_v[fast_idx]
+                moved = np.abs(v_fast - node_v[part.fast_nodes]).max(
+                    initial=0.0)
+                scale = max(np.abs(inputs).max(initial=0.0), 
+                            np.abs(v_fast).max(initial=0.0))
+                
+                # Drift left in a decaying fast mode, from the ratio of the 
+                # last two moves
+                q = moved/last_move if last_move > 0.0 else np.inf
+                drift = moved*q/(1.0 - q) if q < 1.0 else np.inf
+                last_move, latent_inputs = moved, None
+                if (self.numerics.multirate_latency and 
+                    max(moved, drift) <= rtol*scale):
+                    latent_inputs = (inputs, switches, scale)
+                
+                node_v[part.fast_nodes] = v_fast
+                avg += dt_vec[k]*node_v[averaged]
+                
+                sim_data.node_v[k, part.fast_nodes] = node_v[part.fast_nodes]
+                sim_data.solver_iterations[k] = fast_net._step_iterations
+                sim_data.solver_residual[k] = fast_net._step_residual
+                for b in part.fast_branches:
+                    sim_data.branch_v[k, b] = float(comps[b].voltage)
+                    sim_data.branch_i[k, b] = float(comps[b].current)
+            
+            if slow is not None:
+                slow_net, slow_src = slow
+                slow_idx = [slow_net.node_indices[plan.node_list[n]] 
+                            for n in part.slow_nodes]
+                
+                for src, value in zip(slow_src, avg / H):
+                    src.component.ideal_params.ideal_voltage = float(value)
+                
+                slow_net._timestep(dt=H)
+                slow_net.default_dt = False
+                report.slow_solves += 1
+                report.work += slow_net.plan.num_unknowns
+                node_v[part.slow_nodes] = slow_net.node_v[slow_idx]
+                
+                # Slow rows interpolated over the macro step
+                w = ((time[s + 1:e + 1] - time[s]) / H)[:, None]
+                nodes = part.slow_nodes
+                sim_data.node_v[s:e, nodes] = (v_start[nodes] + 
+                                               w*(node_v[nodes] - 
+                                                  v_start[nodes]))
+                owned = np.setdiff1d(part.slow_branches, part.interface)
+                bv = np.array([comps[b].voltage for b in owned], dtype=float)
+                bi = np.array([comps[b].current for b in owned], dtype=float)
+                sim_data.branch_v[s:e, owned] = (bv_start[owned] + 
+                                                 w*(bv - bv_start[owned]))
+                sim_data.branch_i[s:e, owned] = (bi_start[owned] + 
+                                                 w*(bi - bi_start[owned]))
+                
+                # Slow states resolved too coarsely - fast side from now on
+                v_peak = max(v_peak, np.abs(sim_data.node_v[s:e]).max())
+                i_peak = max(i_peak, np.abs(sim_data.branch_i[s:e]).max())
+                bad = part.reactive[monitor.update(H, v_peak, i_peak)]
+                if len(bad):
+                    demoted.update(bad.tolist())
+                    report.demoted += [comps[b].name for b in bad]
+                    self._local_print(f'\tMulti-rate: {report.demoted[-1]} '
+                                      f'moved to the fast partition at t = '
+                                      f'{time[e]}')
+                    part = None
+            
+            macro_t = [macro_t[-1], float(time[e])]
+            macro_v = [macro_v[-1], node_v.copy()]
+        
+        self.node_v = node_v
+        self.node_voltages = dict(zip(plan.node_list, node_v.tolist()))
+        self.sim_data = sim_data
+        self.multirate_report = report
+        self._local_print(f'\n{report}')
+        self._report()
+        
+        return report
+    
+    def solve_adaptive(self,
+                       t_start: float,
+                       t_stop: float,
+                       input_driver: InputDriver,
+                       rtol: float | None = None,
+                       atol: float | None = None,
+                       dt_initial: float | None = None,
+                       dt_max: float | None = None):
+        """
+        Objective: Transient solve on a step size chosen from the local 
+        truncation error of the capacitor voltages and inductor currents. 
+        Each step is compared against the polynomial predictor through the 
+        accepted history (local_truncation_error); steps above the tolerance
+        are undone and retried on a smaller dt, quiet stretches grow dt up 
+        to dt_max. BDF2 takes its variable step coefficients from the 
+        component dt history. The accepted grid is stored in sim_data.time.
+
+        Parameters
+        ----------
+        t_start, t_stop : Float
+            Simulated interval, t_start is the initial state.
+        input_driver : InputDriver
+            Source and switch inputs, functions of time.
+        rtol, atol : Float, optional
+            Error tolerances, default numerics.adaptive_rtol / adaptive_atol.
+        dt_initial : Float, optional
+            First trial step, defaults to 1e-4 of the interval.
+        dt_max : Float, optional
+            Step size limit, default numerics.adaptive_dt_max or 1/20 of the
+            interval.
+
+        Returns
+        -------
+        None.
+        """
+        
+        self.compile()
+        
+        if input_driver is None:
+            raise ValueError("Transient behavior needs input_driver object")
+        if t_stop <= t_start:
+            raise ValueError(f"t_stop ({t_stop}) must be after t_start "
+                             f"({t_start})")
+        
+        span = t_stop - t_start
+        min_dt = self.numerics.min_dt
+        dt_max = dt_max or self.numerics.adaptive_dt_max or span/20
+        control = StepController(
+            rtol=rtol if rtol is not None else self.numerics.adaptive_rtol,
+            atol=atol if atol is not None else self.numerics.adaptive_atol,
+            dt_min=min_dt,
+            dt_max=max(dt_max, min_dt))
+        dt = float(np.clip(dt_initial or span*1e-4, min_dt, control.dt_max))
+        dt_restart = dt
+        
+        scheme_order, constant = SCHEME_ERROR[self.discretization]
+        variable = self.discretization == DiscretizationType.BDF_VARIABLE
+        locate = input_driver.has_events()
+        history_t, history_x = [t_start], [self._reactive_states()]
+        times, rows, rejected = [], [], 0
+        t = t_start
+        
+        # First step is Backward Euler, as in solve()
+        restart = True
+        
+        while t_stop - t > min_dt*1e-3:
+            
+            # Land on t_stop rather than leave a sliver below min_dt
+            dt_step = dt if t_stop - (t + dt) >= min_dt else t_stop - t
+            
+            # Land on the next switch edge, the states just before it are
+            # held up to it
+            event = (input_driver.next_event(t, t + dt_step, 
+                                             self.numerics.event_tol,
+                                             self.numerics.event_samples)
+                     if locate else None)
+            t_left = None
+            if event is not None:
+                t_event, t_left = event
+                if t_event - t < min_dt:
+                    # Edge at the start of the step - restart from here
+                    t_left, restart = None, True
+                    history_t, history_x = history_t[-1:], history_x[-1:]
+                elif t + dt_step - t_event >= min_dt:
+                    dt_step = t_event - t
+            
+            saved = self._save_state()
+            self.default_dt = restart
+            t_new = t + dt_step
+            input_driver.apply(self, t=t_new, state_time=t_left)
+            if variable and self._bdf_event():
+                history_t, history_x = history_t[-1:], history_x[-1:]
+            self._timestep(dt=dt_step, stage_inputs=lambda lag: 
+                           input_driver.apply(self, t=t_new - lag, 
+                                              state_time=t_left))
+            
+            x = self._reactive_states()
+            if variable:
+                scheme_order = self._bdf_order
+                constant = ERROR_CONSTANTS[scheme_order]
+            order, c_err = (scheme_order, constant) if not restart else \
+                           SCHEME_ERROR[DiscretizationType.BACKWARD_EULER]
+            norm = self._step_error(control, history_t, history_x, 
+                                    t_new, x, order, c_err)
+            accepted, dt = control.next_dt(dt_step, norm, order)
+            
+            if not accepted:
+                self._restore_state(saved)
+                self._local_print(f'\tStep rejected at t = {t + dt_step} '
+                                  f'(dt = {dt_step}, error norm {norm:.3g})')
+                rejected += 1
+                continue
+            
+            t += dt_step
+            history_t = (history_t + [t])[-(BDF_HISTORY + 2):]
+            history_x = (history_x + [x])[-(BDF_HISTORY + 2):]
+            times.append(t)
+            rows.append((self.node_v.copy(), self._step_iterations, 
+                         self._step_residual, rejected, order,
+                         [c.component.voltage for _, _, c in 
+                          self.branch_list],
+                         [c.component.current for _, _, c in 
+                          self.branch_list]))
+            rejected = 0
+            
+            # Landed on an edge - the next step restarts at Backward Euler 
+            # on a short step, the history ends at the edge
+            restart = t_left is not None
+            if restart:
+                history_t, history_x = [t], [x]
+                dt = min(dt, dt_restart)
+            
+            # Next order, and the step it allows
+            if variable:
+                norms = self._bdf_select(control, history_t, history_x)
+                if self._bdf_order != order and self._bdf_order in norms:
+                    dt = control.next_dt(dt_step, norms[self._bdf_order],
+                                         self._bdf_order)[1]
+        
+        # Accepted grid, t_start is not stored (as in solve)
+        time = np.array([t_start] + times)
+        self._get_simulation_length(time)
+        sim_data = self._init_storage(time)
+        if rows:
+            (node_v, iterations, residual, rejects, orders, branch_v, 
+             branch_i) = zip(*rows)
+            sim_data.node_v = np.array(node_v, dtype=float)
+            sim_data.solver_iterations = np.array(iterations, dtype=np.int64)
+            sim_data.solver_residual = np.array(residual, dtype=float)
+            sim_data.rejected_steps = np.array(rejects, dtype=np.int64)
+            sim_data.integration_order = np.array(orders, dtype=np.int64)
+            sim_data.branch_v = np.array(branch_v, dtype=float)
+            sim_data.branch_i = np.array(branch_i, dtype=float)
+        
+        self.default_dt = False
+        self.sim_data = sim_data
+    
+    def _apply_plan(self, plan: TopologyPlan):
+        
+        self.ground_node = plan.ground_node
+        self.node_indices = plan.node_indices
+        self.node_list = plan.node_list
+        self.num_nodes = plan.num_nodes
+        self.v_source_list = plan.v_source_list
+        self.num_v_sources = plan.num_v_sources
+        self.branch_list = plan.branch_list
+        self.components_by_name = plan.components_by_name
+    
     def _build_branch_list(self):
         
         self.branch_list = [(n1, n2, d["component"]) for n1, n2, d in 
@@ -154,6 +807,332 @@ class Network:
                 
             self.components_by_name[name] = c_obj
         
+        # Subcircuit internals, so input drivers can reach their sources
+        for instance in self.subcircuits.values():
+            for c_obj in instance.components:
+                self.components_by_name[c_obj.component.name] = c_obj
+        
+    def _build_plan(self):
+        
+        # Branch index arrays - component orientation, not edge orientation
+        branch_n1 = [self.node_indices[c.component.node1] for _, _, c in 
+                     self.branch_list]
+        branch_n2 = [self.node_indices[c.component.node2] for _, _, c in 
+                     self.branch_list]
+        
+        # Component type masks over the branch list
+        ctypes = [c.component.ctype for _, _, c in self.branch_list]
+        type_masks = {ctype: TopologyPlan.freeze_array(
+                          [t == ctype for t in ctypes], dtype=bool)
+                      for ctype in ComponentType}
+        
+        # Galvanically isolated islands, each with its own reference node
+        island_grounds, node_island = self._find_islands()
+        branch_island = node_island[np.asarray(branch_n1, dtype=np.int64)]
+        
+        # Ideal sources on an island reference fix their other terminal,
+        # node and source current both leave the unknowns
+        fixed_branch, fixed_node, fixed_sign = self._find_fixed_potentials(
+            island_grounds)
+        fixed = {id(self.branch_list[k][2]) for k in fixed_branch}
+        self.v_source_list = [s for s in self.v_source_list 
+                              if id(s[2]) not in fixed]
+        self.num_v_sources = len(self.v_source_list)
+        
+        # Voltage source positions within the branch list - MNA rows for
+        # the ideal ones, Norton conductances for the rest
+        mna_sources = {id(vs) for _, _, vs in self.v_source_list}
+        v_source_branch, norton_branch = [], []
+        for k, (_, _, c) in enumerate(self.branch_list):
+            if (c.component.ctype == ComponentType.VOLTAGE_SOURCE and 
+                id(c) not in fixed):
+                (v_source_branch if id(c) in mna_sources 
+                 else norton_branch).append(k)
+        
+        # Series / parallel reduction of the conductance branches, nodes
+        # carrying anything else stay
+        reduction = None
+        if self.numerics.topology_reduction:
+            reduction = self._build_reduction(branch_n1, branch_n2, 
+                                              type_masks, norton_branch,
+                                              island_grounds, fixed_node)
+        
+        # Unknowns - every node but the island references, fixed 
+        # potentials and reduced nodes, then voltage source currents
+        is_ref = np.zeros(self.num_nodes, dtype=bool)
+        is_ref[[self.node_indices[g] for g in island_grounds]] = True
+        is_ref[fixed_node] = True
+        if reduction is not None:
+            is_ref[reduction.eliminated] = True
+        node_unknown = np.cumsum(~is_ref) - 1
+        node_unknown[is_ref] = -1
+        num_node_unknowns = int(np.count_nonzero(~is_ref))
+        vs_unknown = num_node_unknowns + np.arange(self.num_v_sources)
+        
+        # Fill reducing permutation of the unknowns, results are mapped back
+        # through node_unknown so users keep their node order
+        S = self._structure_matrix(node_unknown, vs_unknown, branch_n1,
+                                   branch_n2, v_source_branch, norton_branch,
+                                   type_masks, reduction)
+        perm = order_unknowns(S, self.numerics.node_ordering)
+        
+        # Keep each island in one contiguous block, ordering kept within it
+        unknown_island = np.concatenate((
+            node_island[~is_ref],
+            branch_island[np.asarray(v_source_branch, dtype=np.int64)]))
+        perm = perm[np.argsort(unknown_island[perm], kind='stable')]
+        stops = np.cumsum(np.bincount(unknown_island, 
+                                      minlength=len(island_grounds)))
+        island_slices = tuple((int(stop - count), int(stop)) for stop, count
+                              in zip(stops, np.diff(stops, prepend=0)))
+        
+        position = np.argsort(perm)
+        solved = node_unknown >= 0
+        node_unknown[solved] = position[node_unknown[solved]]
+        vs_unknown = position[vs_unknown]
+        
+        return TopologyPlan(
+            version=self.topology_version,
+            ground_node=self.ground_node,
+            node_list=tuple(self.node_list),
+            node_indices=TopologyPlan.freeze_mapping(self.node_indices),
+            branch_list=tuple(self.branch_list),
+            branch_n1=TopologyPlan.freeze_array(branch_n1),
+            branch_n2=TopologyPlan.freeze_array(branch_n2),
+            v_source_list=tuple(self.v_source_list),
+            v_source_branch=TopologyPlan.freeze_array(v_source_branch),
+            norton_branch=TopologyPlan.freeze_array(norton_branch),
+            fixed_branch=TopologyPlan.freeze_array(fixed_branch),
+            fixed_node=TopologyPlan.freeze_array(fixed_node),
+            fixed_sign=TopologyPlan.freeze_array(fixed_sign, dtype=float),
+            components_by_name=TopologyPlan.freeze_mapping(
+                self.components_by_name),
+            type_masks=TopologyPlan.freeze_mapping(type_masks),
+            node_unknown=TopologyPlan.freeze_array(node_unknown),
+            vs_unknown=TopologyPlan.freeze_array(vs_unknown),
+            ordering=self.numerics.node_ordering,
+            unknown_perm=TopologyPlan.freeze_array(perm),
+            island_grounds=tuple(island_grounds),
+            island_slices=island_slices,
+            branch_island=TopologyPlan.freeze_array(branch_island),
+            reduction=reduction,
+            source_modes=self._source_modes(self.branch_list))
+    
+    def _build_reduction(self, branch_n1, branch_n2, type_masks, 
+                         norton_branch, grounds, fixed_node):
+        
+        # Conductance branches in engine order
+        g_idx = np.concatenate([idx for _, idx in 
+                                AssemblyEngine.conductance_branches(
+                                    type_masks, norton_branch)])
+        n1 = np.asarray(branch_n1, dtype=np.int64)
+        n2 = np.asarray(branch_n2, dtype=np.int64)
+        
+        # References, fixed potentials and terminals of MNA sources, fixed
+        # sources and current sources
+        g_mask = np.zeros(len(n1), dtype=bool)
+        g_mask[g_idx] = True
+        protected = set(self.node_indices[g] for g in grounds)
+        protected.update(int(n) for n in fixed_node)
+        protected.update(n1[~g_mask].tolist())
+        protected.update(n2[~g_mask].tolist())
+        
+        reduction = TopologyReduction(self.num_nodes, n1[g_idx], n2[g_idx],
+                                      protected)
+        self._local_print(f'\nTopology reduction: {reduction.num_eliminated}'
+                          f' nodes eliminated')
+        
+        return reduction
+    
+    def _find_fixed_potentials(self, grounds):
+        
+        # Ideal MNA sources with exactly one terminal on an island reference,
+        # at most one per node (a second one closes a source loop and is
+        # left to the structural checks)
+        fixed_branch, fixed_node, fixed_sign = [], [], []
+        if not self.numerics.fixed_potentials:
+            return fixed_branch, fixed_node, fixed_sign
+        
+        grounds = set(grounds)
+        mna_sources = {id(vs) for _, _, vs in self.v_source_list}
+        
+        for k, (_, _, c) in enumerate(self.branch_list):
+            comp = c.component
+            if (id(c) not in mna_sources or not self._is_ideal(comp) or
+                (comp.node1 in grounds) == (comp.node2 in grounds)):
+                continue
+            
+            # v2 = v1 + V - sign +1 when node2 is the fixed one
+            sign = 1.0 if comp.node1 in grounds else -1.0
+            node = self.node_indices[comp.node2 if sign > 0 else comp.node1]
+            if node in fixed_node:
+                continue
+            
+            fixed_branch.append(k)
+            fixed_node.append(node)
+            fixed_sign.append(sign)
+        
+        return fixed_branch, fixed_node, fixed_sign
+    
+    def _find_islands(self):
+        
+        # Island holding ground_node first, then in node list order
+        node_island = np.full(self.num_nodes, -1, dtype=np.int64)
+        grounds = []
+        
+        components = sorted(nx.connected_components(self.graph), 
+                            key=lambda nodes: (
+                                self.ground_node not in nodes,
+                                min(self.node_indices[n] for n in nodes)))
+        
+        for k, nodes in enumerate(components):
+            node_island[[self.node_indices[n] for n in nodes]] = k
+            
+            # Same naming rules as _set_ground within the island
+            if self.ground_node in nodes:
+                grounds.append(self.ground_node)
+            elif 'n0' in nodes:
+                grounds.append('n0')
+            elif 'gnd' in nodes:
+                grounds.append('gnd')
+            else:
+                grounds.append(min(nodes, key=self.node_indices.get))
+        
+        return grounds, node_island
+    
+    def _structure_matrix(self, node_unknown, vs_unknown, branch_n1, 
+                          branch_n2, v_source_branch, norton_branch,
+                          type_masks, reduction=None):
+        
+        # Nonzero pattern of A for a given unknown layout
+        n1 = np.asarray(branch_n1, dtype=np.int64)
+        n2 = np.asarray(branch_n2, dtype=np.int64)
+        vs = np.asarray(v_source_branch, dtype=np.int64)
+        
+        # Conductances, or the equivalent edges of a reduced topology
+        if reduction is None:
+            g_idx = np.concatenate([idx for _, idx in 
+                                    AssemblyEngine.conductance_branches(
+                                        type_masks, norton_branch)])
+            g_n1, g_n2 = n1[g_idx], n2[g_idx]
+        else:
+            g_n1, g_n2 = reduction.surviving_nodes()
+        
+        num_refs = int(np.count_nonzero(node_unknown < 0))
+        return structure_matrix(self.num_nodes - num_refs + self.num_v_sources,
+                                node_unknown[g_n1],
+                                node_unknown[g_n2],
+                                node_unknown[n1[vs]],
+                                node_unknown[n2[vs]],
+                                vs_unknown)
+    
+    def ordering_report(self) -> OrderingReport:
+        """
+        Objective: Fill-in statistics of A in the natural unknown order
+        (node list order, then voltage sources) and in the reordered layout
+        chosen by numerics.node_ordering.
+
+        Returns
+        -------
+        OrderingReport
+            Bandwidth, envelope and nonzeros of the LU factors before and
+            after reordering.
+        """
+        
+        plan = self.compile()
+        
+        # Natural layout - unknown_perm maps rows back to it
+        perm = np.asarray(plan.unknown_perm)
+        node_unknown = np.where(plan.node_unknown >= 0,
+                                perm[np.maximum(plan.node_unknown, 0)], -1)
+        vs_unknown = perm[plan.vs_unknown]
+        
+        S = self._structure_matrix(node_unknown, vs_unknown, plan.branch_n1,
+                                   plan.branch_n2, plan.v_source_branch,
+                                   plan.norton_branch, plan.type_masks,
+                                   plan.reduction)
+        before = fill_statistics(S)
+        after = fill_statistics(S, perm)
+        
+        report = OrderingReport(method=plan.ordering,
+                                num_unknowns=plan.num_unknowns,
+                                nnz=before['nnz'],
+                                bandwidth_before=before['bandwidth'],
+                                envelope_before=before['envelope'],
+                                lu_nnz_before=before['lu_nnz'],
+                                bandwidth_after=after['bandwidth'],
+                                envelope_after=after['envelope'],
+                                lu_nnz_after=after['lu_nnz'])
+        self._local_print(f'\n{report}')
+        
+        return report
+    
+    def decomposition_report(self, 
+                             workers=(1, 2, 4), 
+                             dt: float = 1e-3,
+                             cycles: int = 3) -> DecompositionReport:
+        """
+        Objective: Time the domain decomposition backend on this network 
+        for several thread counts, against single threaded SuperLU.
+
+        Parameters
+        ----------
+        workers : Iterable of Integer
+            Thread counts to time.
+        dt : Float
+            Timestep used to assemble the trial system.
+        cycles : Integer
+            Timed factor + solve cycles per setting, the fastest one counts.
+
+        Returns
+        -------
+        DecompositionReport
+            Partition sizes, seconds per factor + solve and speedup against
+            one worker.
+        """
+        
+        plan = self.compile()
+        self._update_comps()
+        
+        ctx = StampContext(dt=dt,
+                           default_dt=False,
+                           discretization=self._stamp_discretization())
+        engine = AssemblyEngine(plan, self.numerics, sparse=True)
+        A, b = engine.assemble(ctx)
+        b = b + 1.0
+        
+        def timed(solver):
+            best = np.inf
+            for _ in range(cycles):
+                t0 = perf_counter()
+                solver.solve(solver.refactor(A), b)
+                best = min(best, perf_counter() - t0)
+            return best
+        
+        report = DecompositionReport(num_unknowns=plan.num_unknowns,
+                                     num_parts=0,
+                                     num_interface=0,
+                                     cpu_count=os.cpu_count() or 1)
+        report.superlu_time = timed(build_solver(SolverBackend.SUPERLU, 
+                                                 self.numerics, 
+                                                 plan.num_unknowns))
+        
+        for count in workers:
+            solver = DomainDecompositionSolver(
+                parts=self.numerics.dd_parts, workers=count,
+                ordering=self.numerics.superlu_ordering)
+            report.timings[count] = timed(solver)
+            
+            # Same partition for every thread count
+            report.num_parts = solver.num_parts
+            report.num_interface = solver.num_interface
+            report.part_sizes = np.diff(solver.offsets).tolist()
+            solver.reset()
+        
+        self._local_print(f'\n{report}')
+        
+        return report
+    
     def _build_node_list(self):
         
         self._set_ground()
@@ -174,6 +1153,9 @@ class Network:
 
     def _build_voltage_list(self):
         
+        # Voltage sources needing an MNA row - with norton_sources on, the
+        # ones with internal resistance become current sources in parallel
+        # with a conductance and add no unknowns
         v_source_list = []
         for _,_, data in self.graph.edges(data=True):
             
@@ -182,99 +1164,301 @@ class Network:
             n1 = c.node1
             n2 = c.node2
             
-            if c.ctype == ComponentType.VOLTAGE_SOURCE:
+            if (c.ctype == ComponentType.VOLTAGE_SOURCE and 
+                not self._is_norton(c)):
                 v_source_list.append((n1, n2, data['component']))
                 
         self.v_source_list = v_source_list
         self.num_v_sources = len(v_source_list)
 
-    def _check_matrix(self, A):
+    def _is_norton(self, c):
         
-        if self.verbose:
-            self._local_print('Checking A matrix for numerical stability')
+        # Norton conversion needs a positive internal resistance at compile
+        return (self.numerics.norton_sources and 
+                c.ideal_params is not None and
+                c.ideal_params.int_resistance is not None and
+                c.ideal_params.int_resistance > 0)
+
+    def _is_ideal(self, c):
         
-            # Get rank of matrix
-            
-            # Check for sparse matrices
-            if hasattr(A, 'toarray'):
-                A = A.toarray()
-                
-            rank = np.linalg.matrix_rank(A)
-            
-            if rank < A.shape[0]:
-                
-                # Node-voltage unknowns
-                n = len(self.node_indices)
-                
-                # Number of voltage sources
-                m = sum(1 for _,_,d in self.graph.edges(data=True)
-                        if (d['component'].component.ctype == 
-                            ComponentType.VOLTAGE_SOURCE))
-                
-                # row information
-                row_norms = np.linalg.norm(A, axis=1)
-                self._local_print("row norms:", [f"{i}:{row_norms[i]:.2e}" for 
-                                                 i in range(A.shape[0])])
-                
-                # map rows to meaning
-                rev_nodes = {idx:name for name, idx in 
-                             self.node_indices.items()}
-                
-                for i in range(A.shape[0]):
-                    if row_norms[i] < 1e-12:
-                        if i < n:
-                            label = f"Node {rev_nodes[i]}"
-                        elif i < n + m:
-                            k = i-n
-                            label = f"Voltage Source {self.v_source_list[k]}"
-                        self._local_print(f"Row {i}: {label}")
-                        
-                raise ValueError("A in Ax=b is rank deficient")
-    
-    def _create_Ab(self, dt):
-        
-        numel = self.num_nodes + self.num_v_sources
-        
-        # Switching to sparse matrix solve
-        if numel < self.numerics.sparse_threshold:
-            A = np.zeros((numel, numel), dtype=float)
-        else:
-            A = lil_matrix((numel, numel))
+        # Fixed potential candidate - zero internal resistance at compile
+        return (c.ideal_params is not None and 
+                c.ideal_params.int_resistance is not None and
+                c.ideal_params.int_resistance <= 0)
+    
+    def _source_modes(self, branch_list):
+        
+        # Norton / fixed eligibility of every voltage source
+        return tuple((self._is_norton(c.component), self._is_ideal(c.component))
+                     for _, _, c in branch_list
+                     if c.component.ctype == ComponentType.VOLTAGE_SOURCE)
+    
+    def _plan_sources(self):
         
-        b = np.zeros((numel,), dtype=float)
+        # Voltage source branches of the plan, checked before every step
+        mask = self.plan.type_masks[ComponentType.VOLTAGE_SOURCE]
+        return [self.plan.branch_list[k] for k in np.flatnonzero(mask)]
+    
+    def _check_structure(self):
         
-        ctx = StampContext(
-            dt=dt,
-            default_dt= self.default_dt,
-            discretization= self.discretization)
+        # Graph based singularity checks, once per topology
+        self._local_print('\nChecking network structure')
+        problems = []
+        edges = structure_edges(self.graph)
         
-        # Stamp A matrix for passive components
-        for _,_, data in self.graph.edges(data=True):
-            
-            c_obj = data['component']
+        for names in voltage_source_loops(self.graph, edges):
+            problems.append(f"loop of ideal voltage sources: {names}")
             
-            n1 = c_obj.component.node1
-            n2 = c_obj.component.node2
+        for names in cut_sets(self.graph, self.plan.island_grounds,
+                              (ComponentType.CURRENT_SOURCE,), edges):
+            problems.append(f"cut-set of current sources: {names}")
             
-            if c_obj.component.ctype != ComponentType.VOLTAGE_SOURCE:
-                c_obj.stamp(A, 
-                            b, 
-                            self.node_indices[n1], 
-                            self.node_indices[n2], 
-                            ctx)
+        if problems:
+            raise ValueError("Structurally singular network - " + 
+                             "; ".join(problems))
         
-        # Stamp A matrix for voltage sources
-        for k, (n1, n2, vs) in enumerate(self.v_source_list):
-            
-            # n1, n2 are directed nodes (self._voltage_list() populates via 
-            # assumed orientation)
-            
-            # Calculate voltage source index
-            vs_ctx = StampContext(voltage_source_index=self.num_nodes+k)
+        # Capacitor cut-sets only leave the DC operating point undefined,
+        # transient companion models conduct
+        self.structure_warnings = [
+            f"cut-set of capacitors / current sources: {names}" for names in
+            cut_sets(self.graph, self.plan.island_grounds,
+                     (ComponentType.CAPACITOR,
+                      ComponentType.CURRENT_SOURCE), edges)]
+        
+        for warning in self.structure_warnings:
+            self._local_print(f"\tWARNING - {warning}")
+    
+    def _check_matrix(self, A, lu, solver=None, offset=0):
+        
+        # Cheap numerical guard on every new factorization - 1-norm
+        # condition estimate of the equilibrated matrix from a few solves 
+        # with the factors. Switch conductances (1e10 / 1e-10 S) put
+        # unscaled A far above max_condition on solvable circuits, so an
+        # ill conditioned A is reported, not rejected.
+        self._record_check(self._matrix_check(A, lu, solver, offset))
+    
+    def _record_check(self, check):
+        
+        # Condition / warning of a matrix check, on the main thread only
+        cond, message = check
+        if cond is not None:
+            self.last_condition = cond
+        if message is not None:
+            if message not in self.matrix_warnings:
+                self.matrix_warnings.append(message)
+            self._local_print(f"\tWARNING - {message}")
+    
+    def _matrix_check(self, A, lu, solver=None, offset=0):
+        
+        # (condition estimate, warning) - no network state written, island
+        # jobs run it on worker threads
+        solver = solver or self.solver
+        try:
+            cond = self._condition_estimate(A, lu, solver)
+        except NotImplementedError:
+            return None, None
+        
+        if np.isfinite(cond) and cond <= self.numerics.max_condition:
+            return cond, None
+        
+        self._local_print('Checking A matrix for numerical stability')
+        self._local_print(f"condition estimate: {cond:.2e}")
+        
+        # Rows with (close to) nothing on them
+        row_norms = np.asarray(abs(A).sum(axis=1)).ravel()
+        labels = self._unknown_labels()
+        empty = [labels[offset + i] 
+                 for i in np.flatnonzero(row_norms < 1e-12)]
+        for label in empty:
+            self._local_print(f"empty row: {label}")
+        
+        detail = (f"condition estimate {cond:.2e}" + 
+                  (f", empty rows: {empty}" if empty else ""))
+        
+        # Factors that produce inf / nan cannot solve anything
+        if not np.isfinite(cond):
+            raise ValueError(f"A in Ax=b is singular to working precision "
+                             f"({detail})")
+        
+        message = f"A in Ax=b is ill conditioned after equilibration ({detail})"
+        
+        return cond, message
+    
+    def _condition_estimate(self, A, lu, solver):
+        
+        n = A.shape[0]
+        if n == 0:
+            return 1.0
+        
+        # Probe the transposed solve first - backends without it skip
+        solver.solve_transpose(lu, np.zeros(n))
+        
+        # Row then column equilibration R A C, every row and column of the
+        # scaled matrix peaks at 1
+        def scale(M, d, axis):
+            d = np.expand_dims(d, axis)
+            return M.multiply(d).tocsr() if issparse(M) else M*d
+        
+        def flat(m):
+            return np.asarray(m.todense() if issparse(m) else m).ravel()
+        
+        scaled = abs(A)
+        r = flat(scaled.max(axis=1))
+        r = 1.0 / np.where(r > 0.0, r, 1.0)
+        scaled = scale(scaled, r, 1)
+        c = flat(scaled.max(axis=0))
+        c = 1.0 / np.where(c > 0.0, c, 1.0)
+        scaled = scale(scaled, c, 0)
+        
+        # (R A C)^-1 = C^-1 A^-1 R^-1
+        def solve(v):
+            v = np.ascontiguousarray(v.ravel()) / r
+            return solver.solve(lu, v) / c
+        
+        def solve_t(v):
+            v = np.ascontiguousarray(v.ravel()) / c
+            return solver.solve_transpose(lu, v) / r
+        
+        inv = LinearOperator((n, n), matvec=solve, rmatvec=solve_t, 
+                             dtype=float)
+        
+        with np.errstate(all='ignore'):
+            a_norm = float(flat(scaled.sum(axis=0)).max())
+            return a_norm * onenormest(inv)
+    
+    def _build_solver_state(self):
+        
+        # Threads of the previous topology's pool and solvers
+        self.close()
+        
+        # Solver backend, it decides dense or CSR assembly
+        self.solver = self._select_solver()
+        self.solver.reset()
+        
+        # Precompute assembly triplets for the new topology
+        self.engine = AssemblyEngine(self.plan, self.numerics,
+                                     sparse=self.solver.sparse)
+        self.factor_cache.capacity = self.numerics.factor_cache_size
+        self.factor_cache.clear()
+        self.matrix_warnings = []
+        self.low_rank = LowRankUpdater(self.engine, self._solve,
+                                       self._factor,
+                                       self.numerics.low_rank_max_rank)
+        
+        # Block systems for galvanically isolated islands
+        self.islands = self._build_islands()
+    
+    def _build_islands(self):
+        
+        plan = self.plan
+        if plan.num_islands < 2:
+            return []
+        
+        # Switch bits of the engine bitmask, in plan order
+        switch_branch = np.flatnonzero(plan.type_masks[ComponentType.SWITCH])
+        
+        islands = []
+        for i, (start, stop) in enumerate(plan.island_slices):
+            value_idx = np.flatnonzero((self.engine.rows >= start) & 
+                                       (self.engine.rows < stop))
+            switch_mask = sum(1 << k for k, br in enumerate(switch_branch)
+                              if plan.branch_island[br] == i)
             
-            vs.stamp(A, b,self.node_indices[n1], self.node_indices[n2], vs_ctx)
+            # Independent solver state per island (locked patterns differ)
+            islands.append(IslandSystem(i, start, stop, value_idx,
+                                        switch_mask,
+                                        copy.deepcopy(self.solver),
+                                        self.numerics.factor_cache_size))
+        
+        return islands
+    
+    def _select_solver(self):
+        
+        # Explicit choice on the network, then an autotune result for this
+        # topology (from autotune() or the autotune file), then numerics
+        choice = self.solver_choice
+        ordering = None
+        
+        if choice is None:
+            fingerprint = self.plan.fingerprint()
+            tuned = self.autotune_result
+            if tuned is None or tuned.fingerprint != fingerprint:
+                tuned = load_autotune(self.numerics.autotune_file, 
+                                      fingerprint)
             
-        return A, b
+            if tuned is not None:
+                choice, ordering = tuned.backend, tuned.ordering
+            else:
+                choice = self.numerics.solver_backend
+        
+        return build_solver(choice, self.numerics, self.plan.num_unknowns,
+                            ordering=ordering, 
+                            symmetric=self.plan.is_symmetric)
+    
+    def _bdf_event(self):
+        
+        # Switch states changed since the last step - the solution 
+        # derivatives jump, variable order BDF restarts at order 1
+        states = self.engine.switch_states()
+        event = self._bdf_switches is not None and states != self._bdf_switches
+        self._bdf_switches = states
+        if event:
+            self._bdf_order, self._bdf_steps = 1, 0
+            self._local_print('\tSwitch event - BDF restarted at order 1')
+        
+        return event
+    
+    def _bdf_select(self, control, history_t, history_x, fixed_dt=False):
+        """
+        Objective: Order of the next variable order BDF step, after an 
+        accepted one. Error norms at the orders next to the current one 
+        from the divided differences over the points since the last 
+        restart (local_truncation_error), the order allowing the longest 
+        step - or the smallest error on a given grid - wins 
+        (StepController.select_order).
+
+        Returns
+        -------
+        norms : Dictionary
+            Error norm estimate per candidate order.
+        """
+        
+        order = self._bdf_order
+        self._bdf_steps += 1
+        
+        norms = {}
+        for q in (order - 1, order, order + 1):
+            if 1 <= q <= self.numerics.bdf_max_order and \
+               len(history_t) >= q + 2:
+                error = local_truncation_error(history_t[-(q + 2):], 
+                                               history_x[-(q + 2):], q)
+                norms[q] = control.error_norm(error, history_x[-1], 
+                                              history_x[-2])
+        
+        if order in norms:
+            new = control.select_order(norms, order, self._bdf_steps, 
+                                       fixed_dt)
+            if new != order:
+                self._bdf_order, self._bdf_steps = new, 0
+        
+        return norms
+    
+    def _discretization_phase(self):
+        
+        # Coefficient set used by the reactive companion models
+        if self.default_dt:
+            return DiscretizationType.BACKWARD_EULER
+        return self._stamp_discretization()
+    
+    def _factor(self, A):
+        
+        # Refactorization, ordering / symbolic work reused by the backend
+        try:
+            return self.solver.refactor(A)
+        except RuntimeError as err:
+            # SuperLU reports exactly singular matrices as RuntimeError
+            raise ValueError(f"A in Ax=b is singular ({err})") from err
+    
 
     def _get_branch_data_list(self):
         
@@ -377,14 +1561,180 @@ class Network:
                                      dtype=float)
         sim_data.branch_i = np.zeros((steps, len(self.branch_list)), 
                                      dtype=float)
+        sim_data.solver_iterations = np.zeros(steps, dtype=np.int64)
+        sim_data.solver_residual = np.full(steps, np.nan)
+        sim_data.integration_order = np.zeros(steps, dtype=np.int64)
         
         return sim_data
     
+    def _integration_order(self):
+        
+        # Order of the step just taken (first step Backward Euler)
+        if self.default_dt:
+            return 1
+        if self.discretization == DiscretizationType.BDF_VARIABLE:
+            return self._bdf_order
+        return SCHEME_ERROR[self.discretization][0]
+    
+    def _land_events(self, input_driver, t, t_end, k=None, restart=False):
+        """
+        Objective: Step onto every switch edge in (t, t_end] 
+        (InputDriver.next_event) with the states just before it, the step 
+        after an edge restarts at Backward Euler. Edges closer than min_dt 
+        to t act from t, edges closer than min_dt to t_end are moved onto it.
+
+        Parameters
+        ----------
+        input_driver : InputDriver
+            Source and switch inputs.
+        t, t_end : Float
+            Interval of the grid step.
+        k : Integer, optional
+            Grid step, for vector driven inputs.
+        restart : Boolean, optional
+            The next step restarts at Backward Euler.
+
+        Returns
+        -------
+        t : Float
+            Time reached, the last edge landed on or the given t.
+        restart : Boolean
+            The step from t restarts at Backward Euler.
+        """
+        
+        min_dt = self.numerics.min_dt
+        t_search = t
+        while t < t_end:
+            event = input_driver.next_event(t_search, t_end, 
+                                            self.numerics.event_tol,
+                                            self.numerics.event_samples)
+            if event is None:
+                break
+            
+            t_event, t_left = event
+            if t_event - t < min_dt:
+                restart, t_search = True, t_event
+                continue
+            if t_end - t_event < min_dt:
+                t_event = t_end
+            
+            self._local_print(f'\tSwitch edge at t = {t_event}')
+            self.default_dt = self.default_dt or restart
+            input_driver.apply(self, t=t_event, k=k, state_time=t_left)
+            self._timestep(dt=t_event - t, stage_inputs=lambda lag: 
+                           input_driver.apply(self, t=t_event - lag, k=k, 
+                                              state_time=t_left))
+            self.default_dt = False
+            restart = True
+            t = t_search = t_event
+        
+        return t, restart
+    
     def _local_print(self, *args):
         
         if self.verbose:
             print(*args)
             
+    def _plan_is_current(self):
+        
+        # Internal resistances that cross zero change how a source is
+        # stamped (Norton / MNA row / fixed potential)
+        return (self.plan is not None and 
+                self.plan.version == self.topology_version and
+                self.plan.ground_node == self.ground_node and
+                self.plan.source_modes == 
+                self._source_modes(self._plan_sources()))
+            
+    def _multirate_partition(self, H, demoted):
+        
+        # Slow candidates by time constant against the macro step
+        plan = self.plan
+        ctx = StampContext(dt=H, 
+                           default_dt=False,
+                           discretization=self._stamp_discretization())
+        tau = time_constants(plan, ctx)
+        candidates = [k for k in np.flatnonzero(
+                          tau >= self.numerics.multirate_min_steps*H)
+                      if k not in demoted]
+        
+        part = MultiratePartition(plan, candidates)
+        fast = self._partition_network(part.fast_branches, 
+                                       part.fast_boundary)
+        slow = None
+        if len(part.slow_nodes):
+            slow = self._partition_network(part.slow_branches,
+                                           part.slow_boundary)
+        monitor = LocalErrorEstimate(
+            [plan.branch_list[k][2] for k in part.reactive],
+            self.discretization, self.numerics.multirate_rtol)
+        
+        return part, fast, slow, monitor
+    
+    def _hold_step(self, dt):
+        
+        # Latent step - reactive histories advance by dt with the states 
+        # held, so the next solve sees the elapsed time
+        for _, _, c_obj in self.plan.branch_list:
+            c_obj._store_lpv(dt)
+        self.default_dt = False
+    
+    @staticmethod
+    def _latency_inputs(net):
+        
+        # Source values and switch states driving a partition
+        values, switches = [], []
+        for _, _, c_obj in net.plan.branch_list:
+            comp = c_obj.component
+            if comp.ctype == ComponentType.VOLTAGE_SOURCE:
+                values.append(comp.ideal_params.ideal_voltage)
+            elif comp.ctype == ComponentType.CURRENT_SOURCE:
+                values.append(comp.ideal_params.ideal_current)
+            elif comp.ctype == ComponentType.SWITCH:
+                switches.append(comp.scond)
+        
+        return np.array(values, dtype=float), switches
+    
+    def _partition_network(self, branches, boundary):
+        
+        # Sub network sharing the component objects, the other partition
+        # enters through ideal sources on its interface nodes
+        plan = self.plan
+        net = Network(numerics=self.numerics,
+                      discretization=self.discretization,
+                      solver=copy.deepcopy(self.solver_choice))
+        net.ground_node = plan.ground_node
+        for ground in plan.island_grounds:
+            net.add_node(ground)
+        
+        members = set()
+        for k in branches:
+            c_obj = plan.branch_list[k][2]
+            net.add_component(c_obj.component.node1, c_obj.component.node2,
+                              c_obj)
+            members.add(id(c_obj))
+        
+        sources = []
+        for node, ground in boundary:
+            name = plan.node_list[node]
+            data = ComponentData(
+                name=f'{name}:boundary',
+                node1=plan.node_list[ground],
+                node2=name,
+                voltage=0.0,
+                current=0.0,
+                mode=CalculationMode.VOLTAGE,
+                ideal_params=IdealComponentData(ideal_voltage=0.0,
+                                                int_resistance=0.0))
+            sources.append(VoltageSource(data))
+            net.add_component(data.node1, data.node2, sources[-1])
+        
+        net.subcircuits = {name: inst for name, inst in 
+                           self.subcircuits.items() 
+                           if all(id(b) in members for b in inst.branches)}
+        net.compile()
+        
+        return net, sources
+    
     def _prune_isolated_nodes(self):
         
         # get isolated nodes
@@ -394,6 +1744,25 @@ class Network:
             self._local_print(f"\tWARNING - dropping isolated nodes: {iso_nodes}")
             self.graph.remove_nodes_from(iso_nodes)
     
+    def _restore_state(self, saved):
+        
+        # Component state before a rejected step
+        for comp, voltage, current, history in saved:
+            comp.voltage = voltage
+            comp.current = current
+            if history is not None:
+                comp.discrete_data = dataclasses.replace(history)
+    
+    def _save_state(self):
+        
+        comps = [c.component for _, _, c in self.plan.branch_list]
+        for instance in self.subcircuits.values():
+            comps.extend(c.component for c in instance.components)
+        
+        return [(comp, comp.voltage, comp.current, 
+                 None if comp.discrete_data is None else
+                 dataclasses.replace(comp.discrete_data)) for comp in comps]
+    
     def _set_mode(self, mode):
         self.mode = mode
         for _, _, data in self.graph.edges(data=True):
@@ -412,55 +1781,128 @@ class Network:
             else:
                 self.ground_node = nodes[0]
     
-    def _solve(self, A, b):
+    def _snap_dt_vec(self, dt_vec):
         
-        if issparse(A):
-            A = A.tocsr()
-            x = spsolve(A, b)
-        else:
-            x = np.linalg.solve(A, b)
+        # dts within dt_snap_rtol of the previous dt reuse it exactly
+        dt_vec = np.array(dt_vec, dtype=float)
+        rtol = self.numerics.dt_snap_rtol
         
-        return x
+        for k in range(1, len(dt_vec)):
+            if abs(dt_vec[k] - dt_vec[k-1]) <= rtol*dt_vec[k-1]:
+                dt_vec[k] = dt_vec[k-1]
+                
+        return dt_vec
+    
+    def _solve(self, lu, b):
+        
+        # Back substitution only, lu from _factor
+        if b.ndim == 2:
+            return self.solver.solve_many(lu, b)
+        
+        return self.solver.solve(lu, b)
+    
+    def _stamp_discretization(self):
+        
+        # Scheme seen by the companion models - a TR-BDF2 step is stamped 
+        # stage by stage, its trapezoidal stage outside of a step
+        if self._stage is not None:
+            return self._stage
+        if self.discretization == DiscretizationType.TR_BDF2:
+            return DiscretizationType.TRAPEZOIDAL
+        return self.discretization
+    
+    def _step_error(self, control, history_t, history_x, t, x, order,
+                    constant=None):
+        
+        # Weighted LTE norm of the step to t, 0 until the history is long
+        # enough for the estimate
+        if len(history_t) <= order:
+            return 0.0
+        
+        error = local_truncation_error(history_t[-(order + 1):] + [t],
+                                       history_x[-(order + 1):] + [x], order,
+                                       constant)
+        return control.error_norm(error, x, history_x[-1])
     
     def _store_data(self, x, dt):
         
-        # Store node voltages
-        for node, idx in self.node_indices.items():
-            self.node_voltages[node] = x[idx]
+        plan = self.plan
+        
+        # Node voltages, ground is not an unknown and sits at 0 V
+        node_v = np.zeros(plan.num_nodes, dtype=float)
+        solved = plan.node_unknown >= 0
+        node_v[solved] = x[plan.node_unknown[solved]]
+        node_v[plan.fixed_node] = self.engine.fixed_potentials()
+        self.engine.reconstruct(node_v)
+        
+        self.node_v = node_v
+        self.node_voltages = dict(zip(plan.node_list, node_v.tolist()))
         
         # Stamp Context
         ctx = StampContext(dt=dt, 
                            default_dt=self.default_dt,
-                           discretization=self.discretization)
+                           discretization=self._stamp_discretization(),
+                           bdf_order=self._bdf_order)
         
-        # Store voltage source currents 
-        for k, (_, _, vs) in enumerate(self.v_source_list):
-            
-            # Calculate voltage source index
-            vs_idx = self.num_nodes + k
+        # Store MNA voltage source currents 
+        for k, (_, _, vs) in enumerate(plan.v_source_list):
             
             # Update voltage source current
-            vs.post_solve(x[vs_idx], ctx)
-            
-        # Store voltage drops, currents for all components
-        for _, _, data in self.graph.edges(data=True):
+            vs_ctx = StampContext(dt=dt,
+                                  default_dt=self.default_dt,
+                                  discretization=
+                                  self._stamp_discretization(),
+                                  voltage_source_index=int(
+                                      plan.vs_unknown[k]))
+            vs.post_solve(x[plan.vs_unknown[k]], vs_ctx)
+        
+        # Voltage drop across every branch (node specific orientation)
+        branch_v = (node_v[plan.branch_n1] - node_v[plan.branch_n2]).tolist()
+        skip = set(plan.v_source_branch.tolist() + 
+                   plan.fixed_branch.tolist())
             
-            c_obj = data['component']
+        # Store voltage drops, currents for all components - Norton and
+        # current sources recover their current from the voltage drop
+        for k, (_, _, c_obj) in enumerate(plan.branch_list):
             
-            # skip voltage sources
-            if c_obj.source:
-                pass
-            else:
-                # Extract node specific orientation
-                n1 = c_obj.component.node1
-                n2 = c_obj.component.node2
-                
-                # Store voltage drop across component
-                voltage_new = self.node_voltages[n1] - self.node_voltages[n2]
-                
-                c_obj.post_solve(voltage_new, ctx)
+            # skip MNA and fixed potential voltage sources
+            if k not in skip:
+                c_obj.post_solve(branch_v[k], ctx)
+        
+        if len(plan.fixed_branch):
+            self._fixed_source_currents()
+        
+        # Subcircuit internals from their port voltages (a port joined to
+        # nothing else was pruned and floats at 0 V)
+        for instance in self.subcircuits.values():
+            instance.store([self.node_voltages.get(n, 0.0) for n in 
+                            instance.port_nodes], ctx)
+    
+    def _fixed_source_currents(self):
+        
+        # KCL at each fixed node - the source supplies whatever the other 
+        # branches draw from it
+        plan = self.plan
+        i = np.array([c.component.current for _, _, c in plan.branch_list],
+                     dtype=float)
+        i[plan.fixed_branch] = 0.0
+        leaving = (np.bincount(plan.branch_n1, weights=i, 
+                               minlength=plan.num_nodes) - 
+                   np.bincount(plan.branch_n2, weights=i, 
+                               minlength=plan.num_nodes))
+        
+        # Source current flows node1 -> node2, into the fixed node when it 
+        # is node2 (sign +1)
+        for k, node, sign in zip(plan.fixed_branch, plan.fixed_node, 
+                                 plan.fixed_sign):
+            plan.branch_list[k][2].component.current = sign*leaving[node]
                 
-    def _timestep(self, dt=None):
+    def _timestep(self, dt=None, stage_inputs=None):
+        
+        if (dt is not None and not self.default_dt and self._stage is None 
+            and self.discretization == DiscretizationType.TR_BDF2):
+            self._tr_bdf2_step(dt, stage_inputs)
+            return
         
         self._guard_dt(dt)
             
@@ -468,32 +1910,201 @@ class Network:
         
         # Update component state
         self._update_comps()
+        
+        # Internal resistances that crossed zero (RESISTANCE mode, edits) -
+        # restamp the sources, r_int <= 0 falls back to the ideal MNA row
+        if not self._plan_is_current():
+            self.compile()
 
-        # Generate A, b matrices
+        # Gather companion models, ground row / column pinned by the engine
         self._local_print('Generating A matrix, b vector')
-        A, b = self._create_Ab(dt)
+        ctx = StampContext(dt=dt,
+                           default_dt=self.default_dt,
+                           discretization=self._stamp_discretization(),
+                           bdf_order=self._bdf_order)
         
-        # Set ground
-        self._local_print('Setting ground node')
-        gnd_idx = self.node_indices[self.ground_node]
+        G, J, r_int, v_rise = self.engine.gather(ctx)
+        values = self.engine.triplet_values(G, r_int)
+        b = self.engine.build_b(G, J, v_rise)
         
-        A[gnd_idx, :] = 0.0
-        A[:, gnd_idx] = 0.0
+        # Every node is a reference or a fixed potential - nothing to solve
+        if self.engine.size == 0:
+            self._step_iterations, self._step_residual = 0, np.nan
+            self._store_data(b, dt)
+            self._report()
+            return
         
-        A[gnd_idx, gnd_idx] = 1.0
-        b[gnd_idx] = 0.0
-
-
-        # Check for matrix issues
-        self._check_matrix(A)
+        # Isolated islands - block by block
+        if self.islands:
+            x = self._solve_islands(values, b, dt)
+            self._local_print('Storing network data')
+            self._store_data(x, dt)
+            self._report()
+            return
+        
+        # Reuse the LU factorization while A is unchanged
+        phase_key = (dt, self._discretization_phase())
+        key = phase_key + (self.engine.switch_states(),)
+        lu = self.factor_cache.get(key, values)
+        x = None
+        
+        # Few component values moved - correct the base factorization
+        if lu is None and self.low_rank.max_rank > 0:
+            x = self.low_rank.solve(phase_key, G, r_int, b)
+        
+        if lu is None and x is None:
+            self._local_print('Factoring A matrix')
+            A = self.engine.build_A(values)
+            lu = self._factor(A)
+            
+            # Check for matrix issues
+            self._check_matrix(A, lu)
+            
+            self.factor_cache.put(key, values, lu)
+            
+            if self.low_rank.max_rank > 0:
+                self.low_rank.set_base(phase_key, lu, A, G, r_int)
         
         # Solve Ax = b
-        self._local_print('Solving Ax=b')
-        x = self._solve(A, b)
+        if x is None:
+            self._local_print('Solving Ax=b')
+            x = self._solve(lu, b)
+        
+        self._step_iterations = self.solver.last_iterations
+        self._step_residual = self.solver.last_residual
         
         # Store solved data to objects in graph / network
         self._local_print('Storing network data')
         self._store_data(x, dt)
+        self._report()
+    
+    def _tr_bdf2_step(self, dt, stage_inputs=None):
+        """
+        Objective: One TR-BDF2 step - a trapezoidal stage to the point 
+        TR_BDF2_GAMMA*dt into the step, then a BDF2 stage through the start 
+        and stage points to the end (variable step coefficients from the 
+        stored stage dt).
+
+        Parameters
+        ----------
+        dt : Float
+            Step size.
+        stage_inputs : Callable, optional
+            stage_inputs(lag) applies the inputs at lag before the end of 
+            the step. Without it the inputs at the end of the step are used 
+            for both stages.
+
+        Returns
+        -------
+        None.
+        """
+        
+        dt_tr = TR_BDF2_GAMMA*dt
+        try:
+            if stage_inputs is not None:
+                stage_inputs(dt - dt_tr)
+            self._stage = DiscretizationType.TRAPEZOIDAL
+            self._timestep(dt=dt_tr)
+            
+            if stage_inputs is not None:
+                stage_inputs(0.0)
+            self._stage = DiscretizationType.BDF2
+            self._timestep(dt=dt - dt_tr)
+        finally:
+            self._stage = None
+    
+    def _solve_islands(self, values, b, dt):
+        
+        phase = self._discretization_phase()
+        states = self.engine.switch_states()
+        x = np.empty(self.engine.size, dtype=float)
+        A = None
+        jobs = []
+        
+        for isl in self.islands:
+            s, e = isl.start, isl.stop
+            vals, b_i = values[isl.value_idx], b[s:e]
+            
+            # Inputs of the island did not change (or it has no unknowns) -
+            # keep its solution
+            if isl.size == 0:
+                continue
+            if isl.unchanged(vals, b_i):
+                isl.num_skipped += 1
+                x[s:e] = isl.last_x
+                continue
+            
+            key = (dt, phase, states & isl.switch_mask)
+            lu = isl.cache.get(key, vals)
+            
+            # Blocks are cut from the global A here, before any threads run
+            block = None
+            if lu is None:
+                if A is None:
+                    A = self.engine.build_A(values)
+                block = isl.block(A)
+                
+            jobs.append((isl, vals, b_i, key, lu, block))
+        
+        workers = self.numerics.island_workers
+        if workers > 1 and len(jobs) > 1:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=workers)
+            solved = list(self._executor.map(self._island_job, jobs))
+        else:
+            solved = [self._island_job(job) for job in jobs]
+        
+        iterations, residuals = 0, []
+        for (isl, *_), (x_i, check) in zip(jobs, solved):
+            self._record_check(check)
+            x[isl.start:isl.stop] = x_i
+            iterations += isl.solver.last_iterations
+            residuals.append(isl.solver.last_residual)
+        
+        residuals = [r for r in residuals if np.isfinite(r)]
+        self._step_iterations = iterations
+        self._step_residual = max(residuals) if residuals else np.nan
+        
+        return x
+    
+    def _island_job(self, job):
+        
+        isl, vals, b_i, key, lu, block = job
+        check = (None, None)
+        
+        if lu is None:
+            try:
+                lu = isl.solver.refactor(block)
+            except RuntimeError as err:
+                raise ValueError(f"A in Ax=b is singular on island "
+                                 f"{isl.index} ({err})") from err
+            
+            # Recorded by _solve_islands once the threads are done
+            check = self._matrix_check(block, lu, isl.solver, 
+                                       offset=isl.start)
+            isl.cache.put(key, vals, lu)
+        
+        x_i = isl.solver.solve(lu, b_i)
+        isl.store(vals, b_i, lu, x_i)
+        
+        return x_i, check
+    
+    def _reactive_states(self):
+        
+        # Capacitor voltages and inductor currents, subcircuit internals 
+        # included
+        comps = [c for _, _, c in self.plan.branch_list]
+        for instance in self.subcircuits.values():
+            comps.extend(instance.components)
+        
+        return np.array([c.component.current 
+                         if c.component.ctype == ComponentType.INDUCTOR 
+                         else c.component.voltage for c in comps
+                         if c.component.ctype in (ComponentType.CAPACITOR,
+                                                  ComponentType.INDUCTOR)],
+                        dtype=float)
+    
+    def _report(self):
         
         # Generate final node list
         if self.node_reporting:
@@ -506,15 +2117,33 @@ class Network:
             self._local_print('\nReporting Branch Data\n')
             self._local_print(self.branch_report)
 
+    def _unknown_labels(self):
+        
+        # Meaning of every row / column of the reduced A matrix
+        labels = [None]*self.plan.num_unknowns
+        
+        for node, idx in self.plan.node_indices.items():
+            if self.plan.node_unknown[idx] >= 0:
+                labels[self.plan.node_unknown[idx]] = f"Node {node}"
+                
+        for k, row in enumerate(self.plan.vs_unknown):
+            labels[row] = f"Voltage Source {self.plan.v_source_list[k]}"
+            
+        return labels
+    
     def _update_comps(self):
         
-        for _, _, data in self.graph.edges(data=True):
-                data['component'].update()
+        for _, _, c_obj in self.plan.branch_list:
+            c_obj.update()
+        for instance in self.subcircuits.values():
+            instance.update()
         
     def _write_step(self, sim_data: SimulationData, step: int):
         # nodes
-        for j, node in enumerate(self.node_list):
-            sim_data.node_v[step, j] = float(self.node_voltages[node])
+        sim_data.node_v[step, :] = self.node_v
+        sim_data.solver_iterations[step] = self._step_iterations
+        sim_data.solver_residual[step] = self._step_residual
+        sim_data.integration_order[step] = self._integration_order()
             
         for k, (_, _, c) in enumerate(self.branch_list):
             sim_data.branch_v[step, k] = float(c.component.voltage)
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Wed Oct 21 08:47:31 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built-in
+import numpy as np
+
+# Custom modules
+from enums.discretization_type import DiscretizationType
+
+# -----------------------------------------------------------------------------
+# Define functions
+# -----------------------------------------------------------------------------
+
+# Leading local truncation error constant of BDF order p, LTE = C h^(p+1)
+# x^(p+1)
+ERROR_CONSTANTS = {1: 1.0/2.0, 2: 2.0/9.0, 3: 3.0/22.0, 4: 12.0/125.0, 
+                   5: 10.0/137.0}
+
+# TR-BDF2 stage point as a fraction of the step - 2 - sqrt(2) gives the
+# trapezoidal and the BDF2 stage the same companion conductance
+TR_BDF2_GAMMA = float(2.0 - np.sqrt(2.0))
+
+# Order and error constant of each discretization scheme, variable order
+# BDF by its restart order
+SCHEME_ERROR = {
+    DiscretizationType.BACKWARD_EULER: (1, ERROR_CONSTANTS[1]),
+    DiscretizationType.BDF2: (2, ERROR_CONSTANTS[2]),
+    DiscretizationType.TRAPEZOIDAL: (2, 1.0/12.0),
+    DiscretizationType.TR_BDF2: (2, (3*TR_BDF2_GAMMA**2 - 
+                                     4*TR_BDF2_GAMMA + 2) / 
+                                    (12*(2 - TR_BDF2_GAMMA))),
+    DiscretizationType.BDF_VARIABLE: (1, ERROR_CONSTANTS[1])}
+
+def local_truncation_error(t, x, order, constant=None):
+    """
+    Objective: Local truncation error C h^(p+1) x^(p+1) of the last step.
+    The (p + 1)th divided difference over the points is the distance of
+    the new state from the polynomial predictor through the history. That
+    distance holds the predictor and the corrector error and is split
+    between them (Milne's device).
+
+    Parameters
+    ----------
+    t : Float, Array
+        order + 2 time points, the last one is the new step.
+    x : Float, Array
+        States at t, one row per time point.
+    order : Integer
+        Order p of the scheme that took the step.
+    constant : Float, optional
+        Error constant C of the scheme, defaults to BDF order p.
+
+    Returns
+    -------
+    Float, Array
+        Absolute error estimate per state.
+    """
+
+    t = np.asarray(t, dtype=float)
+    dd = np.array(x, dtype=float)
+    for level in range(1, order + 2):
+        dd = (dd[1:] - dd[:-1]) / (t[level:] - t[:-level])[:, None]
+
+    # Predictor error x^(p+1) / (p+1)! prod(t_new - t_j), corrector error
+    # C h^(p+1) x^(p+1)
+    h = t[-1] - t[-2]
+    factorial = np.prod(np.arange(1, order + 2))
+    if constant is None:
+        constant = ERROR_CONSTANTS[order]
+    corrector_coef = constant*h**(order + 1)
+    predictor_coef = np.prod(t[-1] - t[:-1]) / factorial
+    distance = np.abs(dd[0])*np.prod(t[-1] - t[:-1])
+
+    return corrector_coef*distance / (corrector_coef + predictor_coef)
+
+# -----------------------------------------------------------------------------
+# Define classes
+# -----------------------------------------------------------------------------
+
+class StepController:
+    """
+    Accept / reject decision and next step size from a weighted error norm
+    max(err / (atol + rtol |x|)). Rejected steps shrink, accepted steps
+    keep dt unless it can grow by grow_above or more - multistep histories
+    are cheapest on a constant dt.
+    """
+
+    def __init__(self, rtol, atol, dt_min, dt_max, safety=0.9,
+                 max_growth=2.0, max_shrink=0.2, grow_above=1.5):
+
+        self.rtol = rtol
+        self.atol = atol
+        self.dt_min = dt_min
+        self.dt_max = dt_max
+        self.safety = safety
+        self.max_growth = max_growth
+        self.max_shrink = max_shrink
+        self.grow_above = grow_above
+
+    def error_norm(self, error, x_new, x_old):
+
+        if len(error) == 0:
+            return 0.0
+
+        scale = self.atol + self.rtol*np.maximum(np.abs(x_new),
+                                                 np.abs(x_old))
+        return float(np.max(error / scale))
+
+    def factor(self, norm, order):
+
+        # Step size ratio that would put the error on the tolerance
+        if norm <= 0.0:
+            return self.max_growth
+        return float(np.clip(self.safety*norm**(-1.0/(order + 1)),
+                             self.max_shrink, self.max_growth))
+
+    def next_dt(self, dt, norm, order):
+        """
+        Objective: Step after an attempt with error norm `norm`.
+
+        Returns
+        -------
+        accepted : Boolean
+            Attempt is kept (always at dt_min).
+        dt_new : Float
+            Next step size, within [dt_min, dt_max].
+        """
+
+        factor = self.factor(norm, order)
+        accepted = norm <= 1.0 or dt <= self.dt_min*(1 + 1e-12)
+
+        if accepted and factor < self.grow_above:
+            factor = 1.0
+
+        return accepted, float(np.clip(dt*factor, self.dt_min, self.dt_max))
+    
+    def select_order(self, norms, order, steps_at_order, fixed_dt=False):
+        """
+        Objective: Order for the next variable order BDF step - the one whose
+        error estimate allows the longest step, or on a fixed grid the one 
+        with the smallest error. Raising the order waits for order + 1 steps 
+        at the current one, so the higher difference is resolved by the 
+        history.
+
+        Parameters
+        ----------
+        norms : Dictionary
+            Error norm estimate per candidate order (order - 1 .. order + 1,
+            as far as the history allows). Must hold `order`.
+        order : Integer
+            Order of the last step.
+        steps_at_order : Integer
+            Accepted steps taken at `order`.
+        fixed_dt : Boolean, optional
+            Step sizes are given (Network.solve).
+
+        Returns
+        -------
+        Integer
+            Next order.
+        """
+        
+        def merit(q):
+            if fixed_dt:
+                return -norms[q]
+            return np.inf if norms[q] <= 0.0 else norms[q]**(-1.0/(q + 1))
+        
+        best = order
+        for q in sorted(norms):
+            if q > order and steps_at_order < order + 1:
+                continue
+            if merit(q) > merit(best):
+                best = q
+        
+        return best
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 18:21:44 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Custom modules
+from enums.component_type import ComponentType
+
+# -----------------------------------------------------------------------------
+# Graph based singularity checks - run once per topology
+# -----------------------------------------------------------------------------
+
+class UnionFind:
+    """
+    Disjoint sets over the graph nodes - path halving, union by size
+    """
+
+    def __init__(self, items):
+
+        self.parent = {n: n for n in items}
+        self.size = dict.fromkeys(self.parent, 1)
+
+    def find(self, n):
+
+        parent = self.parent
+        while parent[n] != n:
+            parent[n] = parent[parent[n]]
+            n = parent[n]
+
+        return n
+
+    def union(self, a, b):
+
+        # False when a and b were already joined
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+
+        return True
+
+
+def structure_edges(graph):
+    """
+    Objective: One pass over the graph edges, shared by the checks below.
+
+    Returns
+    -------
+    list of (node1, node2, key, component)
+    """
+
+    return [(n1, n2, key, d['component'].component) for n1, n2, key, d in
+            graph.edges(keys=True, data=True)]
+
+
+def voltage_source_loops(graph, edges=None):
+    """
+    Objective: Loops made only of ideal (zero internal resistance) voltage
+    sources. KVL around the loop fixes a sum of source voltages, the source
+    currents are undetermined and A is singular.
+
+    Returns
+    -------
+    list of list of String
+        Component names around every independent loop.
+    """
+
+    def ideal_source(c):
+        return (c.ctype == ComponentType.VOLTAGE_SOURCE and
+                c.ideal_params is not None and
+                (c.ideal_params.int_resistance is None or
+                 c.ideal_params.int_resistance <= 0))
+
+    if edges is None:
+        edges = structure_edges(graph)
+
+    # Union-find over the sources - an edge joining two nodes the source
+    # forest already connects closes a loop
+    sets = UnionFind(graph.nodes)
+    forest = {}
+    loops = []
+
+    for n1, n2, key, c in edges:
+        if not ideal_source(c):
+            continue
+
+        if n1 == n2:
+            loops.append([key])
+        elif sets.union(n1, n2):
+            forest.setdefault(n1, []).append((n2, key))
+            forest.setdefault(n2, []).append((n1, key))
+        else:
+            loops.append(sorted(_forest_path(forest, n1, n2) + [key]))
+
+    return loops
+
+
+def _forest_path(forest, start, end):
+
+    # Source names along the tree path - only walked for a loop found
+    previous = {start: None}
+    queue = [start]
+    for node in queue:
+        if node == end:
+            break
+        for other, key in forest.get(node, ()):
+            if other not in previous:
+                previous[other] = (node, key)
+                queue.append(other)
+
+    names = []
+    while previous[end] is not None:
+        end, key = previous[end]
+        names.append(key)
+
+    return names
+
+
+def cut_sets(graph, grounds, ctypes, edges=None):
+    """
+    Objective: Groups of nodes joined to the part of their island holding
+    the island reference only through components of the given types.
+
+    Returns
+    -------
+    list of list of String
+        Names of the components crossing every cut.
+    """
+
+    if edges is None:
+        edges = structure_edges(graph)
+
+    # Nodes joined by everything but the cut component types
+    sets = UnionFind(graph.nodes)
+    for n1, n2, _, c in edges:
+        if c.ctype not in ctypes:
+            sets.union(n1, n2)
+
+    grounded = {sets.find(g) for g in grounds if g in sets.parent}
+    crossing = {}
+    for n1, n2, _, c in edges:
+        r1, r2 = sets.find(n1), sets.find(n2)
+        if r1 == r2:
+            continue
+        for root in (r1, r2):
+            if root not in grounded:
+                crossing.setdefault(root, []).append(c.name)
+
+    # Groups in node order
+    roots = dict.fromkeys(sets.find(n) for n in graph.nodes)
+
+    return [sorted(crossing[r]) for r in roots if r in crossing]
@@ -0,0 +1,342 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 11:21:05 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built-in
+import copy
+import networkx as nx
+import numpy as np
+
+# Custom modules
+from components.subcircuit_branch import SubcircuitBranch
+from data_classes.component_data import ComponentData
+from data_classes.port_reduction import PortReduction
+from data_classes.stamp_context import StampContext
+from enums.component_type import ComponentType
+from enums.discretization_type import DiscretizationType
+from networks.factorization_cache import FactorizationCache
+from solvers.cholesky_solver import DenseCholeskySolver
+
+# -----------------------------------------------------------------------------
+# Define classes
+# -----------------------------------------------------------------------------
+
+class Subcircuit:
+    """
+    Reusable circuit definition that reaches the outside world only through
+    its ports - a ground connection is one more port. Instances added to a
+    Network see the internal nodes condensed onto the ports: a port
+    admittance from the Schur (Kron) complement plus history currents. The
+    reduction depends only on the component values, dt and the
+    discretization scheme, so it is computed once per (dt, scheme) and
+    shared by every instance of the definition.
+
+    Internals are two terminal conductances (resistors, capacitors,
+    inductors, voltage sources with internal resistance) and current
+    sources. Switches and ideal voltage sources would make the port
+    admittance state dependent or singular and are rejected.
+    """
+
+    def __init__(self, name: str, ports, cache_size: int = 8):
+
+        self.name = name
+        self.ports = tuple(ports)
+
+        self.graph = nx.MultiGraph()
+        self.graph.add_nodes_from(self.ports)
+
+        # Port reductions per (dt, phase), validated against the internal
+        # conductances they were computed from
+        self.cache = FactorizationCache(capacity=cache_size)
+        self._layout = None
+
+    def add_component(self, n1, n2, component):
+
+        comp = component.component
+        if comp.ctype == ComponentType.SWITCH:
+            raise ValueError(f'Error: Subcircuit {self.name} cannot hold '
+                             f'switch {comp.name}')
+        if (comp.ctype == ComponentType.VOLTAGE_SOURCE and
+            (comp.ideal_params is None or
+             comp.ideal_params.int_resistance is None or
+             comp.ideal_params.int_resistance <= 0)):
+            raise ValueError(f'Error: Subcircuit {self.name} needs internal '
+                             f'resistance on voltage source {comp.name}')
+
+        # Overwrite node names with provided nodes
+        comp.node1 = n1
+        comp.node2 = n2
+
+        self.graph.add_edge(n1, n2, key=comp.name, component=component)
+        self._layout = None
+
+    def instantiate(self, name: str, port_nodes):
+        """
+        Objective: Independent copy of the internals (own history state)
+        wired to network nodes.
+
+        Parameters
+        ----------
+        name : String
+            Instance name, prefixes the internal component and node names.
+        port_nodes : Dictionary
+            Network node of every port.
+
+        Returns
+        -------
+        SubcircuitInstance
+        """
+
+        missing = [p for p in self.ports if p not in port_nodes]
+        if missing:
+            raise ValueError(f'Error: Ports {missing} of subcircuit '
+                             f'{self.name} are not connected')
+
+        return SubcircuitInstance(self, name,
+                                  tuple(port_nodes[p] for p in self.ports))
+
+    def layout(self):
+        """
+        Objective: Node numbering (ports first), component incidence and the
+        port pairs of every internal group, built once per definition.
+        """
+
+        if self._layout is not None:
+            return self._layout
+
+        nodes = list(self.ports) + [n for n in self.graph.nodes
+                                    if n not in self.ports]
+        index = {n: k for k, n in enumerate(nodes)}
+        comps = [d['component'] for _, _, d in
+                 self.graph.edges(data=True)]
+        n1 = np.array([index[c.component.node1] for c in comps],
+                      dtype=np.int64)
+        n2 = np.array([index[c.component.node2] for c in comps],
+                      dtype=np.int64)
+
+        # Groups joined by conductances - each needs a port to be solvable
+        # and is a Laplacian block, so its port admittance is the sum of
+        # pairwise conductances
+        conductive = nx.Graph()
+        conductive.add_nodes_from(nodes)
+        conductive.add_edges_from(
+            (c.component.node1, c.component.node2) for c in comps
+            if c.component.ctype != ComponentType.CURRENT_SOURCE)
+        group = {}
+        pairs, lead = [], []
+        for g, members in enumerate(nx.connected_components(conductive)):
+            ports = [index[p] for p in self.ports if p in members]
+            if not ports:
+                raise ValueError(f'Error: Nodes {sorted(members)} of '
+                                 f'subcircuit {self.name} reach no port')
+            group.update((n, g) for n in members)
+            for i, p in enumerate(ports):
+                for q in ports[i + 1:]:
+                    pairs.append((p, q))
+                    lead.append(p == ports[0])
+
+        # Current sources stay within a group, injections then balance
+        for c in comps:
+            if (c.component.ctype == ComponentType.CURRENT_SOURCE and
+                group[c.component.node1] != group[c.component.node2]):
+                raise ValueError(f'Error: Current source {c.component.name}'
+                                 f' bridges separate parts of subcircuit '
+                                 f'{self.name}')
+
+        pairs = np.array(pairs, dtype=np.int64).reshape(-1, 2)
+        self._layout = dict(nodes=nodes, components=comps, n1=n1, n2=n2,
+                            pair_p=pairs[:, 0], pair_q=pairs[:, 1],
+                            pair_lead=np.array(lead, dtype=bool))
+
+        return self._layout
+
+    def reduce(self, key, G):
+        """
+        Objective: Port reduction for the internal conductances G, cached
+        per key = (dt, phase).
+
+        Returns
+        -------
+        PortReduction
+        """
+
+        reduction = self.cache.get(key, G)
+        if reduction is not None:
+            return reduction
+
+        layout = self.layout()
+        n, k = len(layout['nodes']), len(self.ports)
+        n1, n2 = layout['n1'], layout['n2']
+
+        A = np.zeros((n, n))
+        np.add.at(A, (n1, n1), G)
+        np.add.at(A, (n2, n2), G)
+        np.add.at(A, (n1, n2), -G)
+        np.add.at(A, (n2, n1), -G)
+
+        # Z = inv(A_ii) A_ip, A_ii is symmetric positive definite once the
+        # ports are held
+        solver, factor = DenseCholeskySolver(), None
+        if n > k:
+            factor = solver.factor(A[k:, k:])
+            Z = solver.solve_many(factor, A[k:, :k])
+            Y = A[:k, :k] - A[:k, k:] @ Z
+        else:
+            Z = np.zeros((0, k))
+            Y = A[:k, :k]
+
+        reduction = PortReduction(
+            admittance=Y,
+            coupling=Z,
+            factor=factor,
+            solver=solver,
+            pair_g=-Y[layout['pair_p'], layout['pair_q']])
+        self.cache.put(key, G.copy(), reduction)
+
+        return reduction
+
+
+class SubcircuitInstance:
+    """
+    One placement of a Subcircuit. The network only sees its port pair
+    branches. Internal voltages are recovered from the port voltages after
+    every solve when the internals carry history (capacitors, inductors),
+    otherwise only when the instance is probed.
+    """
+
+    def __init__(self, definition: Subcircuit, name: str, port_nodes):
+
+        self.definition = definition
+        self.name = name
+        self.port_nodes = port_nodes
+
+        layout = definition.layout()
+        self._layout = layout
+        num_ports = len(definition.ports)
+        outer = {k: node for k, node in enumerate(port_nodes)}
+
+        # Own copy of the internals - history state is per instance
+        self.components = copy.deepcopy(layout['components'])
+        for c, a, b in zip(self.components, layout['n1'], layout['n2']):
+            c.component.name = f'{name}.{c.component.name}'
+            c.component.node1 = outer.get(a, f"{name}.{layout['nodes'][a]}")
+            c.component.node2 = outer.get(b, f"{name}.{layout['nodes'][b]}")
+
+        self.stateful = any(c.component.ctype in (ComponentType.CAPACITOR,
+                                                  ComponentType.INDUCTOR)
+                            for c in self.components)
+
+        # One branch per port pair
+        self.branches = []
+        for k, (p, q) in enumerate(zip(layout['pair_p'], layout['pair_q'])):
+            data = ComponentData(
+                name=(f"{name}:{definition.ports[p]}-"
+                      f"{definition.ports[q]}"),
+                node1=port_nodes[p],
+                node2=port_nodes[q],
+                voltage=0.0,
+                current=0.0,
+                resistance=None,
+                ctype=ComponentType.SUBCIRCUIT)
+            self.branches.append(SubcircuitBranch(data, self, k))
+
+        self.num_ports = num_ports
+        self.reduction = None # PortReduction of the last step
+        self.internal_v = None
+        self._pair = None
+        self._last = None
+        self._port_v = None
+
+    def invalidate(self):
+        self._pair = None
+
+    def update(self):
+        # Internals take their step start state from the last store(), like
+        # network branches - the port reduction of that step is stale
+        for c in self.components:
+            c.update()
+        self.invalidate()
+
+    def companion(self, ctx: StampContext):
+        """
+        Objective: Conductance and history current of every port pair
+        branch for the present internal state.
+        """
+
+        if self._pair is not None:
+            return self._pair
+
+        layout, k = self._layout, self.num_ports
+        G, J = np.array([c.companion(ctx) for c in self.components],
+                        dtype=float).reshape(-1, 2).T
+
+        phase = (DiscretizationType.BACKWARD_EULER if ctx.default_dt
+                 else ctx.discretization)
+        reduction = self.definition.reduce((ctx.dt, phase), G)
+
+        # History currents leave n1, enter n2 - condensed onto the ports
+        n = len(layout['nodes'])
+        b = (np.bincount(layout['n2'], weights=J, minlength=n) -
+             np.bincount(layout['n1'], weights=J, minlength=n))
+        c = b[:k] - reduction.coupling.T @ b[k:]
+
+        # Injections of a group sum to zero - the lead port's share is
+        # carried by the branches leaving it
+        J_pair = np.where(layout['pair_lead'], c[layout['pair_q']], 0.0)
+
+        self.reduction = reduction
+        self._last = (b, ctx)
+        self._pair = (reduction.pair_g, J_pair)
+
+        return self._pair
+
+    def store(self, port_v, ctx: StampContext):
+        # Port voltages of the last solve, internals with history are
+        # rebuilt from them and post_solve()d every step
+        self._port_v = np.asarray(port_v, dtype=float)
+        self.internal_v = None
+
+        if self.stateful:
+            self.probe()
+
+    def probe(self):
+        """
+        Objective: Internal node voltages of the last solve; stores the
+        voltage and current of every internal component.
+
+        Returns
+        -------
+        Dictionary
+            Voltage of every subcircuit node (definition names).
+        """
+
+        if self._port_v is None:
+            raise ValueError(f'Error: Subcircuit instance {self.name} has '
+                             f'not been solved')
+
+        layout, k = self._layout, self.num_ports
+
+        if self.internal_v is None:
+            reduction = self.reduction
+            b, ctx = self._last
+
+            v = np.empty(len(layout['nodes']))
+            v[:k] = self._port_v
+            if reduction.factor is not None:
+                v[k:] = (reduction.solver.solve(reduction.factor, b[k:]) -
+                         reduction.coupling @ self._port_v)
+
+            branch_v = v[layout['n1']] - v[layout['n2']]
+            for c, v_k in zip(self.components, branch_v.tolist()):
+                c.post_solve(v_k, ctx)
+
+            self.internal_v = v
+
+        return dict(zip(layout['nodes'], self.internal_v.tolist()))
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 08:37:52 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built-in
+import numpy as np
+
+# -----------------------------------------------------------------------------
+# Define class
+# -----------------------------------------------------------------------------
+
+class TopologyReduction:
+    """
+    Series / parallel reduction of the conductance branches, worked out once
+    per topology. Internal nodes joined to at most two neighbours only
+    through conductances are eliminated one after another: the branches to
+    each neighbour add up in parallel and the two sides merge in series into
+    one equivalent edge between the neighbours. Repeating this collapses
+    chains, banks and nested series-parallel sections.
+
+    The reduction acts on the companion model (G, J) of every branch, so it
+    is exact for any mix of resistors, switches, capacitors, inductors and
+    Norton sources and is redone numerically at every timestep. The
+    eliminated node voltages are recovered after the solve in reverse
+    elimination order, every original component then stores its own
+    voltage and current.
+    """
+
+    def __init__(self, num_nodes: int, branch_n1, branch_n2, protected):
+        """
+        Parameters
+        ----------
+        num_nodes : Integer, Scalar
+            Number of nodes in the network.
+        branch_n1, branch_n2 : Integer, Vector
+            Terminal nodes of the conductance branches, in engine order.
+            Current flows n1 -> n2 as G*(v1 - v2) + J.
+        protected : Iterable of Integer
+            Nodes that must stay - references, fixed potentials and the
+            terminals of anything that is not a conductance.
+        """
+
+        self.num_branches = len(branch_n1)
+        edge_n1 = [int(n) for n in branch_n1]
+        edge_n2 = [int(n) for n in branch_n2]
+        protected = set(int(n) for n in protected)
+
+        # Neighbour -> incident edge ids of every node, self loops do not
+        # enter A and are left out
+        adjacency = [dict() for _ in range(num_nodes)]
+        for e, (n1, n2) in enumerate(zip(edge_n1, edge_n2)):
+            if n1 != n2:
+                adjacency[n1].setdefault(n2, []).append(e)
+                adjacency[n2].setdefault(n1, []).append(e)
+
+        def reducible(n):
+            return n not in protected and 0 < len(adjacency[n]) <= 2
+
+        # Elimination steps (x, a, b, a side edges, b side edges, new edge)
+        # with b = -1 for a dangling node, edge signs +1 when oriented away
+        # from x
+        steps = []
+        eliminated = np.zeros(num_nodes, dtype=bool)
+        queue = [n for n in range(num_nodes) if reducible(n)]
+
+        while queue:
+            x = queue.pop()
+            if eliminated[x] or not reducible(x):
+                continue
+
+            nbrs = sorted(adjacency[x])
+            sides = [[(e, 1.0 if edge_n1[e] == x else -1.0)
+                      for e in adjacency[x][n]] for n in nbrs]
+
+            for n in nbrs:
+                del adjacency[n][x]
+            adjacency[x] = {}
+            eliminated[x] = True
+
+            if len(nbrs) == 2:
+                # Series equivalent a -> b
+                a, b = nbrs
+                new = len(edge_n1)
+                edge_n1.append(a)
+                edge_n2.append(b)
+                adjacency[a].setdefault(b, []).append(new)
+                adjacency[b].setdefault(a, []).append(new)
+                steps.append((x, a, b, sides[0], sides[1], new))
+            else:
+                steps.append((x, nbrs[0], -1, sides[0], [], -1))
+
+            queue.extend(nbrs)
+
+        # Edges still incident to two kept nodes are stamped
+        alive = np.zeros(len(edge_n1), dtype=bool)
+        for n in range(num_nodes):
+            for edges in adjacency[n].values():
+                alive[edges] = True
+
+        self.steps = steps
+        self.edge_n1 = np.asarray(edge_n1, dtype=np.int64)
+        self.edge_n2 = np.asarray(edge_n2, dtype=np.int64)
+        self.surviving = np.flatnonzero(alive)
+        self.eliminated = np.flatnonzero(eliminated)
+
+    @property
+    def num_eliminated(self):
+        return len(self.eliminated)
+
+    def surviving_nodes(self):
+        # Terminal nodes of the equivalent edges that reach A
+        return self.edge_n1[self.surviving], self.edge_n2[self.surviving]
+
+    def apply(self, G, J):
+        """
+        Objective: Equivalent companion models of the surviving edges
+
+        Parameters
+        ----------
+        G, J : Float, Vector
+            Companion model of every conductance branch, engine order.
+
+        Returns
+        -------
+        G_red, J_red : Float, Vector
+            Companion model of every surviving edge.
+        trace : list of tuple
+            (G_xa, J_xa, G_xb, J_xb) of every step, for reconstruct().
+        """
+
+        G_all = G.tolist() + [0.0]*len(self.steps)
+        J_all = J.tolist() + [0.0]*len(self.steps)
+        trace = []
+
+        for _, _, _, side_a, side_b, new in self.steps:
+
+            # Parallel branches towards each neighbour, current leaving x
+            g_a = sum(G_all[e] for e, _ in side_a)
+            j_a = sum(s*J_all[e] for e, s in side_a)
+            g_b = sum(G_all[e] for e, _ in side_b)
+            j_b = sum(s*J_all[e] for e, s in side_b)
+            trace.append((g_a, j_a, g_b, j_b))
+
+            # KCL at x eliminates v_x - series edge a -> b
+            if new >= 0:
+                g_sum = g_a + g_b
+                G_all[new] = g_a*g_b/g_sum
+                J_all[new] = (g_a*j_b - g_b*j_a)/g_sum
+
+        G_all = np.asarray(G_all)
+        J_all = np.asarray(J_all)
+
+        return G_all[self.surviving], J_all[self.surviving], trace
+
+    def reconstruct(self, node_v, trace):
+        """
+        Objective: Fill in the eliminated node voltages, in place, from the
+        kept ones and the trace of the matching apply().
+        """
+
+        for (x, a, b, *_), (g_a, j_a, g_b, j_b) in zip(reversed(self.steps),
+                                                      reversed(trace)):
+            if b < 0:
+                # Dangling - no current through the branches to a
+                node_v[x] = node_v[a] - j_a/g_a
+            else:
+                node_v[x] = ((g_a*node_v[a] + g_b*node_v[b] - j_a - j_b) /
+                             (g_a + g_b))
+
+        return node_v
@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 17:12:36 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built-in
+import numpy as np
+from scipy.sparse import coo_matrix, csc_matrix
+from scipy.sparse.csgraph import dijkstra, reverse_cuthill_mckee
+from scipy.sparse.linalg import splu
+
+# -----------------------------------------------------------------------------
+# Structure of A
+# -----------------------------------------------------------------------------
+
+ORDERINGS = ('rcm', 'mindegree', 'none')
+
+def structure_matrix(size, g_n1, g_n2, vs_n1, vs_n2, vs_row):
+    """
+    Objective: Symmetric nonzero pattern of the MNA matrix (diagonal
+    included) from the unknown index of every two terminal conductance and
+    voltage source. Terminals on ground carry index -1 and are skipped.
+
+    Returns
+    -------
+    S : csr_matrix
+        size by size pattern with unit entries.
+    """
+
+    rows = [np.arange(size), g_n1, g_n2, vs_row, vs_row, vs_n1, vs_n2]
+    cols = [np.arange(size), g_n2, g_n1, vs_n1, vs_n2, vs_row, vs_row]
+
+    rows = np.concatenate([np.asarray(r, dtype=np.int64) for r in rows])
+    cols = np.concatenate([np.asarray(c, dtype=np.int64) for c in cols])
+    keep = (rows >= 0) & (cols >= 0)
+
+    S = coo_matrix((np.ones(np.count_nonzero(keep)),
+                    (rows[keep], cols[keep])), shape=(size, size)).tocsr()
+    S.data[:] = 1.0
+
+    return S
+
+
+def order_unknowns(S, method: str = 'rcm'):
+    """
+    Objective: Fill reducing symmetric permutation of the unknowns.
+
+    Parameters
+    ----------
+    S : csr_matrix
+        Symmetric pattern from structure_matrix().
+    method : String
+        'rcm' (reverse Cuthill-McKee), 'mindegree' (SuperLU multiple 
+        minimum degree) or 'none'.
+
+    Returns
+    -------
+    perm : Integer, Vector
+        perm[k] is the original unknown placed at position k.
+    """
+
+    if method == 'none' or S.shape[0] == 0:
+        return np.arange(S.shape[0])
+    if method == 'rcm':
+        return np.asarray(reverse_cuthill_mckee(S, symmetric_mode=True),
+                          dtype=np.int64)
+    if method == 'mindegree':
+        return minimum_degree(S)
+
+    raise ValueError(f"Unknown unknown ordering '{method}', expected one of "
+                     f"{ORDERINGS}")
+
+
+def minimum_degree(S):
+    """
+    Objective: Minimum degree elimination order on the graph of S - 
+    SuperLU's multiple minimum degree on S + S^T, read off the column 
+    permutation of a factorization of a diagonally dominant matrix with 
+    the pattern of S. Without pivoting the column order is the 
+    elimination order. Runs in compiled code, once per compile.
+    """
+
+    lu = splu(_dominant(S), permc_spec='MMD_AT_PLUS_A',
+              diag_pivot_thresh=0.0, options={'SymmetricMode': True})
+
+    # A Pc = A[:, argsort(perm_c)]
+    return np.argsort(lu.perm_c).astype(np.int64)
+
+
+def _dominant(S):
+
+    # Diagonally dominant values on the pattern of S - no pivoting
+    A = csc_matrix(S, dtype=float, copy=True)
+    A.data[:] = -1.0
+    A.setdiag(np.asarray(abs(A).sum(axis=1)).ravel() + 1.0)
+
+    return A
+
+# -----------------------------------------------------------------------------
+# Domain partitioning
+# -----------------------------------------------------------------------------
+
+def partition_unknowns(S, num_parts: int, interface=None):
+    """
+    Objective: Split the unknowns into num_parts subdomains that only touch
+    each other through a set of interface unknowns (bordered block
+    diagonal form). The largest subdomain is bisected until num_parts
+    exist - a breadth first level structure from a pseudo-peripheral
+    unknown is cut at its median level, that level becomes interface.
+
+    Parameters
+    ----------
+    S : csr_matrix
+        Symmetric pattern of A.
+    num_parts : Integer
+        Number of subdomains wanted, fewer are returned when a subdomain
+        cannot be split.
+    interface : Integer, Vector, optional
+        Unknowns forced onto the interface.
+
+    Returns
+    -------
+    part : Integer, Vector
+        Subdomain of every unknown, -1 on the interface.
+    """
+
+    n = S.shape[0]
+    is_sep = np.zeros(n, dtype=bool)
+    if interface is not None:
+        is_sep[np.asarray(interface, dtype=np.int64)] = True
+
+    parts = [np.flatnonzero(~is_sep)]
+    while len(parts) < num_parts:
+        parts.sort(key=len)
+        left, sep, right = _bisect(S, parts[-1])
+        if not len(left) or not len(right):
+            break
+
+        parts.pop()
+        is_sep[sep] = True
+        parts += [left, right]
+
+    part = np.full(n, -1, dtype=np.int64)
+    for k, nodes in enumerate(p for p in parts if len(p)):
+        part[nodes] = k
+
+    return part
+
+
+def _bisect(S, nodes):
+
+    # Level structure of the sub graph, rooted at the far end of a second
+    # sweep (pseudo-peripheral) so the levels are narrow
+    empty = np.zeros(0, dtype=np.int64)
+    if len(nodes) < 3:
+        return empty, empty, nodes
+
+    sub = S[nodes][:, nodes]
+    dist = dijkstra(sub, unweighted=True, indices=0)
+    reached = np.isfinite(dist)
+    dist = dijkstra(sub, unweighted=True,
+                    indices=int(np.argmax(np.where(reached, dist, -1))))
+    reached = np.isfinite(dist)
+
+    # Disconnected - the component of the root against the rest
+    depth = int(dist[reached].max())
+    if depth < 2:
+        if reached.all():
+            return empty, empty, nodes
+        return nodes[reached], empty, nodes[~reached]
+
+    # Median level is the separator, edges only join adjacent levels
+    levels = dist[reached].astype(np.int64)
+    cum = np.cumsum(np.bincount(levels))
+    cut = int(np.clip(np.searchsorted(cum, len(nodes) / 2), 1, depth - 1))
+    level = np.where(reached, dist, np.inf)
+
+    # Unreached unknowns sit at infinite level, on the far side
+    return nodes[level < cut], nodes[level == cut], nodes[level > cut]
+
+# -----------------------------------------------------------------------------
+# Fill-in statistics
+# -----------------------------------------------------------------------------
+
+def fill_statistics(S, perm=None):
+    """
+    Objective: Bandwidth, envelope and LU fill of the pattern S, optionally
+    after the symmetric permutation perm. The LU is computed with NATURAL
+    ordering on a diagonally dominant matrix of the same pattern, so it
+    shows the fill of the ordering itself without pivoting.
+
+    Returns
+    -------
+    dict
+        nnz, bandwidth, envelope and lu_nnz (nonzeros of L + U).
+    """
+
+    if perm is not None:
+        S = S[perm][:, perm]
+
+    S = S.tocsr()
+    n = S.shape[0]
+
+    if n == 0:
+        return {'nnz': 0, 'bandwidth': 0, 'envelope': 0, 'lu_nnz': 0}
+
+    rows = np.repeat(np.arange(n), np.diff(S.indptr))
+    offset = rows - S.indices
+
+    # Envelope - per row, distance from the first nonzero to the diagonal
+    first = np.full(n, n, dtype=np.int64)
+    np.minimum.at(first, rows, S.indices)
+    envelope = int(np.sum(np.arange(n) - np.minimum(first, np.arange(n))))
+
+    # Diagonally dominant values - no pivoting, pure structural fill
+    lu = splu(_dominant(S), permc_spec='NATURAL', diag_pivot_thresh=0.0,
+              options={'SymmetricMode': True})
+
+    return {'nnz': int(S.nnz),
+            'bandwidth': int(np.abs(offset).max()),
+            'envelope': envelope,
+            'lu_nnz': int(lu.L.nnz + lu.U.nnz - n)}
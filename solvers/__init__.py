@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 14:31:07 2026
+
+@author: pmdam
+"""
+
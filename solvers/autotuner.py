@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 15:38:54 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built-in
+import json
+import os
+import time
+import numpy as np
+
+# Custom modules
+from config_classes.numeric_checks import MathChecks
+from data_classes.autotune_result import AutotuneResult
+from data_classes.stamp_context import StampContext
+from data_classes.topology_plan import TopologyPlan
+from enums.solver_backend import SolverBackend
+from networks.assembly_engine import AssemblyEngine
+from solvers.superlu_solver import SuperLUSolver
+from solvers.umfpack_solver import UmfpackSolver
+from solvers.solver_factory import build_solver
+
+# -----------------------------------------------------------------------------
+# Define class
+# -----------------------------------------------------------------------------
+
+# Dense candidates are only timed up to this many sparse_threshold unknowns
+DENSE_LIMIT = 5
+
+class Autotuner:
+    """
+    Times every candidate backend / ordering on a compiled topology and picks
+    the cheapest. One trial cycle is a full assembly plus refactorization
+    followed by reuse_steps back substitutions, so the ranking reflects how
+    often a transient can reuse a factorization. Dense backends are left 
+    out above dense_max unknowns, where the n x n array alone is the cost.
+    """
+
+    def __init__(self, numerics: MathChecks, cycles: int = 5,
+                 reuse_steps: int = 10, dense_max: int | None = None):
+
+        self.numerics = numerics
+        self.cycles = cycles
+        self.reuse_steps = reuse_steps
+        self.dense_max = (DENSE_LIMIT*numerics.sparse_threshold 
+                          if dense_max is None else dense_max)
+
+    def candidates(self, plan: TopologyPlan | None = None):
+
+        # (label, backend, ordering)
+        cands = []
+        dense = plan is None or plan.num_unknowns <= self.dense_max
+        symmetric = plan is not None and plan.is_symmetric
+        if dense:
+            cands.append(('DENSE_LU', SolverBackend.DENSE_LU, None))
+
+        # Cholesky only applies to symmetric positive definite systems
+        if dense and symmetric:
+            cands.append(('CHOLESKY', SolverBackend.CHOLESKY, None))
+        if symmetric:
+            cands.append(('SPARSE_CHOLESKY', SolverBackend.SPARSE_CHOLESKY,
+                          None))
+
+        for ordering in SuperLUSolver.ORDERINGS:
+            cands.append((f'SUPERLU/{ordering}', SolverBackend.SUPERLU,
+                          ordering))
+
+        if UmfpackSolver.available():
+            cands.append(('UMFPACK', SolverBackend.UMFPACK, None))
+
+        cands.append(('ITERATIVE', SolverBackend.ITERATIVE, None))
+
+        return cands
+
+    def run(self, plan: TopologyPlan, ctx: StampContext) -> AutotuneResult:
+        """
+        Objective: Time all candidates on the plan and pick the fastest.
+
+        Parameters
+        ----------
+        plan : TopologyPlan, custom data class
+            Compiled network topology.
+        ctx : StampContext, custom data class
+            Timestep and discretization used to assemble the trial system.
+
+        Returns
+        -------
+        AutotuneResult
+        """
+
+        result = AutotuneResult(fingerprint=plan.fingerprint(),
+                                backend=SolverBackend.SUPERLU)
+        best = np.inf
+
+        # Companion models do not depend on the backend - gather once
+        companions = AssemblyEngine(plan, self.numerics).gather(ctx)
+
+        for label, backend, ordering in self.candidates(plan):
+            solver = build_solver(backend, self.numerics, plan.num_unknowns,
+                                  ordering=ordering)
+            try:
+                cost = self._time_candidate(plan, companions, solver)
+            except (ValueError, RuntimeError, MemoryError) as err:
+                result.failures[label] = str(err) or type(err).__name__
+                continue
+
+            result.timings[label] = cost
+            if cost < best:
+                best = cost
+                result.backend, result.ordering = backend, ordering
+
+        return result
+
+    def _time_candidate(self, plan, companions, solver):
+
+        engine = AssemblyEngine(plan, self.numerics, sparse=solver.sparse)
+        G, J, r_int, v_rise = companions
+        b = engine.build_b(G, J, v_rise)
+
+        # A new right hand side every step, as in a transient - a repeated
+        # one would hand warm started Krylov solvers the answer as their
+        # initial guess. Offset so it is never all zero.
+        rng = np.random.default_rng(0)
+        scale = max(np.abs(b).max(), 1.0)
+        rhs = b + 1.0 + 0.1*scale*rng.standard_normal(
+            (self.cycles*self.reuse_steps, len(b)))
+
+        best = np.inf
+        for cycle in range(self.cycles):
+
+            t0 = time.perf_counter()
+
+            # Assembly and refactorization, then reuse
+            A = engine.build_A(engine.triplet_values(G, r_int))
+            factor = solver.refactor(A)
+            for k in range(self.reuse_steps):
+                b = rhs[cycle*self.reuse_steps + k]
+                x = solver.solve(factor, b)
+
+            best = min(best, time.perf_counter() - t0)
+
+        # Reject backends that do not actually solve the system
+        residual = np.abs(A @ x - b).max()
+        if not np.isfinite(residual) or residual > 1e-6*np.abs(b).max():
+            raise ValueError(f"trial residual {residual:.2e} too large")
+
+        return best / self.reuse_steps
+
+# -----------------------------------------------------------------------------
+# Persistence
+# -----------------------------------------------------------------------------
+
+def load_autotune(path: str, fingerprint: str) -> AutotuneResult | None:
+
+    if not path or not os.path.exists(path):
+        return None
+
+    with open(path, 'r') as f:
+        data = json.load(f)
+
+    entry = data.get(fingerprint)
+    if entry is None:
+        return None
+
+    return AutotuneResult.from_dict(fingerprint, entry)
+
+
+def save_autotune(path: str, result: AutotuneResult):
+
+    data = {}
+    if os.path.exists(path):
+        with open(path, 'r') as f:
+            data = json.load(f)
+
+    # One entry per fingerprint, other networks in the file are kept
+    data[result.fingerprint] = result.to_dict()
+
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+
@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 22:41:19 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built-in
+import numpy as np
+from scipy.linalg import LinAlgError, cho_factor
+from scipy.linalg.lapack import dpotrs
+from scipy.sparse import csc_matrix, csr_matrix, issparse
+from scipy.sparse.linalg import splu
+
+# Custom modules
+from solvers.linear_solver import LinearSolver
+from solvers.dense_lu_solver import DenseLUSolver
+from solvers.superlu_solver import SuperLUSolver
+
+# Optional dependency
+try:
+    from sksparse import cholmod
+except ImportError:
+    cholmod = None
+
+# -----------------------------------------------------------------------------
+# Define classes
+# -----------------------------------------------------------------------------
+
+class LUFallback:
+    """
+    LU factor of a matrix the Cholesky factorization rejected
+    """
+
+    def __init__(self, factor):
+        self.factor = factor
+
+
+class SymmetricPermutedLU:
+    """
+    SuperLU factorization of A[order][:, order] - solves A x = b
+    """
+
+    def __init__(self, lu, order: np.ndarray):
+        self.lu = lu
+        self.order = order
+
+    def solve(self, b):
+
+        x = np.empty_like(b)
+        x[self.order] = self.lu.solve(b[self.order])
+
+        return x
+
+
+def conductance_spread(A):
+    """
+    Objective: Ratio of the largest to the smallest non-zero entry of A.
+    Closed switches or wires next to ordinary conductances (1e10 S against
+    1e-1 S) give spreads where the unpivoted Cholesky solve drifts from the
+    pivoted LU one.
+    """
+
+    values = np.abs(A.data if issparse(A) else A[A != 0.0])
+    values = values[values > 0.0]
+    if len(values) == 0:
+        return 1.0
+
+    return float(values.max() / values.min())
+
+
+class DenseCholeskySolver(LinearSolver):
+    """
+    LAPACK potrf / potrs on a dense symmetric positive definite A - half the
+    flops and storage of getrf. A matrix that turns out not to be positive
+    definite, or whose conductance spread exceeds max_spread, is factored by
+    the LU fallback instead.
+    """
+
+    sparse = False
+
+    def __init__(self, max_spread: float | None = None):
+
+        self.fallback = DenseLUSolver()
+        self.max_spread = max_spread
+        self.num_fallbacks = 0
+
+    def factor(self, A):
+
+        if hasattr(A, 'toarray'):
+            A = A.toarray()
+
+        if (self.max_spread is not None and
+                conductance_spread(A) > self.max_spread):
+            self.num_fallbacks += 1
+            return LUFallback(self.fallback.factor(A))
+
+        try:
+            c, _ = cho_factor(A, lower=True, check_finite=False)
+        except LinAlgError:
+            self.num_fallbacks += 1
+            return LUFallback(self.fallback.factor(A))
+
+        return c
+
+    def solve(self, factor, b):
+
+        if isinstance(factor, LUFallback):
+            return self.fallback.solve(factor.factor, b)
+
+        x, _ = dpotrs(factor, b, lower=1)
+
+        return x
+
+    def solve_transpose(self, factor, b):
+
+        if isinstance(factor, LUFallback):
+            return self.fallback.solve_transpose(factor.factor, b)
+
+        # A is symmetric
+        return self.solve(factor, b)
+
+    def solve_many(self, factor, B):
+        return self.solve(factor, np.asarray(B))
+
+
+class SparseCholeskySolver(LinearSolver):
+    """
+    Sparse factorization of a symmetric positive definite A. CHOLMOD
+    (scikit-sparse) is used when installed, its symbolic analysis is kept
+    per sparsity pattern. Without it SuperLU factors A in symmetric mode -
+    minimum degree ordering of A + A^T applied to rows and columns alike,
+    diagonal pivots only - and the sign of the pivots confirms
+    definiteness. That path is still an LU, the ordering is computed once
+    per pattern and reused by refactor(). A matrix that is not positive 
+    definite, or whose conductance spread exceeds max_spread, is factored 
+    by the general SuperLU fallback.
+    """
+
+    sparse = True
+
+    def __init__(self, ordering: str = 'COLAMD',
+                 max_spread: float | None = None):
+
+        self.fallback = SuperLUSolver(ordering=ordering)
+        self.max_spread = max_spread
+        self.num_fallbacks = 0
+        self.num_orderings = 0
+        self.reset()
+
+    @staticmethod
+    def available():
+        # Whether CHOLMOD is used, the SuperLU path always works
+        return cholmod is not None
+
+    def reset(self):
+
+        self.fallback.reset()
+        self._symbolic = None
+        self._indices = None
+        self._order = None
+        self._csc = None
+        self._data_map = None
+
+    def factor(self, A):
+
+        self._symbolic = None
+        self._order = None
+
+        return self.refactor(A)
+
+    def refactor(self, A):
+
+        if not issparse(A):
+            A = csr_matrix(A)
+
+        if (self.max_spread is not None and
+                conductance_spread(A) > self.max_spread):
+            self.num_fallbacks += 1
+            return LUFallback(self.fallback.refactor(A))
+
+        # CSR arrays of a symmetric matrix read as CSC are the same matrix
+        csc = csc_matrix((A.data, A.indices, A.indptr), shape=A.shape)
+
+        try:
+            if cholmod is not None:
+                return self._cholmod(csc, A.indices)
+            return self._symmetric_lu(csc, A)
+        except (LinAlgError, RuntimeError):
+            self.num_fallbacks += 1
+            return LUFallback(self.fallback.refactor(A))
+
+    def solve(self, factor, b):
+
+        if isinstance(factor, LUFallback):
+            return self.fallback.solve(factor.factor, b)
+
+        return factor.solve_A(b) if cholmod is not None else factor.solve(b)
+
+    def solve_transpose(self, factor, b):
+
+        if isinstance(factor, LUFallback):
+            return self.fallback.solve_transpose(factor.factor, b)
+
+        return self.solve(factor, b)
+
+    def solve_many(self, factor, B):
+        return self.solve(factor, np.asarray(B))
+
+    def _cholmod(self, csc, indices):
+
+        # Symbolic analysis once per pattern, numeric factor per call
+        if self._symbolic is None or indices is not self._indices:
+            self._symbolic = cholmod.analyze(csc)
+            self._indices = indices
+
+        try:
+            return self._symbolic.cholesky(csc)
+        except cholmod.CholmodNotPositiveDefiniteError as err:
+            raise LinAlgError(str(err)) from err
+
+    def _symmetric_lu(self, csc, A):
+
+        # Same pattern - values straight into the pre-ordered matrix
+        if self._order is not None and A.indices is self._indices:
+            self._csc.data[:] = A.data[self._data_map]
+            lu = self._symmetric_splu(self._csc, 'NATURAL')
+            return SymmetricPermutedLU(lu, self._order)
+
+        lu = self._symmetric_splu(csc, 'MMD_AT_PLUS_A')
+        self._lock_pattern(A, lu)
+
+        return lu
+
+    @staticmethod
+    def _symmetric_splu(csc, ordering):
+
+        lu = splu(csc, permc_spec=ordering, diag_pivot_thresh=0.0,
+                  options=dict(SymmetricMode=True))
+
+        # Symmetric permutation and positive pivots - P A P^T = L D L^T
+        # with D > 0
+        if (np.any(lu.perm_r != lu.perm_c) or
+                np.any(lu.U.diagonal() <= 0.0)):
+            raise LinAlgError("matrix is not positive definite")
+
+        return lu
+
+    def _lock_pattern(self, A, lu):
+
+        # Minimum degree ordering kept for the pattern, CSR entries traced
+        # into the symmetrically permuted CSC matrix as in FixedOrderingLU
+        self.num_orderings += 1
+        self._indices = A.indices
+        self._order = np.argsort(lu.perm_c)
+
+        tracer = csr_matrix((np.arange(1, A.nnz + 1, dtype=float),
+                             A.indices, A.indptr), shape=A.shape)
+        csc = tracer[self._order][:, self._order].tocsc()
+        csc.sort_indices()
+
+        self._data_map = csc.data.astype(np.int64) - 1
+        self._csc = csc
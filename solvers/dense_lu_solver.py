@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 14:38:12 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built-in
+import numpy as np
+from scipy.linalg import lu_factor
+from scipy.linalg.lapack import dgetrs
+
+# Custom modules
+from solvers.linear_solver import LinearSolver
+
+# -----------------------------------------------------------------------------
+# Define class
+# -----------------------------------------------------------------------------
+
+class DenseLUSolver(LinearSolver):
+    """
+    LAPACK getrf / getrs on a dense A
+    """
+
+    sparse = False
+
+    def factor(self, A):
+
+        if hasattr(A, 'toarray'):
+            A = A.toarray()
+
+        return lu_factor(A)
+
+    def solve(self, factor, b):
+
+        # LAPACK getrs is called directly, scipy's lu_solve wrapper costs
+        # more than the triangular solves on small networks
+        x, _ = dgetrs(factor[0], factor[1], b)
+
+        return x
+
+    def solve_transpose(self, factor, b):
+
+        x, _ = dgetrs(factor[0], factor[1], b, trans=1)
+
+        return x
+
+    def solve_many(self, factor, B):
+        return self.solve(factor, np.asarray(B))
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 14:12:27 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built-in
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from scipy.linalg import lu_factor, lu_solve
+from scipy.sparse import csr_matrix, issparse
+from scipy.sparse.linalg import splu
+
+# Custom modules
+from networks.unknown_ordering import partition_unknowns
+from solvers.linear_solver import LinearSolver
+
+# -----------------------------------------------------------------------------
+# Define classes
+# -----------------------------------------------------------------------------
+
+class DomainFactor:
+    """
+    Subdomain LU factors, their couplings to the interface and the LU of
+    the interface Schur complement
+    """
+
+    def __init__(self, blocks, schur):
+
+        self.blocks = blocks
+        self.schur = schur
+
+
+class DomainDecompositionSolver(LinearSolver):
+    """
+    Bordered block diagonal solve. The unknowns are split into subdomains
+    that only couple through interface unknowns (partition_unknowns, kept
+    per sparsity pattern). Every subdomain is factored and condensed onto
+    the interface independently, on a thread pool when workers > 1, and
+    the dense interface Schur complement S = A_GG - sum A_Gi inv(A_ii) A_iG
+    is factored centrally. A solve is a forward pass over the subdomains,
+    one interface solve and a backward pass over the subdomains.
+    """
+
+    sparse = True
+
+    def __init__(self, parts: int = 4, workers: int = 1,
+                 ordering: str = 'COLAMD'):
+
+        if parts < 1:
+            raise ValueError(f"Domain decomposition needs at least one "
+                             f"subdomain, got {parts}")
+
+        self.parts = parts
+        self.workers = workers
+        self.ordering = ordering
+        self._executor = None
+        self.reset()
+
+    def reset(self):
+
+        # Partition is redone for the next pattern, threads are restarted
+        # on demand
+        self.close()
+        self._indices = None
+        self.perm = None
+        self.offsets = None
+        self.num_interface = 0
+
+    def close(self, wait: bool = True):
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+        self._executor = None
+
+    @property
+    def num_parts(self):
+        return 0 if self.offsets is None else len(self.offsets) - 1
+
+    def factor(self, A):
+
+        self._indices = None
+
+        return self.refactor(A)
+
+    def refactor(self, A):
+
+        if not issparse(A):
+            A = csr_matrix(A)
+        A = A.tocsr()
+
+        if A.indices is not self._indices:
+            self._partition(A)
+            self._indices = A.indices
+
+        # Subdomains first, interface last
+        Ap = A[self.perm][:, self.perm]
+        start = self.offsets[-1]
+
+        blocks = self._map(lambda k: self._factor_part(Ap, k),
+                           range(self.num_parts))
+
+        schur = None
+        if self.num_interface:
+            S = Ap[start:, start:].toarray()
+            for _, _, _, rows, cols, S_k in blocks:
+                if S_k is not None:
+                    S[np.ix_(rows, cols)] -= S_k
+            schur = lu_factor(S, check_finite=False)
+
+        return DomainFactor(blocks, schur)
+
+    def solve(self, factor, b):
+        return self._solve(factor, b, trans=False)
+
+    def solve_transpose(self, factor, b):
+        return self._solve(factor, b, trans=True)
+
+    def solve_many(self, factor, B):
+        return self._solve(factor, np.asarray(B), trans=False)
+
+    def _partition(self, A):
+
+        # Symmetric pattern, unknowns without a diagonal (ideal voltage
+        # source rows) would make a subdomain block singular
+        S = (abs(A) + abs(A).T).tocsr()
+        interface = np.flatnonzero(A.diagonal() == 0)
+        part = partition_unknowns(S, self.parts, interface)
+
+        counts = np.bincount(part[part >= 0], minlength=part.max() + 1)
+        self.perm = np.argsort(np.where(part < 0, len(counts), part),
+                               kind='stable')
+        self.offsets = np.concatenate(([0], np.cumsum(counts)))
+        self.num_interface = int(np.count_nonzero(part < 0))
+
+    def _factor_part(self, Ap, k):
+
+        s, e = self.offsets[k], self.offsets[k+1]
+        start = self.offsets[-1]
+
+        lu = splu(Ap[s:e, s:e].tocsc(), permc_spec=self.ordering)
+        A_iG = Ap[s:e, start:]
+        A_Gi = Ap[start:, s:e].tocsr()
+
+        # Condensation onto the interface unknowns this subdomain touches
+        rows = np.flatnonzero(np.diff(A_Gi.indptr))
+        cols = np.unique(A_iG.indices)
+        S_k = None
+        if len(rows) and len(cols):
+            X = lu.solve(A_iG[:, cols].toarray())
+            S_k = A_Gi[rows] @ X
+
+        return lu, A_iG, A_Gi, rows, cols, S_k
+
+    def _solve(self, factor, b, trans):
+
+        b = np.asarray(b, dtype=float)
+        bp = b[self.perm]
+        start = self.offsets[-1]
+        mode = 'T' if trans else 'N'
+
+        def forward(k):
+            lu, A_iG, A_Gi, *_ = factor.blocks[k]
+            y = lu.solve(bp[self.offsets[k]:self.offsets[k+1]], trans=mode)
+            return y, (A_iG.T if trans else A_Gi) @ y
+
+        forward_pass = self._map(forward, range(self.num_parts))
+
+        # Interface unknowns from the condensed right hand side
+        x_G = bp[start:].copy()
+        if self.num_interface:
+            for _, coupled in forward_pass:
+                x_G -= coupled
+            x_G = lu_solve(factor.schur, x_G, trans=int(trans),
+                           check_finite=False)
+
+        def backward(k):
+            lu, A_iG, A_Gi, *_ = factor.blocks[k]
+            y = forward_pass[k][0]
+            if not self.num_interface:
+                return y
+            return y - lu.solve((A_Gi.T if trans else A_iG) @ x_G,
+                                trans=mode)
+
+        # Back to the caller's unknown order
+        x = np.empty_like(bp)
+        x[self.perm] = np.concatenate([bp[:0]] +
+                                      self._map(backward,
+                                                range(self.num_parts)) +
+                                      [x_G])
+
+        return x
+
+    def _map(self, fn, items):
+
+        items = list(items)
+        if self.workers <= 1 or len(items) < 2:
+            return [fn(k) for k in items]
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers)
+
+        return list(self._executor.map(fn, items))
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 14:53:16 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built-in
+import numpy as np
+from scipy.sparse import csc_matrix
+from scipy.sparse.linalg import LinearOperator, bicgstab, cg, gmres, spilu
+
+# Custom modules
+from solvers.linear_solver import LinearSolver
+
+# -----------------------------------------------------------------------------
+# Define class
+# -----------------------------------------------------------------------------
+
+class IterativeFactor:
+    """
+    Matrix snapshot, Krylov method and preconditioner handed back to
+    IterativeSolver.solve
+    """
+
+    def __init__(self, A, method: str, M):
+        self.A = A
+        self.method = method
+        self.M = M
+
+
+class IterativeSolver(LinearSolver):
+    """
+    Preconditioned Krylov solver for networks too large to factor.
+
+    method 'auto' picks CG when A is symmetric with a positive diagonal (a
+    conductance only network, SPD once ground is eliminated) and GMRES
+    otherwise - voltage source rows make A indefinite. The preconditioner
+    (incomplete LU or Jacobi) is built by factor() and kept by refactor()
+    for the next precond_refresh value changes of the same pattern, and every
+    solve warm starts from the previous solution.
+    """
+
+    sparse = True
+    METHODS = ('auto', 'cg', 'gmres', 'bicgstab')
+    PRECONDITIONERS = ('ilu', 'jacobi', 'none')
+
+    def __init__(self, rtol: float = 1e-12, method: str = 'auto',
+                 preconditioner: str = 'ilu', warm_start: bool = True,
+                 precond_refresh: int = 20, drop_tol: float = 1e-6,
+                 fill_factor: float = 10.0, max_iter: int = 1000):
+
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown Krylov method '{method}', expected "
+                             f"one of {self.METHODS}")
+        if preconditioner not in self.PRECONDITIONERS:
+            raise ValueError(f"Unknown preconditioner '{preconditioner}', "
+                             f"expected one of {self.PRECONDITIONERS}")
+
+        self.rtol = rtol
+        self.method = method
+        self.preconditioner = preconditioner
+        self.warm_start = warm_start
+        self.precond_refresh = precond_refresh
+        self.drop_tol = drop_tol
+        self.fill_factor = fill_factor
+        self.max_iter = max_iter
+        self.reset()
+
+    def reset(self):
+
+        # Solution of the last solve, warm start for the next one
+        self._x_prev = None
+
+        # Preconditioner reused across refactorizations of one pattern
+        self._M = None
+        self._M_indices = None
+        self._M_age = 0
+
+        # Statistics of the last solve, and totals
+        self.last_iterations = 0
+        self.last_residual = 0.0
+        self.num_preconditioners = 0
+
+    def factor(self, A):
+
+        # Force a fresh preconditioner
+        self._M = None
+
+        return self.refactor(A)
+
+    def refactor(self, A):
+
+        # The network assembles A in place - keep an independent copy
+        A = csc_matrix(A, copy=True)
+        A.sort_indices()
+        method = self._pick_method(A)
+
+        stale = (self._M is None
+                 or self._M_indices is None
+                 or not np.array_equal(self._M_indices, A.indices)
+                 or self._M_age >= self.precond_refresh)
+
+        if stale:
+            self._M = self._build_preconditioner(A)
+            self._M_indices = A.indices.copy()
+            self._M_age = 0
+        else:
+            self._M_age += 1
+
+        return IterativeFactor(A, method, self._M)
+
+    def solve(self, factor, b):
+
+        x0 = None
+        if self.warm_start and self._x_prev is not None \
+                and self._x_prev.shape == b.shape:
+            x0 = self._x_prev
+
+        x, its, res = self._krylov(factor, b, x0)
+
+        self.last_iterations = its
+        self.last_residual = res
+        self._x_prev = x
+
+        return x
+
+    def solve_many(self, factor, B):
+
+        # Auxiliary solves (e.g. low rank update columns) - no warm start
+        # and they do not touch the per step statistics
+        return np.column_stack([self._krylov(factor, B[:, j], None)[0]
+                                for j in range(B.shape[1])])
+
+    def _krylov(self, factor, b, x0):
+
+        b_norm = np.linalg.norm(b)
+        if b_norm == 0.0:
+            return np.zeros_like(b, dtype=float), 0, 0.0
+
+        count = [0]
+        def callback(*_):
+            count[0] += 1
+
+        kwargs = dict(x0=x0, M=factor.M, rtol=self.rtol, atol=0.0,
+                      maxiter=self.max_iter, callback=callback)
+
+        if factor.method == 'cg':
+            x, info = cg(factor.A, b, **kwargs)
+        elif factor.method == 'bicgstab':
+            x, info = bicgstab(factor.A, b, **kwargs)
+        else:
+            x, info = gmres(factor.A, b, callback_type='pr_norm', **kwargs)
+
+        if info != 0:
+            raise ValueError(f"{factor.method.upper()} did not converge "
+                             f"(info={info})")
+
+        residual = np.linalg.norm(b - factor.A @ x) / b_norm
+
+        return x, count[0], residual
+
+    def _pick_method(self, A):
+
+        if self.method != 'auto':
+            return self.method
+
+        # Symmetric with positive diagonal - conductance only network
+        asym = abs(A - A.T)
+        symmetric = asym.nnz == 0 or asym.max() == 0.0
+
+        return 'cg' if symmetric and np.all(A.diagonal() > 0.0) else 'gmres'
+
+    def _build_preconditioner(self, A):
+
+        self.num_preconditioners += 1
+
+        if self.preconditioner == 'none':
+            return None
+
+        if self.preconditioner == 'jacobi':
+            # Ideal voltage source rows have a zero diagonal - leave them
+            diag = A.diagonal()
+            inv = 1.0 / np.where(diag != 0.0, diag, 1.0)
+            return LinearOperator(A.shape, matvec=lambda v: inv * v.ravel(),
+                                  dtype=float)
+
+        ilu = spilu(A, drop_tol=self.drop_tol, fill_factor=self.fill_factor)
+        return LinearOperator(A.shape, matvec=ilu.solve, dtype=float)
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 14:33:45 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built-in
+from abc import ABC, abstractmethod
+import numpy as np
+
+# -----------------------------------------------------------------------------
+# Define class
+# -----------------------------------------------------------------------------
+
+class LinearSolver(ABC):
+    """
+    Backend used by Network to solve A x = b. factor() returns an opaque
+    factor object that the network caches and later hands back to solve().
+    refactor() may reuse ordering or symbolic work from an earlier factor()
+    of a matrix with the same sparsity pattern.
+    """
+
+    # Whether the backend wants A assembled as a CSR matrix
+    sparse = False
+
+    # Statistics of the last solve() - iterative backends overwrite them,
+    # direct backends do not compute a residual
+    last_iterations = 0
+    last_residual = np.nan
+
+    def reset(self):
+        # Drop ordering / symbolic state, called when the topology is recompiled
+        pass
+
+    def close(self, wait: bool = True):
+        # Release worker threads, the backend stays usable
+        pass
+
+    @abstractmethod
+    def factor(self, A):
+        pass
+
+    def refactor(self, A):
+        return self.factor(A)
+
+    @abstractmethod
+    def solve(self, factor, b: np.ndarray) -> np.ndarray:
+        pass
+
+    def solve_transpose(self, factor, b: np.ndarray) -> np.ndarray:
+        # A^T x = b, used by the condition estimate
+        raise NotImplementedError(
+            f"{type(self).__name__} has no transposed solve")
+
+    def solve_many(self, factor, B: np.ndarray) -> np.ndarray:
+
+        # One solve per right hand side column
+        return np.column_stack([self.solve(factor, B[:, j])
+                                for j in range(B.shape[1])])
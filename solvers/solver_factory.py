@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 14:58:41 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Custom modules
+from config_classes.numeric_checks import MathChecks
+from enums.solver_backend import SolverBackend
+from solvers.linear_solver import LinearSolver
+from solvers.dense_lu_solver import DenseLUSolver
+from solvers.cholesky_solver import DenseCholeskySolver, SparseCholeskySolver
+from solvers.superlu_solver import SuperLUSolver
+from solvers.umfpack_solver import UmfpackSolver
+from solvers.iterative_solver import IterativeSolver
+from solvers.domain_decomposition_solver import DomainDecompositionSolver
+
+# -----------------------------------------------------------------------------
+# Define function
+# -----------------------------------------------------------------------------
+
+def build_solver(backend: SolverBackend | LinearSolver,
+                 numerics: MathChecks,
+                 size: int,
+                 ordering: str | None = None,
+                 symmetric: bool = False) -> LinearSolver:
+    """
+    Objective: Resolve a backend choice into a LinearSolver instance.
+
+    Parameters
+    ----------
+    backend : SolverBackend or LinearSolver
+        Backend enum, or a ready made solver which is returned unchanged.
+    numerics : MathChecks, custom config class
+        Sparse threshold and backend options.
+    size : Integer
+        Number of unknowns, used by SolverBackend.AUTO.
+    ordering : String, optional
+        SuperLU column ordering, defaults to numerics.superlu_ordering.
+    symmetric : Boolean
+        A is symmetric positive definite by construction, AUTO then picks a
+        Cholesky backend that keeps LU for matrices whose conductance
+        spread exceeds numerics.cholesky_max_spread. Sparse plans only 
+        take the Cholesky path with CHOLMOD installed, SuperLU otherwise.
+
+    Returns
+    -------
+    LinearSolver
+    """
+
+    if isinstance(backend, LinearSolver):
+        return backend
+
+    if backend == SolverBackend.AUTO:
+        sparse = size >= numerics.sparse_threshold
+        if symmetric and sparse and SparseCholeskySolver.available():
+            return SparseCholeskySolver(
+                ordering=ordering or numerics.superlu_ordering,
+                max_spread=numerics.cholesky_max_spread)
+        if symmetric and not sparse:
+            return DenseCholeskySolver(
+                max_spread=numerics.cholesky_max_spread)
+        backend = (SolverBackend.SUPERLU if sparse
+                   else SolverBackend.DENSE_LU)
+
+    if backend == SolverBackend.DENSE_LU:
+        return DenseLUSolver()
+    if backend == SolverBackend.CHOLESKY:
+        return DenseCholeskySolver()
+    if backend == SolverBackend.SPARSE_CHOLESKY:
+        return SparseCholeskySolver(
+            ordering=ordering or numerics.superlu_ordering)
+    if backend == SolverBackend.SUPERLU:
+        return SuperLUSolver(ordering=ordering or numerics.superlu_ordering)
+    if backend == SolverBackend.UMFPACK:
+        return UmfpackSolver()
+    if backend == SolverBackend.ITERATIVE:
+        return IterativeSolver(rtol=numerics.iterative_rtol,
+                               method=numerics.iterative_method,
+                               preconditioner=
+                               numerics.iterative_preconditioner)
+    if backend == SolverBackend.DOMAIN_DECOMPOSITION:
+        return DomainDecompositionSolver(
+            parts=numerics.dd_parts,
+            workers=numerics.dd_workers,
+            ordering=ordering or numerics.superlu_ordering)
+
+    raise ValueError(f"Unknown solver backend {backend}")
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 14:42:30 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built-in
+from scipy.sparse import csr_matrix, issparse
+
+# Custom modules
+from networks.pattern_locked_lu import FixedOrderingLU
+from solvers.linear_solver import LinearSolver
+
+# -----------------------------------------------------------------------------
+# Define class
+# -----------------------------------------------------------------------------
+
+class SuperLUSolver(LinearSolver):
+    """
+    SciPy SuperLU. The column ordering (COLAMD, MMD_AT_PLUS_A, MMD_ATA or
+    NATURAL) is computed once per sparsity pattern, refactor() factors in
+    that fixed ordering (see FixedOrderingLU).
+    """
+
+    sparse = True
+    ORDERINGS = ('COLAMD', 'MMD_AT_PLUS_A', 'MMD_ATA', 'NATURAL')
+
+    def __init__(self, ordering: str = 'COLAMD'):
+
+        if ordering not in self.ORDERINGS:
+            raise ValueError(f"Unknown SuperLU column ordering '{ordering}', "
+                             f"expected one of {self.ORDERINGS}")
+
+        self.ordering = ordering
+        self.locked = FixedOrderingLU(ordering=ordering)
+
+    def reset(self):
+        self.locked.reset()
+
+    def factor(self, A):
+
+        # Forget the locked pattern - recompute the column ordering
+        self.locked.reset()
+
+        return self.refactor(A)
+
+    def refactor(self, A):
+
+        if not issparse(A):
+            A = csr_matrix(A)
+
+        return self.locked.factor(A)
+
+    def solve(self, factor, b):
+        return factor.solve(b)
+
+    def solve_transpose(self, factor, b):
+        return factor.solve(b, trans='T')
+
+    def solve_many(self, factor, B):
+        return factor.solve(B)
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 14:47:58 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built-in
+from scipy.sparse import csc_matrix
+
+# Custom modules
+from solvers.linear_solver import LinearSolver
+
+# Optional dependency
+try:
+    from scikits import umfpack
+except ImportError:
+    umfpack = None
+
+# -----------------------------------------------------------------------------
+# Define class
+# -----------------------------------------------------------------------------
+
+class UmfpackSolver(LinearSolver):
+    """
+    UMFPACK multifrontal LU through scikit-umfpack. Only available when the
+    scikit-umfpack package is installed.
+    """
+
+    sparse = True
+
+    def __init__(self):
+
+        if umfpack is None:
+            raise ImportError("UMFPACK backend requires scikit-umfpack "
+                              "(pip install scikit-umfpack)")
+
+    @staticmethod
+    def available():
+        return umfpack is not None
+
+    def factor(self, A):
+
+        # Factor objects are cached by the network, each gets its own
+        # numeric factorization
+        return umfpack.splu(csc_matrix(A))
+
+    def solve(self, factor, b):
+        return factor.solve(b)
+
+    def solve_transpose(self, factor, b):
+        return factor.solve(b, trans='T')
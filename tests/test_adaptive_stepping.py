@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Wed Oct 21 10:12:55 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built-in
+import unittest
+import numpy as np
+
+# Custom modules
+from enums.component_type import ComponentType
+from enums.discretization_type import DiscretizationType
+from examples.rc_network import build_rc_network
+from examples.series_network import build_series_network
+from networks.input_driver import InputDriver
+from networks.step_control import local_truncation_error
+
+# -----------------------------------------------------------------------------
+# Define unit test cases
+# -----------------------------------------------------------------------------
+
+class AdaptiveSteppingTests(unittest.TestCase):
+
+    def capacitor_voltage(self, net):
+
+        for k, (_, _, c) in enumerate(net.branch_list):
+            if c.component.ctype is ComponentType.CAPACITOR:
+                return net.sim_data.branch_v[:, k]
+
+    def test_step_response_order_of_magnitude_fewer_steps(self):
+        """
+        TEST 1: ADAPTIVE GRID BEATS A 10X DENSER UNIFORM GRID, RC STEP
+
+        """
+        v0 = 12.0
+        driver = InputDriver(sources={'V1': lambda t: v0})
+
+        for scheme in (DiscretizationType.BACKWARD_EULER,
+                       DiscretizationType.BDF2):
+            net, r_eq, c = build_rc_network(discretization=scheme)
+            tau = r_eq*c
+            net.solve_adaptive(0.0, 50*tau, driver)
+
+            time = net.sim_data.time
+            self.assertAlmostEqual(time[-1], 50*tau, places=12)
+            self.assertTrue(np.all(np.diff(time) > 0))
+            error = np.abs(self.capacitor_voltage(net) -
+                           v0*(1 - np.exp(-time/tau))).max()
+
+            # Uniform grid with ten times the steps
+            uniform, _, _ = build_rc_network(discretization=scheme)
+            grid = np.linspace(0, 50*tau, 10*len(time) + 1)
+            uniform.solve(time=grid, input_driver=driver)
+            uniform_error = np.abs(self.capacitor_voltage(uniform) -
+                                   v0*(1 - np.exp(-grid[1:]/tau))).max()
+
+            self.assertLess(len(time), 150)
+            self.assertLess(error, uniform_error)
+
+    def test_rejected_steps_are_retried(self):
+        """
+        TEST 2: DELAYED STEP IS RESOLVED BY REJECTING AND SHRINKING DT
+
+        """
+        net, r_eq, c = build_rc_network(discretization=
+                                        DiscretizationType.BDF2)
+        tau = r_eq*c
+        driver = InputDriver(sources={'V1': lambda t: 12.0*(t >= 20.0)})
+        net.solve_adaptive(0.0, 60.0, driver)
+
+        sim = net.sim_data
+        self.assertGreater(sim.rejected_steps.sum(), 0)
+        self.assertEqual(len(sim.rejected_steps), len(sim.time))
+
+        # Finest steps around the edge, coarse before and after
+        dt = np.diff(np.concatenate(([0.0], sim.time)))
+        edge = np.argmin(dt)
+        self.assertLess(abs(sim.time[edge] - 20.0), 1e-3)
+        self.assertGreater(dt[0:5].max(), 100*dt[edge])
+        self.assertGreater(dt[-5:].min(), 100*dt[edge])
+
+        # Rejected attempts left no trace in the component history
+        expected = 12.0*(1 - np.exp(-np.clip(sim.time - 20.0, 0, None)/tau))
+        np.testing.assert_allclose(self.capacitor_voltage(net), expected,
+                                   atol=0.05)
+
+    def test_error_estimate_and_inputs(self):
+        """
+        TEST 3: PREDICTOR / CORRECTOR ESTIMATE, RESISTIVE RUN, BAD INPUTS
+
+        """
+        # One Backward Euler / BDF2 step of x' = -x from exact history
+        h = 1e-2
+        t = np.arange(4)*h
+        exact = np.exp(-t)
+        be = exact[2] / (1 + h)
+        bdf2 = (4*exact[2] - exact[1]) / (3 + 2*h)
+        for order, x_new in ((1, be), (2, bdf2)):
+            x = np.append(exact[2 - order:3], x_new)[:, None]
+            error = local_truncation_error(t[2 - order:], x, order)
+            self.assertAlmostEqual(error[0] / abs(x_new - exact[3]), 1.0,
+                                   places=1)
+
+        # No reactive state - straight to dt_max
+        net = build_series_network()
+        driver = InputDriver(sources={'V1': lambda t: 10.0})
+        net.solve_adaptive(0.0, 1.0, driver, dt_max=0.25, dt_initial=0.1)
+        np.testing.assert_allclose(net.sim_data.time,
+                                   [0.1, 0.3, 0.55, 0.8, 1.0])
+
+        with self.assertRaises(ValueError):
+            net.solve_adaptive(1.0, 1.0, driver)
+        with self.assertRaises(ValueError):
+            net.solve_adaptive(0.0, 1.0, InputDriver(
+                sources={'V1': np.ones(10)}))
+
+# -----------------------------------------------------------------------------
+# Run tests
+# -----------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
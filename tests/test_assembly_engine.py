@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 09:41:52 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built-in
+import unittest
+import numpy as np
+
+# Custom modules
+from components.switch import Switch
+from config_classes.numeric_checks import MathChecks
+from data_classes.component_data import ComponentData
+from data_classes.stamp_context import StampContext
+from enums.calculation_mode import CalculationMode
+from enums.component_type import ComponentType
+from enums.discretization_type import DiscretizationType
+from enums.switch_condition import SwitchCondition
+from examples.rlc_network import build_rlc_network
+
+# -----------------------------------------------------------------------------
+# Define unit test cases
+# -----------------------------------------------------------------------------
+
+class AssemblyEngineTests(unittest.TestCase):
+
+    def make_network(self, numerics=None):
+        """
+        RLC network with an extra switch and some capacitor / inductor
+        history so every stamp contributes to A and b
+        """
+
+        net, _, _, _ = build_rlc_network(
+            discretization=DiscretizationType.BDF2)
+
+        if numerics is not None:
+            net.numerics = numerics
+
+        net.add_component('n2', 'n0', Switch(ComponentData(
+            name='S1',
+            node1='n2',
+            node2='n0',
+            current=0.0,
+            voltage=0.0,
+            mode=CalculationMode.CURRENT,
+            scond=SwitchCondition.OPEN,
+            ctype=ComponentType.SWITCH)))
+
+        net.compile()
+        net._update_comps()
+
+        for _, _, c in net.branch_list:
+            d = c.component.discrete_data
+            if d is not None:
+                d.lpv1_voltage, d.lpv2_voltage = 0.7, 0.3
+                d.lpv1_current, d.lpv2_current = -0.2, 0.1
+
+        return net
+
+    def stamp_reference(self, net, ctx):
+        """
+        Reference A, b built with the per-component stamp() methods
+        """
+
+        numel = net.num_nodes + net.num_v_sources
+        A = np.zeros((numel, numel))
+        b = np.zeros(numel)
+
+        # Norton sources stamp as conductances without an MNA row
+        mna = [vs for _, _, vs in net.v_source_list]
+        for _, _, c in net.branch_list:
+            if not any(c is vs for vs in mna):
+                c.stamp(A, b, net.node_indices[c.component.node1],
+                        net.node_indices[c.component.node2], ctx)
+
+        for k, (_, _, vs) in enumerate(net.v_source_list):
+            vs.stamp(A, b, net.node_indices[vs.component.node1],
+                     net.node_indices[vs.component.node2],
+                     StampContext(voltage_source_index=net.num_nodes+k))
+
+        # Ground is eliminated, the rest is moved to the plan's (reordered)
+        # unknown layout
+        keep = [i for i in range(net.num_nodes)
+                if net.plan.node_unknown[i] >= 0]
+        rows = [net.plan.node_unknown[i] for i in keep]
+        keep += [net.num_nodes + k for k in range(net.num_v_sources)]
+        rows += list(net.plan.vs_unknown)
+
+        A_red = np.zeros((len(rows), len(rows)))
+        b_red = np.zeros(len(rows))
+        A_red[np.ix_(rows, rows)] = A[np.ix_(keep, keep)]
+        b_red[rows] = b[keep]
+
+        return A_red, b_red
+
+    def check_against_stamps(self, net):
+
+        for default_dt in (True, False):
+            ctx = StampContext(dt=1e-3, default_dt=default_dt,
+                               discretization=net.discretization)
+
+            A, b = net.engine.assemble(ctx)
+            A_ref, b_ref = self.stamp_reference(net, ctx)
+
+            if hasattr(A, 'toarray'):
+                A = A.toarray()
+
+            np.testing.assert_allclose(A, A_ref, rtol=1e-12, atol=0.0)
+            np.testing.assert_allclose(b, b_ref, rtol=1e-12, atol=0.0)
+
+    def test_dense_assembly_matches_stamps(self):
+        """
+        TEST 1: DENSE ENGINE ASSEMBLY MATCHES COMPONENT STAMPS
+
+        """
+        net = self.make_network()
+        self.assertFalse(net.engine.sparse)
+        self.assertEqual(net.engine.size, 
+                         net.num_nodes - 1 + net.num_v_sources)
+        self.check_against_stamps(net)
+
+    def test_sparse_assembly_matches_stamps(self):
+        """
+        TEST 2: SPARSE (CSR) ENGINE ASSEMBLY MATCHES COMPONENT STAMPS
+
+        """
+        net = self.make_network(MathChecks(sparse_threshold=0))
+        self.assertTrue(net.engine.sparse)
+        self.check_against_stamps(net)
+
+    def test_assembly_with_every_unknown_ordering(self):
+        """
+        TEST 3: REORDERED UNKNOWNS ASSEMBLE THE PERMUTED STAMP SYSTEM
+
+        """
+        for ordering in ('none', 'rcm', 'mindegree'):
+            net = self.make_network(MathChecks(node_ordering=ordering))
+            self.assertEqual(net.plan.ordering, ordering)
+            self.check_against_stamps(net)
+
+# -----------------------------------------------------------------------------
+# Run tests
+# -----------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 15:59:37 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built-in
+import json
+import os
+import tempfile
+import unittest
+import numpy as np
+
+# Custom modules
+from config_classes.numeric_checks import MathChecks
+from data_classes.stamp_context import StampContext
+from enums.discretization_type import DiscretizationType
+from enums.solver_backend import SolverBackend
+from examples.rlc_network import build_rlc_network
+from examples.switched_ladder_network import build_switched_ladder_network
+from networks.assembly_engine import AssemblyEngine
+from networks.input_driver import InputDriver
+from solvers.autotuner import Autotuner
+from solvers.solver_factory import build_solver
+from solvers.superlu_solver import SuperLUSolver
+
+# -----------------------------------------------------------------------------
+# Define unit test cases
+# -----------------------------------------------------------------------------
+
+class AutotunerTests(unittest.TestCase):
+
+    def setUp(self):
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'autotune.json')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_autotune_times_candidates_and_persists(self):
+        """
+        TEST 1: AUTOTUNE TIMES EVERY CANDIDATE AND STORES THE FASTEST
+
+        """
+        net = build_switched_ladder_network(sections=6, capacitance=1e-3)
+        result = net.autotune(path=self.path, cycles=2, reuse_steps=3)
+
+        self.assertIn('DENSE_LU', result.timings)
+        for ordering in SuperLUSolver.ORDERINGS:
+            self.assertIn(f'SUPERLU/{ordering}', result.timings)
+
+        # Winner is the cheapest timed candidate and is now in use
+        fastest = min(result.timings, key=result.timings.get)
+        self.assertEqual(fastest.split('/')[0], result.backend.name)
+        self.assertEqual(net.solver.sparse,
+                         result.backend not in (SolverBackend.DENSE_LU,
+                                                SolverBackend.CHOLESKY))
+
+        with open(self.path) as f:
+            stored = json.load(f)
+        self.assertEqual(stored[result.fingerprint]['backend'],
+                         result.backend.name)
+
+    def test_later_runs_start_with_stored_setup(self):
+        """
+        TEST 2: SAME TOPOLOGY LOADS THE STORED CHOICE, OTHERS IGNORE IT
+
+        """
+        net, _, _, _ = build_rlc_network(
+            discretization=DiscretizationType.BDF2)
+        fingerprint = net.compile().fingerprint()
+
+        # Pretend an earlier trial picked SuperLU with MMD ordering
+        with open(self.path, 'w') as f:
+            json.dump({fingerprint: {'backend': 'SUPERLU',
+                                     'ordering': 'MMD_AT_PLUS_A'}}, f)
+
+        numerics = MathChecks(autotune_file=self.path)
+        later, _, _, _ = build_rlc_network(
+            discretization=DiscretizationType.BDF2)
+        later.numerics = numerics
+        later.solve(time=np.linspace(0, 0.1, 11),
+                    input_driver=InputDriver(sources={'V1': lambda t: 1.0}))
+
+        self.assertIsInstance(later.solver, SuperLUSolver)
+        self.assertEqual(later.solver.ordering, 'MMD_AT_PLUS_A')
+
+        other = build_switched_ladder_network(sections=3, numerics=numerics)
+        other.compile()
+        self.assertNotEqual(other.plan.fingerprint(), fingerprint)
+        self.assertEqual(other.solver.__class__.__name__,
+                         'DenseCholeskySolver')
+
+    def test_iterative_trial_is_not_warm_started_on_the_answer(self):
+        """
+        TEST 3: TIMED ITERATIVE SOLVES START AWAY FROM THEIR SOLUTION
+
+        """
+        net = build_switched_ladder_network(sections=6, capacitance=1e-3)
+        net.compile()
+        net._update_comps()
+        ctx = StampContext(dt=1e-3, default_dt=True)
+        tuner = Autotuner(net.numerics, cycles=3, reuse_steps=4)
+        companions = AssemblyEngine(net.plan, net.numerics).gather(ctx)
+
+        iterations = []
+        solver = build_solver(SolverBackend.ITERATIVE, net.numerics,
+                              net.plan.num_unknowns)
+        solve = solver.solve
+        solver.solve = lambda factor, b: (solve(factor, b),
+                                          iterations.append(
+                                              solver.last_iterations))[0]
+        tuner._time_candidate(net.plan, companions, solver)
+
+        self.assertEqual(len(iterations), 12)
+        self.assertTrue(all(its > 0 for its in iterations))
+
+    def test_dense_candidates_capped_by_size(self):
+        """
+        TEST 4: NO DENSE TRIALS ON LARGE SYSTEMS, MEMORY ERRORS ARE FAILED
+        CANDIDATES
+
+        """
+        net = build_switched_ladder_network(sections=6, capacitance=1e-3)
+        plan = net.compile()
+        net._update_comps()
+        ctx = StampContext(dt=1e-3, default_dt=False)
+
+        labels = lambda tuner: [c[0] for c in tuner.candidates(plan)]
+        self.assertIn('DENSE_LU', labels(Autotuner(net.numerics)))
+        small = Autotuner(net.numerics, dense_max=plan.num_unknowns - 1)
+        self.assertNotIn('DENSE_LU', labels(small))
+        self.assertNotIn('CHOLESKY', labels(small))
+        self.assertIn('SUPERLU/COLAMD', labels(small))
+
+        # A dense trial running out of memory does not end the run
+        tuner = Autotuner(net.numerics, cycles=1, reuse_steps=1)
+        time_candidate = tuner._time_candidate
+
+        def out_of_memory(plan, companions, solver):
+            if not solver.sparse:
+                raise MemoryError()
+            return time_candidate(plan, companions, solver)
+
+        tuner._time_candidate = out_of_memory
+        result = tuner.run(plan, ctx)
+        self.assertEqual(result.failures['DENSE_LU'], 'MemoryError')
+        self.assertNotIn('DENSE_LU', result.timings)
+        self.assertNotIn(result.backend, (SolverBackend.DENSE_LU,
+                                          SolverBackend.CHOLESKY))
+
+# -----------------------------------------------------------------------------
+# Run tests
+# -----------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
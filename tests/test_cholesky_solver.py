@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 23:04:55 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built-in
+import unittest
+import numpy as np
+import scipy.sparse as sp
+
+# Custom modules
+from config_classes.numeric_checks import MathChecks
+from data_classes.stamp_context import StampContext
+from enums.discretization_type import DiscretizationType
+from enums.solver_backend import SolverBackend
+from examples.parallel_network import build_parallel_network
+from examples.rlc_network import build_rlc_network
+from examples.switched_ladder_network import build_switched_ladder_network
+from networks.input_driver import InputDriver
+from solvers.cholesky_solver import (DenseCholeskySolver, LUFallback,
+                                     SparseCholeskySolver,
+                                     conductance_spread)
+from solvers.dense_lu_solver import DenseLUSolver
+from solvers.superlu_solver import SuperLUSolver
+
+# -----------------------------------------------------------------------------
+# Define unit test cases
+# -----------------------------------------------------------------------------
+
+class CholeskySolverTests(unittest.TestCase):
+
+    def run_rlc(self, numerics):
+
+        net, _, _, _ = build_rlc_network(
+            discretization=DiscretizationType.BDF2)
+        net.numerics = numerics
+        net.solve(time=np.linspace(0, 1.0, 51),
+                  input_driver=InputDriver(sources={'V1': lambda t: 12.0}))
+
+        return net
+
+    def test_auto_picks_cholesky_for_symmetric_networks(self):
+        """
+        TEST 1: SYMMETRIC NETWORKS FACTOR WITH CHOLESKY, MNA SOURCES WITH LU
+
+        """
+        reference = self.run_rlc(MathChecks(
+            solver_backend=SolverBackend.DENSE_LU))
+
+        # Sparse plans only take the Cholesky path with CHOLMOD
+        sparse_type = (SparseCholeskySolver if
+                       SparseCholeskySolver.available() else SuperLUSolver)
+        for numerics, solver_type in (
+                (MathChecks(), DenseCholeskySolver),
+                (MathChecks(sparse_threshold=0), sparse_type),
+                (MathChecks(solver_backend=SolverBackend.SPARSE_CHOLESKY),
+                 SparseCholeskySolver)):
+            net = self.run_rlc(numerics)
+
+            self.assertTrue(net.plan.is_symmetric)
+            self.assertIsInstance(net.solver, solver_type)
+            self.assertEqual(getattr(net.solver, 'num_fallbacks', 0), 0)
+            np.testing.assert_allclose(net.sim_data.node_v,
+                                       reference.sim_data.node_v,
+                                       rtol=1e-9, atol=1e-12)
+
+        # An ideal source row makes A indefinite
+        net = self.run_rlc(MathChecks(norton_sources=False))
+        self.assertFalse(net.plan.is_symmetric)
+        self.assertIsInstance(net.solver, DenseLUSolver)
+
+    def test_indefinite_matrix_falls_back_to_lu(self):
+        """
+        TEST 2: A MATRIX THAT IS NOT POSITIVE DEFINITE IS FACTORED BY LU
+
+        """
+        rng = np.random.default_rng(5)
+        A = np.array([[2.0, 1.0, 0.0],
+                      [1.0, -3.0, 1.0],
+                      [0.0, 1.0, 4.0]])
+        b = rng.normal(size=3)
+
+        for solver in (DenseCholeskySolver(), SparseCholeskySolver()):
+            factor = solver.factor(sp.csr_matrix(A) if solver.sparse else A)
+
+            self.assertIsInstance(factor, LUFallback)
+            self.assertEqual(solver.num_fallbacks, 1)
+            np.testing.assert_allclose(A @ solver.solve(factor, b), b,
+                                       rtol=1e-12, atol=1e-12)
+            np.testing.assert_allclose(
+                A.T @ solver.solve_transpose(factor, b), b,
+                rtol=1e-12, atol=1e-12)
+
+    def test_sparse_cholesky_on_large_ladder(self):
+        """
+        TEST 3: SPARSE CHOLESKY TRANSIENT ON A LARGE RC LADDER MATCHES
+        SUPERLU, REFACTORING WITHOUT FALLBACKS
+
+        """
+        # Two step sizes - two numeric factorizations of one pattern
+        time = np.concatenate((np.linspace(0, 0.05, 11),
+                               np.linspace(0.05, 0.15, 11)[1:]))
+        driver = InputDriver(sources={'V1': lambda t: 12.0*np.cos(30*t)})
+
+        nets = []
+        for backend in (SolverBackend.SUPERLU,
+                        SolverBackend.SPARSE_CHOLESKY):
+            net = build_switched_ladder_network(
+                sections=220, capacitance=1e-3,
+                numerics=MathChecks(solver_backend=backend))
+            net.solve(time=time, input_driver=driver)
+            nets.append(net)
+        reference, net = nets
+
+        self.assertGreaterEqual(net.engine.size, 200)
+        self.assertIsInstance(net.solver, SparseCholeskySolver)
+        self.assertEqual(net.solver.num_fallbacks, 0)
+        self.assertEqual(net.factor_cache.misses, 2)
+        if not SparseCholeskySolver.available():
+            self.assertEqual(net.solver.num_orderings, 1)
+        np.testing.assert_allclose(net.sim_data.node_v,
+                                   reference.sim_data.node_v,
+                                   rtol=1e-9, atol=1e-12)
+
+    def test_auto_keeps_lu_for_wide_conductance_spread(self):
+        """
+        TEST 4: 1e-10 OHM WIRES NEXT TO OHM RESISTORS - AUTO FACTORS WITH LU
+        AND MATCHES THE DENSE LU SOLUTION
+
+        """
+        nets = []
+        for backend in (SolverBackend.DENSE_LU, SolverBackend.AUTO,
+                        SolverBackend.CHOLESKY):
+            net = build_parallel_network()
+            net.numerics = MathChecks(solver_backend=backend)
+            net.solve()
+            nets.append(net)
+        reference, auto, cholesky = nets
+
+        self.assertTrue(auto.plan.is_symmetric)
+        self.assertIsInstance(auto.solver, DenseCholeskySolver)
+        self.assertEqual(auto.solver.num_fallbacks, 1)
+        np.testing.assert_array_equal(auto.sim_data.node_v,
+                                      reference.sim_data.node_v)
+
+        # Explicitly chosen Cholesky is not second guessed
+        self.assertEqual(cholesky.solver.num_fallbacks, 0)
+        self.assertGreater(conductance_spread(
+            auto.engine.assemble(StampContext())[0]),
+            auto.numerics.cholesky_max_spread)
+
+# -----------------------------------------------------------------------------
+# Run tests
+# -----------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 21:24:10 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built in
+import unittest
+import numpy as np
+
+# Custom classes
+from components.current_source import CurrentSource
+from components.resistor import Resistor
+from data_classes.component_data import ComponentData
+from data_classes.component_data import IdealComponentData
+from data_classes.stamp_context import StampContext
+from enums.calculation_mode import CalculationMode
+from enums.component_type import ComponentType
+from networks.input_driver import InputDriver
+from networks.network import Network
+
+# -----------------------------------------------------------------------------
+# Define unit test cases
+# -----------------------------------------------------------------------------
+
+class CurrentSourceTests(unittest.TestCase):
+
+    def make_source(self, name='I1', ideal_current=2.0):
+
+        return CurrentSource(ComponentData(
+            name=name,
+            node1='n0',
+            node2='n1',
+            current=0.0,
+            voltage=0.0,
+            mode=CalculationMode.VOLTAGE,
+            ctype=ComponentType.CURRENT_SOURCE,
+            ideal_params=IdealComponentData(ideal_current=ideal_current)))
+
+    def make_resistor(self, name, resistance):
+
+        return Resistor(ComponentData(
+            name=name,
+            node1='n1',
+            node2='n0',
+            resistance=resistance,
+            voltage=0.0,
+            current=0.0,
+            mode=CalculationMode.VOLTAGE,
+            ctype=ComponentType.RESISTOR))
+
+    def test_companion_and_stamp(self):
+        """
+        TEST 1: CURRENT SOURCE ONLY INJECTS INTO B, SHOULD PASS
+
+        """
+        isource = self.make_source()
+        isource.update()
+
+        self.assertEqual(isource.component.current, 2.0)
+        self.assertEqual(isource.companion(StampContext()), (0.0, 2.0))
+
+        A, b = np.zeros((2, 2)), np.zeros(2)
+        isource.stamp(A, b, 0, 1, StampContext())
+        np.testing.assert_array_equal(A, 0.0)
+        np.testing.assert_array_equal(b, [-2.0, 2.0])
+
+        isource.component.ideal_params = None
+        with self.assertRaises(ValueError):
+            isource.update()
+
+    def test_source_into_resistor(self):
+        """
+        TEST 2: CURRENT SOURCE DRIVEN THROUGH A RESISTOR, SHOULD PASS
+
+        """
+        net = Network()
+        net.add_component('n0', 'n1', self.make_source())
+        net.add_component('n1', 'n0', self.make_resistor('R1', 5.0))
+
+        time = np.linspace(0, 1.0, 11)
+        driver = InputDriver(sources={'I1': lambda t: 3.0*t})
+        net.solve(time=time, input_driver=driver)
+
+        i_source = 3.0*time[1:]
+        k = net.node_indices['n1']
+        np.testing.assert_allclose(net.sim_data.node_v[:, k], 5.0*i_source,
+                                   rtol=1e-12, atol=1e-12)
+        np.testing.assert_allclose(
+            net.sim_data.branch_i[:, net.sim_data.branch_names.index('I1')],
+            i_source)
+        self.assertEqual(net.engine.size, 1)
+
+    def test_current_source_cut_set_rejected(self):
+        """
+        TEST 3: NODE FED ONLY BY A CURRENT SOURCE IS STRUCTURALLY SINGULAR
+
+        """
+        net = Network()
+        net.add_component('n0', 'n1', self.make_source())
+        net.add_component('n1', 'n0', self.make_resistor('R1', 5.0))
+        net.add_component('n1', 'n2', self.make_source('I2'))
+        net.add_component('n2', 'n3', self.make_resistor('R2', 1.0))
+        net.add_component('n3', 'n1', self.make_source('I3'))
+
+        with self.assertRaises(ValueError) as err:
+            net.compile()
+        self.assertIn("cut-set of current sources: ['I2', 'I3']",
+                      str(err.exception))
+
+# -----------------------------------------------------------------------------
+# Run tests
+# -----------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
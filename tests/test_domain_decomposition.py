@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 15:20:44 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built-in
+import unittest
+import numpy as np
+
+# Custom modules
+from components.capacitor import Capacitor
+from components.resistor import Resistor
+from components.voltage_source import VoltageSource
+from config_classes.numeric_checks import MathChecks
+from data_classes.component_data import (ComponentData, DiscretizationData,
+                                         IdealComponentData)
+from data_classes.stamp_context import StampContext
+from enums.calculation_mode import CalculationMode
+from enums.component_type import ComponentType
+from enums.solver_backend import SolverBackend
+from networks.input_driver import InputDriver
+from networks.network import Network
+from networks.unknown_ordering import partition_unknowns
+from solvers.domain_decomposition_solver import DomainDecompositionSolver
+
+# -----------------------------------------------------------------------------
+# Define unit test cases
+# -----------------------------------------------------------------------------
+
+class DomainDecompositionTests(unittest.TestCase):
+
+    def build_mesh(self, size=12, numerics=None, backend=None):
+        """
+        size x size resistor mesh, every node with a capacitor to n0. V1
+        (n0 -> m0_0) feeds a corner through 0.5 ohm, the ideal source V2
+        sits between two inner nodes (an MNA row without diagonal).
+        """
+
+        net = Network(numerics=numerics, solver=backend)
+
+        def add(n1, n2, name, **kwargs):
+            data = ComponentData(name=name, node1=n1, node2=n2,
+                                 voltage=0.0, current=0.0,
+                                 mode=CalculationMode.VOLTAGE, **kwargs)
+            if 'capacitance' in kwargs:
+                data.discrete_data = DiscretizationData()
+                net.add_component(n1, n2, Capacitor(data))
+            elif 'ideal_params' in kwargs:
+                data.ctype = ComponentType.VOLTAGE_SOURCE
+                net.add_component(n1, n2, VoltageSource(data))
+            else:
+                data.ctype = ComponentType.RESISTOR
+                net.add_component(n1, n2, Resistor(data))
+
+        add('n0', 'm0_0', 'V1', ideal_params=IdealComponentData(
+            ideal_voltage=10.0, int_resistance=0.5))
+        for i in range(size):
+            for j in range(size):
+                node = f'm{i}_{j}'
+                add(node, 'n0', f'C{i}_{j}', capacitance=1e-3)
+                if i + 1 < size:
+                    add(node, f'm{i+1}_{j}', f'Rv{i}_{j}',
+                        resistance=1.0 + 0.01*j)
+                if j + 1 < size:
+                    add(node, f'm{i}_{j+1}', f'Rh{i}_{j}',
+                        resistance=1.0 + 0.01*i)
+        mid = size // 2
+        add(f'm{mid}_{mid}', f'm{mid}_{mid+1}', 'V2',
+            ideal_params=IdealComponentData(ideal_voltage=1.0))
+
+        return net
+
+    def test_partition_is_bordered_block_diagonal(self):
+        """
+        TEST 1: SUBDOMAINS ONLY COUPLE THROUGH INTERFACE UNKNOWNS
+
+        """
+        net = self.build_mesh(size=20)
+        net.compile()
+        A, _ = net.engine.assemble(StampContext(dt=1e-3))
+        S = (abs(A) + abs(A).T).tocsr()
+        part = partition_unknowns(S, 4)
+
+        self.assertEqual(part.max() + 1, 4)
+        rows, cols = S.nonzero()
+        coupled = (part[rows] >= 0) & (part[cols] >= 0)
+        np.testing.assert_array_equal(part[rows][coupled],
+                                      part[cols][coupled])
+
+        # Interface is a thin separator, subdomains are balanced
+        sizes = np.bincount(part[part >= 0])
+        self.assertLess(np.count_nonzero(part < 0), 0.15*len(part))
+        self.assertLess(sizes.max(), 2*sizes.min())
+
+    def test_matches_superlu_transient(self):
+        """
+        TEST 2: THREADED SUBDOMAIN SOLVE MATCHES SUPERLU, IDEAL SOURCE ROW
+
+        """
+        time = np.linspace(0, 0.05, 11)
+        driver = InputDriver(sources={'V1': lambda t: 10.0*np.cos(200*t)})
+
+        results = []
+        for backend in (SolverBackend.SUPERLU,
+                        SolverBackend.DOMAIN_DECOMPOSITION):
+            net = self.build_mesh(numerics=MathChecks(dd_parts=4,
+                                                      dd_workers=2),
+                                  backend=backend)
+            net.solve(time=time, input_driver=driver)
+            results.append(net)
+
+        reference, decomposed = results
+        self.assertIsInstance(decomposed.solver, DomainDecompositionSolver)
+        self.assertEqual(decomposed.solver.num_parts, 4)
+
+        # The ideal source current is an interface unknown
+        v2_row = decomposed.plan.vs_unknown[0]
+        self.assertIn(v2_row, decomposed.solver.perm[
+            decomposed.solver.offsets[-1]:])
+
+        np.testing.assert_allclose(decomposed.sim_data.node_v,
+                                   reference.sim_data.node_v,
+                                   rtol=1e-9, atol=1e-10)
+        np.testing.assert_allclose(decomposed.sim_data.branch_i,
+                                   reference.sim_data.branch_i,
+                                   rtol=1e-8, atol=1e-9)
+
+    def test_decomposition_report(self):
+        """
+        TEST 3: REPORT TIMES EVERY WORKER COUNT AGAINST SUPERLU
+
+        """
+        net = self.build_mesh(numerics=MathChecks(dd_parts=3))
+        report = net.decomposition_report(workers=(1, 2), cycles=1)
+
+        self.assertEqual(sorted(report.timings), [1, 2])
+        self.assertEqual(report.speedup[1], 1.0)
+        self.assertEqual(report.num_parts, 3)
+        self.assertEqual(sum(report.part_sizes) + report.num_interface,
+                         report.num_unknowns)
+        self.assertGreater(report.superlu_time, 0.0)
+        self.assertIn('3 subdomains', str(report))
+
+# -----------------------------------------------------------------------------
+# Run tests
+# -----------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
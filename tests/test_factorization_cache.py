@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 10:52:06 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built-in
+import unittest
+import numpy as np
+
+# Custom modules
+from config_classes.numeric_checks import MathChecks
+from enums.discretization_type import DiscretizationType
+from examples.rlc_network import build_rlc_network
+from examples.switched_ladder_network import build_switched_ladder_network
+from networks.factorization_cache import FactorizationCache
+from networks.input_driver import InputDriver
+
+# -----------------------------------------------------------------------------
+# Define unit test cases
+# -----------------------------------------------------------------------------
+
+class FactorizationCacheTests(unittest.TestCase):
+
+    def test_cache_requires_matching_values(self):
+        """
+        TEST 1: CACHED FACTORS ARE ONLY RETURNED FOR IDENTICAL A VALUES
+
+        """
+        cache = FactorizationCache(capacity=2)
+        values = np.array([1.0, 2.0, 3.0])
+        cache.put('key', values, 'lu')
+
+        self.assertEqual(cache.get('key', values.copy()), 'lu')
+        self.assertIsNone(cache.get('key', values + 1e-12))
+        self.assertIsNone(cache.get('other', values))
+
+    def test_cache_evicts_least_recently_used(self):
+        """
+        TEST 2: CACHE HOLDS AT MOST CAPACITY ENTRIES
+
+        """
+        cache = FactorizationCache(capacity=2)
+        values = np.zeros(1)
+        cache.put('a', values, 1)
+        cache.put('b', values, 2)
+        cache.get('a', values)
+        cache.put('c', values, 3)
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get('b', values))
+        self.assertEqual(cache.get('a', values), 1)
+
+    def test_bdf2_transient_uses_two_factorizations(self):
+        """
+        TEST 3: CONSTANT DT BDF2 TRANSIENT FACTORS A ONCE PER PHASE
+
+        """
+        net, _, _, _ = build_rlc_network(
+            discretization=DiscretizationType.BDF2)
+        time = np.linspace(0, 1.0, 101)
+        driver = InputDriver(sources={'V1': lambda t: 12.0})
+
+        factor_calls = []
+        factor = net._factor
+        net._factor = lambda A: factor_calls.append(1) or factor(A)
+
+        net.solve(time=time, input_driver=driver)
+
+        self.assertEqual(len(factor_calls), 2)
+        self.assertEqual(len(net.factor_cache), 2)
+
+        # A component value change invalidates the cached factorization
+        net.components_by_name['R1'].component.resistance *= 2
+        net.solve(time=time, input_driver=driver)
+        self.assertEqual(len(factor_calls), 3)
+
+    def test_pwm_switch_configurations_factor_once(self):
+        """
+        TEST 4: EACH SWITCH CONFIGURATION IS FACTORED ONCE IN A PWM TRANSIENT
+
+        """
+        net = build_switched_ladder_network(
+            sections=4, capacitance=1e-3,
+            numerics=MathChecks(factor_cache_size=4))
+        time = np.linspace(0, 0.4, 401)
+
+        # Two PWM legs out of phase - four distinct switch configurations
+        k = np.arange(len(time))
+        driver = InputDriver(
+            sources={'V1': lambda t: 12.0},
+            states={'S1': (k // 5) % 2 == 0, 'S2': (k // 10) % 2 == 0})
+
+        factor_calls = []
+        factor = net._factor
+        net._factor = lambda A: factor_calls.append(1) or factor(A)
+
+        net.solve(time=time, input_driver=driver)
+
+        # Backward Euler has a single phase - one factorization per
+        # configuration, every other step is a back-substitution
+        self.assertEqual(len(factor_calls), 4)
+        self.assertEqual(net.factor_cache.misses, 4)
+        self.assertEqual(net.factor_cache.hits, len(time) - 1 - 4)
+        self.assertGreater(net.factor_cache.hit_rate, 0.98)
+
+        # Switch bitmask carries S1 in bit 0 and S2 in bit 1
+        switch_bits = {key[2] for key in net.factor_cache._entries}
+        self.assertEqual(switch_bits, {0, 1, 2, 3})
+
+# -----------------------------------------------------------------------------
+# Run tests
+# -----------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 22:08:31 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built-in
+import unittest
+import numpy as np
+
+# Custom modules
+from components.capacitor import Capacitor
+from components.resistor import Resistor
+from components.voltage_source import VoltageSource
+from config_classes.numeric_checks import MathChecks
+from data_classes.component_data import (ComponentData, DiscretizationData,
+                                         IdealComponentData)
+from data_classes.stamp_context import StampContext
+from enums.calculation_mode import CalculationMode
+from enums.component_type import ComponentType
+from networks.input_driver import InputDriver
+from networks.network import Network
+from solvers.iterative_solver import IterativeSolver
+
+# -----------------------------------------------------------------------------
+# Define unit test cases
+# -----------------------------------------------------------------------------
+
+class FixedPotentialTests(unittest.TestCase):
+
+    def source(self, name, voltage):
+        return VoltageSource(ComponentData(
+            name=name, node1='', node2='', voltage=0.0, current=0.0,
+            mode=CalculationMode.VOLTAGE,
+            ctype=ComponentType.VOLTAGE_SOURCE,
+            ideal_params=IdealComponentData(ideal_voltage=voltage,
+                                            int_resistance=0.0)))
+
+    def resistor(self, name, resistance):
+        return Resistor(ComponentData(
+            name=name, node1='', node2='', resistance=resistance,
+            voltage=0.0, current=0.0, mode=CalculationMode.VOLTAGE,
+            ctype=ComponentType.RESISTOR))
+
+    def capacitor(self, name, capacitance):
+        return Capacitor(ComponentData(
+            name=name, node1='', node2='', capacitance=capacitance,
+            voltage=0.0, current=0.0,
+            ctype=ComponentType.CAPACITOR,
+            discrete_data=DiscretizationData()))
+
+    def supply_network(self, rails=4, numerics=None):
+        """
+        Ideal rails V1..Vk from ground, each feeding a load node with a
+        decoupling capacitor, neighbouring loads cross coupled
+        """
+
+        net = Network(numerics=numerics)
+        for k in range(1, rails + 1):
+            # Rails alternate orientation - node1 or node2 on ground
+            if k % 2:
+                net.add_component('n0', f'r{k}', self.source(f'V{k}', k))
+            else:
+                net.add_component(f'r{k}', 'n0', self.source(f'V{k}', -k))
+            net.add_component(f'r{k}', f'l{k}', self.resistor(f'Rf{k}', 0.5))
+            net.add_component(f'l{k}', 'n0', self.resistor(f'Rl{k}', 10.0))
+            net.add_component(f'l{k}', 'n0', self.capacitor(f'C{k}', 1e-3))
+            if k > 1:
+                net.add_component(f'l{k-1}', f'l{k}',
+                                  self.resistor(f'Rx{k}', 3.0))
+        return net
+
+    def test_rails_match_mna(self):
+        """
+        TEST 1: FIXED POTENTIAL RAILS MATCH THE MNA SOLUTION, TWO UNKNOWNS
+        LESS PER RAIL
+
+        """
+        time = np.linspace(0, 0.05, 26)
+        driver = InputDriver(sources={'V3': lambda t: 3.0 + np.sin(200*t)})
+
+        runs = []
+        for fixed in (False, True):
+            net = self.supply_network(
+                numerics=MathChecks(fixed_potentials=fixed))
+            net.solve(time=time, input_driver=driver)
+            runs.append(net)
+        mna, fixed = runs
+
+        self.assertEqual(len(fixed.plan.fixed_branch), 4)
+        self.assertEqual(fixed.plan.num_v_sources, 0)
+        self.assertEqual(fixed.engine.size, mna.engine.size - 2*4)
+        self.assertEqual(fixed.node_voltages['r2'], 2.0)
+
+        for attr in ('node_v', 'branch_v', 'branch_i'):
+            np.testing.assert_allclose(getattr(fixed.sim_data, attr),
+                                       getattr(mna.sim_data, attr),
+                                       rtol=1e-9, atol=1e-12)
+
+    def test_rail_network_is_spd(self):
+        """
+        TEST 2: RAILS ON THE RIGHT HAND SIDE LEAVE A SYMMETRIC POSITIVE
+        DEFINITE NODAL MATRIX
+
+        """
+        net = self.supply_network()
+        net.solver_choice = IterativeSolver()
+        net.solve(time=np.linspace(0, 0.01, 3),
+                  input_driver=InputDriver())
+
+        A, _ = net.engine.assemble(StampContext(dt=1e-3, default_dt=False))
+        A = A.toarray()
+        np.testing.assert_array_equal(A, A.T)
+        np.linalg.cholesky(A)
+        self.assertEqual(net.factor_cache._entries.popitem()[1][1].method,
+                         'cg')
+
+    def test_floating_and_degenerate_sources(self):
+        """
+        TEST 3: FLOATING IDEAL SOURCES KEEP THEIR ROW, A NETWORK OF RAILS
+        ONLY SOLVES WITHOUT UNKNOWNS
+
+        """
+        net = Network()
+        net.add_component('n0', 'n1', self.source('V1', 5.0))
+        net.add_component('n1', 'n2', self.resistor('R1', 2.0))
+        net.add_component('n2', 'n3', self.source('V2', 1.0))
+        net.add_component('n3', 'n0', self.resistor('R2', 2.0))
+        net.solve()
+
+        self.assertEqual(list(net.plan.fixed_branch), [0])
+        self.assertEqual(net.plan.num_v_sources, 1)
+        self.assertAlmostEqual(net.components_by_name['V1'].component.current,
+                               1.5)
+        self.assertAlmostEqual(net.components_by_name['V2'].component.current,
+                               1.5)
+
+        # A rail that picks up an internal resistance recompiles as a
+        # Norton equivalent
+        net.components_by_name['V1'].component.ideal_params.int_resistance = 1
+        net.solve()
+        self.assertEqual(len(net.plan.fixed_branch), 0)
+        self.assertEqual(len(net.plan.norton_branch), 1)
+        self.assertAlmostEqual(net.components_by_name['V2'].component.current,
+                               1.2)
+
+        net = Network()
+        net.add_component('n0', 'n1', self.source('V1', 5.0))
+        net.add_component('n1', 'n0', self.resistor('R1', 2.0))
+        net.solve()
+
+        self.assertEqual(net.engine.size, 0)
+        self.assertEqual(net.node_voltages['n1'], 5.0)
+        self.assertAlmostEqual(net.components_by_name['V1'].component.current,
+                               2.5)
+
+# -----------------------------------------------------------------------------
+# Run tests
+# -----------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
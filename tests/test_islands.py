@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 20:26:51 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built-in
+import unittest
+import numpy as np
+
+# Custom modules
+from components.resistor import Resistor
+from components.voltage_source import VoltageSource
+from config_classes.numeric_checks import MathChecks
+from data_classes.component_data import ComponentData, IdealComponentData
+from enums.calculation_mode import CalculationMode
+from enums.component_type import ComponentType
+from enums.solver_backend import SolverBackend
+from examples.switched_ladder_network import build_switched_ladder_network
+from networks.input_driver import InputDriver
+from networks.network import Network
+
+# -----------------------------------------------------------------------------
+# Define unit test cases
+# -----------------------------------------------------------------------------
+
+class IslandTests(unittest.TestCase):
+
+    def add_divider(self, net, prefix='a', voltage=6.0):
+        """
+        Resistive divider island: V (a0 -> a1), R1 (a1 -> a2), R2 (a2 -> a0)
+        """
+
+        n0, n1, n2 = f'{prefix}0', f'{prefix}1', f'{prefix}2'
+
+        net.add_component(n0, n1, VoltageSource(ComponentData(
+            name=f'{prefix}V', node1=n0, node2=n1,
+            voltage=0.0, current=0.0,
+            mode=CalculationMode.CURRENT,
+            ctype=ComponentType.VOLTAGE_SOURCE,
+            ideal_params=IdealComponentData(ideal_voltage=voltage,
+                                            int_resistance=0.5))))
+
+        for name, (na, nb), r in ((f'{prefix}R1', (n1, n2), 2.0),
+                                  (f'{prefix}R2', (n2, n0), 4.0)):
+            net.add_component(na, nb, Resistor(ComponentData(
+                name=name, node1=na, node2=nb, resistance=r,
+                voltage=0.0, current=0.0,
+                mode=CalculationMode.VOLTAGE,
+                ctype=ComponentType.RESISTOR)))
+
+        return net
+
+    def run_pair(self, numerics=None):
+        """
+        Switched RC ladder (island 0) next to a DC divider (island 1)
+        """
+
+        net = build_switched_ladder_network(sections=4, capacitance=1e-3,
+                                            numerics=numerics)
+        self.add_divider(net)
+
+        time = np.linspace(0, 0.2, 21)
+        k = np.arange(len(time))
+        driver = InputDriver(sources={'V1': lambda t: 12.0*np.cos(20*t)},
+                             states={'S1': (k // 4) % 2 == 0})
+        net.solve(time=time, input_driver=driver)
+
+        return net, time, driver
+
+    def test_islands_match_separate_networks(self):
+        """
+        TEST 1: EACH ISLAND SOLVES AS IF IT WERE ITS OWN NETWORK
+
+        """
+        net, time, driver = self.run_pair()
+
+        self.assertEqual(net.plan.num_islands, 2)
+        self.assertEqual(net.plan.island_grounds, ('n0', 'a0'))
+        self.assertEqual(len(net.islands), 2)
+
+        ladder = build_switched_ladder_network(sections=4, capacitance=1e-3)
+        ladder.solve(time=time, input_driver=driver)
+        divider = self.add_divider(Network())
+        divider.solve()
+
+        for node in ladder.node_list:
+            np.testing.assert_allclose(
+                net.sim_data.node_v[:, net.node_indices[node]],
+                ladder.sim_data.node_v[:, ladder.node_indices[node]],
+                rtol=1e-9, atol=1e-12)
+
+        for node in divider.node_list:
+            np.testing.assert_allclose(
+                net.sim_data.node_v[:, net.node_indices[node]],
+                divider.node_voltages[node], rtol=1e-12, atol=1e-12)
+
+        self.assertEqual(net.node_voltages['a0'], 0.0)
+
+    def test_unchanged_island_is_not_resolved(self):
+        """
+        TEST 2: THE DC ISLAND IS SOLVED ONCE, THE DRIVEN ISLAND EVERY STEP
+
+        """
+        net, time, _ = self.run_pair()
+        ladder, divider = net.islands
+        steps = len(time) - 1
+
+        self.assertEqual(divider.num_solves, 1)
+        self.assertEqual(divider.num_skipped, steps - 1)
+        self.assertEqual(ladder.num_solves, steps)
+
+        # Switch toggles only touch the ladder island cache
+        self.assertEqual(len(divider.cache), 1)
+        self.assertEqual(divider.switch_mask, 0)
+
+    def test_parallel_and_sparse_islands(self):
+        """
+        TEST 3: THREADED AND SPARSE ISLAND SOLVES MATCH THE SERIAL DENSE ONE
+
+        """
+        reference, _, _ = self.run_pair()
+
+        for numerics in (MathChecks(island_workers=2),
+                         MathChecks(island_workers=2,
+                                    solver_backend=SolverBackend.SUPERLU)):
+            net, _, _ = self.run_pair(numerics)
+            np.testing.assert_allclose(net.sim_data.node_v,
+                                       reference.sim_data.node_v,
+                                       rtol=1e-9, atol=1e-12)
+
+        # Each island keeps its own locked sparse pattern
+        for isl in net.islands:
+            self.assertEqual(isl.solver.locked.num_orderings, 1)
+
+    def test_worker_threads_are_released(self):
+        """
+        TEST 4: THE CONTEXT MANAGER, RECOMPILING AND THE FINALIZER STOP THE
+        THREAD POOL
+
+        """
+        net, _, _ = self.run_pair(MathChecks(island_workers=2))
+        with net:
+            workers = list(net._executor._threads)
+            self.assertTrue(workers)
+        self.assertIsNone(net._executor)
+        self.assertFalse(any(t.is_alive() for t in workers))
+
+        # A new topology stops the pool of the old one
+        net, _, _ = self.run_pair(MathChecks(island_workers=2))
+        workers = list(net._executor._threads)
+        self.add_divider(net, prefix='b')
+        net.compile()
+        self.assertIsNone(net._executor)
+        self.assertFalse(any(t.is_alive() for t in workers))
+
+        # The finalizer stops the pool without joining it
+        net, _, _ = self.run_pair(MathChecks(island_workers=2))
+        executor, calls = net._executor, []
+        shutdown = executor.shutdown
+        executor.shutdown = lambda wait=True: (calls.append(wait),
+                                               shutdown(wait=wait))
+        net.__del__()
+        self.assertEqual(calls, [False])
+        self.assertIsNone(net._executor)
+
+    def test_threaded_matrix_checks_recorded_on_main_thread(self):
+        """
+        TEST 5: CONDITION ESTIMATES AND WARNINGS OF THREADED ISLAND
+        FACTORIZATIONS MATCH THE SERIAL RUN
+
+        """
+        runs = [self.run_pair(MathChecks(island_workers=workers,
+                                         max_condition=1.0))[0]
+                for workers in (1, 2)]
+        serial, threaded = runs
+
+        self.assertTrue(serial.matrix_warnings)
+        self.assertEqual(sorted(threaded.matrix_warnings),
+                         sorted(serial.matrix_warnings))
+        self.assertIsNotNone(threaded.last_condition)
+
+# -----------------------------------------------------------------------------
+# Run tests
+# -----------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
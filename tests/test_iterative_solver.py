@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 16:41:05 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built-in
+import unittest
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import spsolve
+
+# Custom modules
+from config_classes.numeric_checks import MathChecks
+from enums.discretization_type import DiscretizationType
+from examples.rlc_network import build_rlc_network
+from examples.switched_ladder_network import build_switched_ladder_network
+from networks.input_driver import InputDriver
+from solvers.iterative_solver import IterativeSolver
+
+# -----------------------------------------------------------------------------
+# Define unit test cases
+# -----------------------------------------------------------------------------
+
+class IterativeSolverTests(unittest.TestCase):
+
+    def grid_conductance(self, n=20):
+        """
+        Grounded n x n resistor mesh - symmetric positive definite
+        """
+
+        lap = sp.diags([-1.0, 2.0, -1.0], [-1, 0, 1], shape=(n, n))
+        eye = sp.identity(n)
+        A = sp.kron(lap, eye) + sp.kron(eye, lap) + 0.01*sp.identity(n*n)
+
+        return A.tocsr()
+
+    def test_auto_picks_cg_for_conductance_systems(self):
+        """
+        TEST 1: SPD CONDUCTANCE MATRICES USE CG, MNA WITH SOURCES USES GMRES
+
+        """
+        A = self.grid_conductance()
+        b = np.random.default_rng(0).normal(size=A.shape[0])
+
+        for preconditioner in IterativeSolver.PRECONDITIONERS:
+            solver = IterativeSolver(preconditioner=preconditioner)
+            factor = solver.factor(A)
+            x = solver.solve(factor, b)
+
+            self.assertEqual(factor.method, 'cg')
+            self.assertGreater(solver.last_iterations, 0)
+            self.assertLess(solver.last_residual, 1e-11)
+            np.testing.assert_allclose(x, spsolve(A.tocsc(), b),
+                                       rtol=1e-9, atol=1e-10)
+
+        # Source with an MNA row - indefinite, its Norton equivalent is SPD
+        for norton, method in ((False, 'gmres'), (True, 'cg')):
+            net = build_switched_ladder_network(
+                sections=4, numerics=MathChecks(norton_sources=norton))
+            net.solver_choice = IterativeSolver()
+            net.solve()
+            self.assertEqual(
+                net.factor_cache._entries.popitem()[1][1].method, method)
+
+    def test_krylov_transients_match_direct_solve(self):
+        """
+        TEST 2: GMRES AND BICGSTAB TRANSIENTS MATCH LU, STATS PER STEP
+
+        """
+        time = np.linspace(0, 1.0, 51)
+        driver = InputDriver(sources={'V1': lambda t: 12.0})
+
+        reference, _, _, _ = build_rlc_network(
+            discretization=DiscretizationType.BDF2)
+        reference.solve(time=time, input_driver=driver)
+
+        for method in ('gmres', 'bicgstab'):
+            net, _, _, _ = build_rlc_network(
+                discretization=DiscretizationType.BDF2)
+            net.solver_choice = IterativeSolver(method=method)
+            net.solve(time=time, input_driver=driver)
+
+            np.testing.assert_allclose(net.sim_data.node_v,
+                                       reference.sim_data.node_v,
+                                       rtol=1e-8, atol=1e-9)
+
+            sim = net.sim_data
+            self.assertEqual(len(sim.solver_iterations), len(time) - 1)
+            self.assertTrue(np.all(sim.solver_residual < 1e-10))
+
+        # Direct backends report no residual
+        self.assertTrue(np.all(np.isnan(reference.sim_data.solver_residual)))
+
+    def test_warm_start_and_preconditioner_reuse(self):
+        """
+        TEST 3: WARM STARTS CUT ITERATIONS, PRECONDITIONERS ARE REUSED
+
+        """
+        # Every dt differs - A changes each step, pattern stays the same
+        time = np.cumsum(np.linspace(1e-3, 2e-3, 41)) 
+        time = np.concatenate(([0.0], time))
+        driver = InputDriver(sources={'V1': lambda t: 12.0})
+
+        iterations = {}
+        for warm_start in (True, False):
+            net = build_switched_ladder_network(sections=80,
+                                                capacitance=1e-3)
+            solver = IterativeSolver(method='gmres',
+                                     preconditioner='jacobi',
+                                     warm_start=warm_start,
+                                     precond_refresh=10)
+            net.solver_choice = solver
+            net.solve(time=time, input_driver=driver)
+            iterations[warm_start] = net.sim_data.solver_iterations.sum()
+
+            # One preconditioner per precond_refresh + 1 refactorizations
+            refactors = net.factor_cache.misses
+            self.assertEqual(solver.num_preconditioners,
+                             int(np.ceil(refactors / 11)))
+
+        self.assertLess(iterations[True], iterations[False])
+
+# -----------------------------------------------------------------------------
+# Run tests
+# -----------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
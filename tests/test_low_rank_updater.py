@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 13:48:13 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built-in
+import unittest
+import numpy as np
+
+# Custom modules
+from config_classes.numeric_checks import MathChecks
+from enums.switch_condition import SwitchCondition
+from examples.switched_ladder_network import build_switched_ladder_network
+
+# -----------------------------------------------------------------------------
+# Define unit test cases
+# -----------------------------------------------------------------------------
+
+class LowRankUpdaterTests(unittest.TestCase):
+
+    def edit_and_solve(self, net, edits):
+        """
+        Apply (name, attribute, value) edits, solve, return node voltages
+        """
+
+        for name, attr, value in edits:
+            setattr(net.components_by_name[name].component, attr, value)
+
+        net.solve()
+
+        return net.sim_data.node_v[0].copy()
+
+    def test_what_if_edits_match_full_solve(self):
+        """
+        TEST 1: RANK-K CORRECTED SOLVES MATCH A FULL REFACTORIZATION
+
+        """
+        edit_sets = [
+            [('Rs3', 'resistance', 4.0)],
+            [('Rp2', 'resistance', 20.0),
+             ('Rs5', 'resistance', 0.5), ('Rp6', 'resistance', 7.0)],
+            [('S1', 'scond', SwitchCondition.CLOSED)],
+            [('Rp4', 'resistance', 2.5)],
+            [('S1', 'scond', SwitchCondition.OPEN)],
+            [('Rs2', 'resistance', 1.5)]]
+
+        updated = build_switched_ladder_network(
+            sections=8, numerics=MathChecks(low_rank_max_rank=4))
+        reference = build_switched_ladder_network(sections=8)
+
+        self.edit_and_solve(updated, [])
+        self.edit_and_solve(reference, [])
+
+        for edits in edit_sets:
+            x = self.edit_and_solve(updated, edits)
+
+            # A closed switch (1e10 S) conditions A to ~1e10, full LU and
+            # the update both sit within g_closed*eps of the exact solution
+            closed = (updated.components_by_name['S1'].component.scond ==
+                      SwitchCondition.CLOSED)
+            tol = 1e-5 if closed else 1e-9
+            np.testing.assert_allclose(x, self.edit_and_solve(reference,
+                                                              edits),
+                                       rtol=tol, atol=tol)
+
+        # Only the switch closing on top of three earlier edits (rank 5)
+        # refactors, the open switch base takes the rest as updates
+        self.assertEqual(updated.low_rank.num_updates, 5)
+
+    def test_switch_toggles_update_open_base(self):
+        """
+        TEST 3: SWITCH TOGGLES ARE RANK ONE UPDATES OF THE OPEN SWITCH BASE
+
+        """
+        net = build_switched_ladder_network(
+            sections=6, numerics=MathChecks(low_rank_max_rank=2))
+        reference = build_switched_ladder_network(sections=6)
+        self.edit_and_solve(net, [])
+        self.edit_and_solve(reference, [])
+
+        factor_calls = []
+        factor = net._factor
+        net._factor = lambda A: factor_calls.append(1) or factor(A)
+
+        for edits in ([('S1', 'scond', SwitchCondition.CLOSED)],
+                      [('S2', 'scond', SwitchCondition.CLOSED)],
+                      [('S1', 'scond', SwitchCondition.OPEN)],
+                      [('S2', 'scond', SwitchCondition.OPEN)]):
+            np.testing.assert_allclose(self.edit_and_solve(net, edits),
+                                       self.edit_and_solve(reference, edits),
+                                       rtol=1e-5, atol=1e-5)
+
+        # Back to all open is a factor cache hit
+        self.assertEqual(len(factor_calls), 0)
+        self.assertEqual(net.low_rank.num_updates, 3)
+
+    def test_refactor_above_max_rank(self):
+        """
+        TEST 2: EDITS ABOVE THE RANK THRESHOLD REFACTOR AND RESET THE BASE
+
+        """
+        net = build_switched_ladder_network(
+            sections=6, numerics=MathChecks(low_rank_max_rank=1))
+        net.solve()
+
+        factor_calls = []
+        factor = net._factor
+        net._factor = lambda A: factor_calls.append(1) or factor(A)
+
+        self.edit_and_solve(net, [('Rs1', 'resistance', 3.0)])
+        self.assertEqual(len(factor_calls), 0)
+
+        self.edit_and_solve(net, [('Rs2', 'resistance', 3.0),
+                                  ('Rs3', 'resistance', 3.0)])
+        self.assertEqual(len(factor_calls), 1)
+        self.assertEqual(net.low_rank.num_updates, 1)
+
+# -----------------------------------------------------------------------------
+# Run tests
+# -----------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Tue Oct 20 11:36:18 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built-in
+import unittest
+import numpy as np
+
+# Custom modules
+from components.capacitor import Capacitor
+from components.resistor import Resistor
+from components.voltage_source import VoltageSource
+from config_classes.numeric_checks import MathChecks
+from data_classes.component_data import (ComponentData, DiscretizationData,
+                                         IdealComponentData)
+from data_classes.stamp_context import StampContext
+from enums.calculation_mode import CalculationMode
+from enums.component_type import ComponentType
+from enums.discretization_type import DiscretizationType
+from networks.input_driver import InputDriver
+from networks.multirate import MultiratePartition, time_constants
+from networks.network import Network
+
+# -----------------------------------------------------------------------------
+# Define unit test cases
+# -----------------------------------------------------------------------------
+
+class MultirateTests(unittest.TestCase):
+
+    def build_network(self, numerics=None):
+        """
+        Fast stage: PWM source V1 (n0 -> n1), R1 (n1 -> n2), C1 (n2 -> n0),
+        tau ~ 0.1 ms. R2 (n2 -> n3) feeds a slow RC ladder n3 .. n8 with
+        1 mF to n0 on n3 .. n7 and RL (n8 -> n0), tau ~ 25 ms.
+        """
+
+        net = Network(numerics=numerics,
+                      discretization=DiscretizationType.BDF2)
+
+        def add(n1, n2, name, **kwargs):
+            data = ComponentData(name=name, node1=n1, node2=n2,
+                                 voltage=0.0, current=0.0,
+                                 mode=CalculationMode.VOLTAGE, **kwargs)
+            if 'capacitance' in kwargs:
+                data.discrete_data = DiscretizationData()
+                net.add_component(n1, n2, Capacitor(data))
+            elif 'ideal_params' in kwargs:
+                data.ctype = ComponentType.VOLTAGE_SOURCE
+                net.add_component(n1, n2, VoltageSource(data))
+            else:
+                data.ctype = ComponentType.RESISTOR
+                net.add_component(n1, n2, Resistor(data))
+
+        add('n0', 'n1', 'V1', ideal_params=IdealComponentData())
+        add('n1', 'n2', 'R1', resistance=10.0)
+        add('n2', 'n0', 'C1', capacitance=10e-6)
+        add('n2', 'n3', 'R2', resistance=100.0)
+        for i in range(3, 8):
+            add(f'n{i}', 'n0', f'Cs{i}', capacitance=1e-3)
+            add(f'n{i}', f'n{i+1}', f'Rs{i}', resistance=50.0)
+        add('n8', 'n0', 'RL', resistance=200.0)
+
+        return net
+
+    def simulate(self, multirate, numerics=None, source=None):
+
+        time = np.linspace(0, 0.1, 5001)
+        driver = InputDriver(sources={
+            'V1': source or 
+                  (lambda t: 5.0 + 5.0*np.sign(np.sin(2*np.pi*500*t)))})
+
+        net = self.build_network(numerics)
+        if multirate:
+            report = net.solve_multirate(time=time, input_driver=driver)
+            return net, report
+
+        net.solve(time=time, input_driver=driver)
+        return net, None
+
+    def test_partition_by_time_constant(self):
+        """
+        TEST 1: SLOW LADDER SPLIT FROM THE PWM STAGE AT RESISTOR R2
+
+        """
+        net = self.build_network()
+        plan = net.compile()
+        H = 2e-4
+
+        tau = time_constants(plan, StampContext(dt=H, default_dt=False))
+        by_name = {c.component.name: t for (_, _, c), t in
+                   zip(plan.branch_list, tau)}
+        self.assertAlmostEqual(by_name['C1'], 10e-6/0.11, places=12)
+        self.assertAlmostEqual(by_name['Cs3'], 1e-3/0.03, places=12)
+        self.assertTrue(np.isnan(by_name['R1']))
+
+        part = MultiratePartition(plan, np.flatnonzero(tau >= 20*H))
+        names = lambda nodes: sorted(plan.node_list[n] for n in nodes)
+        self.assertEqual(names(part.fast_nodes), ['n1', 'n2'])
+        self.assertEqual(names(part.slow_nodes),
+                         ['n3', 'n4', 'n5', 'n6', 'n7', 'n8'])
+        self.assertEqual([plan.branch_list[k][2].component.name
+                          for k in part.interface], ['R2'])
+
+        # Each side holds the other's interface node against ground
+        n = plan.node_indices
+        self.assertEqual(part.fast_boundary, [(n['n3'], n['n0'])])
+        self.assertEqual(part.slow_boundary, [(n['n2'], n['n0'])])
+
+    def test_matches_single_rate(self):
+        """
+        TEST 2: SLOW PARTITION ON 10X MACRO STEPS TRACKS THE SINGLE RATE RUN
+
+        """
+        reference, _ = self.simulate(False)
+        net, report = self.simulate(True)
+
+        self.assertEqual(report.partitions, 1)
+        self.assertEqual(report.micro_steps, 5000)
+        self.assertEqual(report.slow_solves, 500)
+        self.assertLess(report.solves, report.micro_steps)
+        self.assertEqual(report.fast_unknowns, 1)
+        self.assertLess(report.work, 0.25*report.single_rate_work)
+
+        nodes = [net.node_indices[n] for n in ('n2', 'n3', 'n5', 'n8')]
+        peak = np.abs(reference.sim_data.node_v[:, nodes]).max(axis=0)
+        error = np.abs(net.sim_data.node_v[:, nodes] -
+                       reference.sim_data.node_v[:, nodes]).max(axis=0)
+        np.testing.assert_array_less(error, 5e-3*peak)
+
+    def test_local_error_moves_components_to_fast_side(self):
+        """
+        TEST 3: TIGHT LTE TOLERANCE DEMOTES SLOW STATES AND REPARTITIONS
+
+        """
+        reference, _ = self.simulate(False)
+        net, report = self.simulate(True, MathChecks(multirate_rtol=1e-5))
+
+        self.assertGreater(report.partitions, 1)
+        self.assertIn('Cs3', report.demoted)
+        self.assertNotIn('Cs3', report.slow_components)
+        self.assertGreater(report.fast_unknowns, 1)
+
+        k = net.node_indices['n8']
+        np.testing.assert_allclose(net.sim_data.node_v[:, k],
+                                   reference.sim_data.node_v[:, k],
+                                   atol=1e-3)
+
+    def test_latent_fast_partition_skips_solves(self):
+        """
+        TEST 4: SETTLED FAST STAGE IS NOT SOLVED WHILE ITS INPUTS HOLD
+
+        """
+        step = lambda t: 10.0
+        reference, _ = self.simulate(False, source=step)
+        net, report = self.simulate(True, source=step)
+        _, every = self.simulate(True, MathChecks(multirate_latency=False),
+                                 source=step)
+
+        self.assertEqual(every.fast_solves, 5000)
+        self.assertLess(report.fast_solves, 0.5*report.micro_steps)
+        self.assertLess(report.solves, every.solves)
+
+        # Run ends latent - the held state fills the step history
+        c1 = net.components_by_name['C1'].component.discrete_data
+        self.assertAlmostEqual(c1.lpv1_dt, 2e-5, places=15)
+        self.assertEqual(c1.lpv2_voltage, c1.lpv1_voltage)
+        self.assertEqual(len(set(c1.history_voltage)), 1)
+
+        nodes = [net.node_indices[n] for n in ('n2', 'n3', 'n8')]
+        np.testing.assert_allclose(net.sim_data.node_v[:, nodes],
+                                   reference.sim_data.node_v[:, nodes],
+                                   atol=1e-2)
+
+    def test_disturbed_latent_fast_partition(self):
+        """
+        TEST 5: LATENT FAST STAGE WOKEN BY SOURCE STEPS TRACKS THE SINGLE
+        RATE RUN
+
+        """
+        steps = lambda t: 10.0 if t < 0.03 or t >= 0.07 else 2.0
+        reference, _ = self.simulate(False, source=steps)
+        net, report = self.simulate(True, source=steps)
+
+        self.assertLess(report.fast_solves, 0.5*report.micro_steps)
+
+        nodes = [net.node_indices[n] for n in ('n2', 'n3', 'n8')]
+        np.testing.assert_allclose(net.sim_data.node_v[:, nodes],
+                                   reference.sim_data.node_v[:, nodes],
+                                   atol=1e-2)
+
+        # Fast stage solved again right after each step
+        for t_step in (0.03, 0.07):
+            k = int(round(t_step/2e-5))
+            np.testing.assert_allclose(net.sim_data.node_v[k:k + 5, nodes[0]],
+                                       reference.sim_data.node_v[k:k + 5,
+                                                                 nodes[0]],
+                                       atol=5e-3)
+
+# -----------------------------------------------------------------------------
+# Run tests
+# -----------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
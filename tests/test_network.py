@@ -174,6 +174,68 @@ class NetworkTests(unittest.TestCase):
         
         with self.assertRaises(ValueError):
             net.solve()
+            
+    def test_compile_reuses_plan(self):
+        """
+        TEST 8: CONFIRMS REPEATED SOLVES REUSE THE COMPILED TOPOLOGY PLAN
+
+        """
+        net = Network()
+        net.add_component('n1', 'n2', self.make_resistor(voltage=0.0, 
+                                                         current=0.0))
+        net.add_component('n2', 'n1', self.make_voltage_source(voltage=0.0,
+                                                               current=0.0))
+        
+        plan = net.compile()
+        net.solve()
+        net.solve()
+        
+        self.assertIs(net.plan, plan)
+        self.assertEqual(plan.version, net.topology_version)
+        self.assertEqual(plan.num_nodes, 2)
+        self.assertEqual(plan.num_v_sources, 0)
+        self.assertEqual(list(plan.norton_branch), [1])
+        self.assertFalse(plan.branch_n1.flags.writeable)
+        
+    def test_compile_after_topology_change(self):
+        """
+        TEST 9: CONFIRMS ADDING COMPONENTS INVALIDATES THE COMPILED PLAN
+
+        """
+        net = Network()
+        net.add_component('n1', 'n2', self.make_resistor())
+        net.add_component('n2', 'n1', self.make_voltage_source())
+        plan = net.compile()
+        
+        net.add_component('n2', 'n3', self.make_resistor(name='R2'))
+        net.add_component('n3', 'n1', self.make_resistor(name='R3'))
+        new_plan = net.compile()
+        
+        self.assertIsNot(new_plan, plan)
+        self.assertEqual(new_plan.num_nodes, 3)
+        self.assertEqual(int(new_plan.type_masks[ComponentType.RESISTOR].sum()),
+                         3)
+        self.assertIn('R3', net.components_by_name)
+        
+    def test_ground_eliminated_from_unknowns(self):
+        """
+        TEST 10: CONFIRMS GROUND IS NOT AN UNKNOWN AND IS REPORTED AT 0 V
+
+        """
+        net = Network()
+        net.add_component('n0', 'n1', self.make_voltage_source(
+            voltage=0.0, current=0.0, int_resistance=1.0))
+        net.add_component('n1', 'n2', self.make_resistor(voltage=0.0, 
+                                                         current=0.0))
+        net.add_component('n2', 'n0', self.make_resistor(
+            name='R2', voltage=0.0, current=0.0))
+        net.solve()
+        
+        self.assertEqual(net.engine.size, 2)
+        self.assertEqual(net.plan.node_unknown[net.node_indices['n0']], -1)
+        self.assertEqual(net.node_voltages['n0'], 0.0)
+        self.assertEqual(net.sim_data.node_v[0, net.node_indices['n0']], 0.0)
+        self.assertAlmostEqual(net.node_voltages['n1'], 10.0*20.0/21.0)
 
 # -----------------------------------------------------------------------------
 # Run tests
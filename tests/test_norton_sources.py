@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 21:37:52 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built-in
+import unittest
+import numpy as np
+
+# Custom modules
+from config_classes.numeric_checks import MathChecks
+from data_classes.stamp_context import StampContext
+from enums.calculation_mode import CalculationMode
+from enums.discretization_type import DiscretizationType
+from examples.rc_network import build_rc_network
+from examples.rlc_network import build_rlc_network
+from examples.series_network import build_series_network
+from networks.input_driver import InputDriver
+
+# -----------------------------------------------------------------------------
+# Define unit test cases
+# -----------------------------------------------------------------------------
+
+class NortonSourceTests(unittest.TestCase):
+
+    def test_norton_transient_matches_mna(self):
+        """
+        TEST 1: NORTON SOURCES GIVE THE MNA RESULTS WITH FEWER UNKNOWNS
+
+        """
+        time = np.linspace(0, 0.5, 51)
+        driver = InputDriver(sources={'V1': lambda t: 12.0*np.sin(9*t)})
+
+        for build in (lambda: build_rlc_network(
+                          discretization=DiscretizationType.BDF2)[0],
+                      lambda: build_rc_network()[0]):
+
+            nets = []
+            for norton in (False, True):
+                net = build()
+                net.numerics = MathChecks(norton_sources=norton)
+                net.solve(time=time, input_driver=driver)
+                nets.append(net)
+            mna, norton = nets
+
+            self.assertEqual(norton.plan.num_v_sources, 0)
+            self.assertEqual(norton.engine.size, mna.engine.size - 1)
+            for attr in ('node_v', 'branch_v', 'branch_i'):
+                np.testing.assert_allclose(getattr(norton.sim_data, attr),
+                                           getattr(mna.sim_data, attr),
+                                           rtol=1e-9, atol=1e-9)
+
+    def test_resistive_network_is_spd(self):
+        """
+        TEST 2: RESISTIVE NETWORK WITH A LOSSY SOURCE IS A PURE NODAL SPD
+        SYSTEM
+
+        """
+        net = build_series_network()
+        net.solve()
+
+        A, _ = net.engine.assemble(StampContext())
+        self.assertEqual(A.shape, (net.num_nodes - 1, net.num_nodes - 1))
+        np.testing.assert_array_equal(A, A.T)
+        np.linalg.cholesky(A)
+
+        # Source current recovered from the node voltages
+        v_source = net.components_by_name['V1'].component
+        self.assertAlmostEqual(v_source.current, 12.0 / 31.0)
+
+    def test_ideal_source_keeps_mna_row(self):
+        """
+        TEST 3: SOURCES WITHOUT INTERNAL RESISTANCE STAY MNA UNKNOWNS
+
+        """
+        net = build_series_network()
+        net._set_mode(CalculationMode.VOLTAGE)
+        net.compile()
+        v_source = net.components_by_name['V1'].component
+        self.assertEqual(len(net.plan.norton_branch), 1)
+
+        # Converted on compile - a lossless source later recompiles into a
+        # fixed potential
+        v_source.ideal_params.int_resistance = 0.0
+        net.solve()
+        self.assertEqual(len(net.plan.norton_branch), 0)
+        self.assertEqual(len(net.plan.fixed_branch), 1)
+        self.assertAlmostEqual(v_source.current, 12.0 / 30.0)
+
+        # Compiled lossless, the source needs its current unknown (unless
+        # it is eliminated as a fixed potential)
+        net = build_series_network()
+        net.numerics = MathChecks(fixed_potentials=False)
+        net._set_mode(CalculationMode.VOLTAGE)
+        net.graph.edges['n0', 'n1', 'V1'][
+            'component'].component.ideal_params.int_resistance = 0
+        net.solve()
+        self.assertEqual(net.plan.num_v_sources, 1)
+        self.assertEqual(len(net.plan.norton_branch), 0)
+        self.assertAlmostEqual(
+            net.components_by_name['V1'].component.current, 12.0 / 30.0)
+
+    def test_internal_resistance_edit_recompiles(self):
+        """
+        TEST 4: INTERNAL RESISTANCE EDITS BETWEEN SOLVES MOVE A SOURCE
+        BETWEEN NORTON, FIXED POTENTIAL AND BACK
+
+        """
+        net = build_series_network()
+        net._set_mode(CalculationMode.VOLTAGE)
+        net.solve()
+        self.assertEqual(len(net.plan.norton_branch), 1)
+        plan = net.plan
+
+        v_source = net.components_by_name['V1'].component
+        for r_int, norton, fixed in ((0.0, 0, 1), (0.5, 1, 0)):
+            v_source.ideal_params.int_resistance = r_int
+            net.solve()
+            self.assertIsNot(net.plan, plan)
+            plan = net.plan
+            self.assertEqual(len(plan.norton_branch), norton)
+            self.assertEqual(len(plan.fixed_branch), fixed)
+            self.assertAlmostEqual(abs(v_source.current), 12.0/(30.0 + r_int))
+
+        # Unchanged modes keep the plan
+        v_source.ideal_params.int_resistance = 2.0
+        net.solve()
+        self.assertIs(net.plan, plan)
+        self.assertAlmostEqual(abs(v_source.current), 12.0/32.0)
+
+    def test_source_turning_ideal_mid_transient(self):
+        """
+        TEST 5: A SOURCE WHOSE INTERNAL RESISTANCE DROPS TO ZERO DURING A
+        TRANSIENT FALLS BACK TO THE IDEAL MNA ROW
+
+        """
+        time = np.linspace(0, 0.5, 51)
+
+        nets = []
+        for norton, fixed in ((True, False), (False, False), (True, True)):
+            net = build_rc_network()[0]
+            net.numerics = MathChecks(norton_sources=norton,
+                                      fixed_potentials=fixed)
+            net._set_mode(CalculationMode.VOLTAGE)
+            params = net.graph.edges['n0', 'n1', 'V1'][
+                'component'].component.ideal_params
+
+            # Internal resistance lost at t = 0.25 s
+            def source(t, params=params):
+                params.int_resistance = 1.0 if t < 0.25 else 0.0
+                return 12.0
+
+            net.solve(time=time, input_driver=InputDriver(
+                sources={'V1': source}))
+            nets.append(net)
+
+        norton, mna, fixed = nets
+        self.assertEqual(len(norton.plan.norton_branch), 0)
+        self.assertEqual(norton.plan.num_v_sources, 1)
+        self.assertEqual(len(fixed.plan.fixed_branch), 1)
+        for net in (norton, fixed):
+            for attr in ('node_v', 'branch_v', 'branch_i'):
+                np.testing.assert_allclose(getattr(net.sim_data, attr),
+                                           getattr(mna.sim_data, attr),
+                                           rtol=1e-9, atol=1e-9)
+
+# -----------------------------------------------------------------------------
+# Run tests
+# -----------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
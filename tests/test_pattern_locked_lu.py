@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 11:58:20 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built-in
+import unittest
+import numpy as np
+from scipy.sparse.linalg import spsolve
+
+# Custom modules
+from config_classes.numeric_checks import MathChecks
+from data_classes.stamp_context import StampContext
+from enums.discretization_type import DiscretizationType
+from enums.solver_backend import SolverBackend
+from examples.rlc_network import build_rlc_network
+from networks.input_driver import InputDriver
+from networks.pattern_locked_lu import FixedOrderingLU
+
+# -----------------------------------------------------------------------------
+# Define unit test cases
+# -----------------------------------------------------------------------------
+
+class FixedOrderingLUTests(unittest.TestCase):
+
+    def make_sparse_network(self):
+
+        net, _, _, _ = build_rlc_network(
+            discretization=DiscretizationType.BDF2)
+        net.numerics = MathChecks(sparse_threshold=0)
+        net.compile()
+        net._update_comps()
+
+        return net
+
+    def test_engine_reuses_csr_pattern(self):
+        """
+        TEST 1: SPARSE ASSEMBLY UPDATES ONE CSR MATRIX IN PLACE
+
+        """
+        net = self.make_sparse_network()
+
+        A1, _ = net.engine.assemble(StampContext(dt=1e-3))
+        indices = A1.indices
+        data1 = A1.data.copy()
+
+        A2, _ = net.engine.assemble(StampContext(dt=1e-2))
+
+        self.assertIs(A2, A1)
+        self.assertIs(A2.indices, indices)
+        self.assertFalse(np.array_equal(A2.data, data1))
+
+    def test_refactor_reuses_ordering(self):
+        """
+        TEST 2: VALUE CHANGES REFACTOR IN THE SAME FIXED ORDERING
+
+        """
+        net = self.make_sparse_network()
+        lu_solver = FixedOrderingLU()
+
+        for dt in (1e-3, 2e-3, 5e-2):
+            A, b = net.engine.assemble(StampContext(dt=dt))
+            b = b + 1.0
+            x = lu_solver.factor(A).solve(b)
+
+            np.testing.assert_allclose(x, spsolve(A.tocsc(), b),
+                                       rtol=1e-10, atol=1e-12)
+
+        self.assertEqual(lu_solver.num_orderings, 1)
+
+    def test_sparse_transient_matches_dense(self):
+        """
+        TEST 3: SPARSE TRANSIENT WITH REFACTORIZATION MATCHES DENSE SOLVE
+
+        """
+        time = np.concatenate((np.linspace(0, 1.0, 51),
+                               np.linspace(1.0, 3.0, 26)[1:]))
+        driver = InputDriver(sources={'V1': lambda t: 12.0})
+
+        dense_net, _, _, _ = build_rlc_network(
+            discretization=DiscretizationType.BDF2)
+        dense_net.solve(time=time, input_driver=driver)
+
+        sparse_net, _, _, _ = build_rlc_network(
+            discretization=DiscretizationType.BDF2)
+        sparse_net.numerics = MathChecks(
+            sparse_threshold=0, solver_backend=SolverBackend.SUPERLU)
+        sparse_net.solve(time=time, input_driver=driver)
+
+        self.assertEqual(sparse_net.solver.locked.num_orderings, 1)
+        np.testing.assert_allclose(sparse_net.sim_data.node_v,
+                                   dense_net.sim_data.node_v,
+                                   rtol=1e-9, atol=1e-12)
+
+# -----------------------------------------------------------------------------
+# Run tests
+# -----------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
@@ -591,6 +591,78 @@ class TestRLCNetworkPhysics(unittest.TestCase):
                                            rtol=rel_tol,
                                            atol=abs_tol)
                 break
+    
+    def capacitor_error(self, scheme, r_eq, t_stop, nsteps, t_from=0.0):
+        """
+        Max capacitor voltage error of the constant voltage response from 
+        t_from on, rlc_l = c = 2
+        """
+        
+        v0 = 12
+        rlc_net, r_eq, rlc_l, c = build_rlc_network(discretization=scheme,
+                                                    eqv_resistance=r_eq,
+                                                    inductance=2.0,
+                                                    capacitance=2.0)
+        time = np.linspace(0, t_stop, nsteps + 1)
+        test_time = time[1:]
+        input_driver, physics = self.make_input_driver_constant(v0, 
+                                                                r_eq,
+                                                                rlc_l,
+                                                                c)
+        rlc_net.solve(time=time, input_driver=input_driver)
+        
+        for k, (_, _, m) in enumerate(rlc_net.branch_list):
+            if m.component.ctype == ComponentType.CAPACITOR:
+                error = np.abs(rlc_net.sim_data.branch_v[:,k] - 
+                               physics['V_c'](test_time))
+                return error[test_time >= t_from].max()
+    
+    def test_rlc_convergence_order_per_scheme(self):
+        """
+        TEST CASE 7: CONSTANT DRIVING VOLTAGE - UNDERDAMPED, OBSERVED 
+        CONVERGENCE ORDER OF EACH DISCRETIZATION SCHEME
+        
+        """
+        
+        # Error from one tau on - the first step is always Backward Euler
+        tau = 2*2.0/1.0
+        expected = {DiscretizationType.BACKWARD_EULER: 1.0,
+                    DiscretizationType.BDF2: 2.0,
+                    DiscretizationType.TRAPEZOIDAL: 2.0,
+                    DiscretizationType.TR_BDF2: 2.0}
+        
+        for scheme, order in expected.items():
+            errors = np.array([self.capacitor_error(scheme, 1.0, 10*tau, n, 
+                                                    tau) 
+                               for n in (500, 1000, 2000)])
+            rates = np.log2(errors[:-1] / errors[1:])
+            np.testing.assert_allclose(rates, order, atol=0.15, 
+                                       err_msg=scheme.name)
+    
+    def test_rlc_lightly_damped_ringing_fewer_steps(self):
+        """
+        TEST CASE 8: CONSTANT DRIVING VOLTAGE - LIGHTLY DAMPED, TRAPEZOIDAL
+        AND TR-BDF2 HOLD THE RINGING ON 8X FEWER STEPS THAN BACKWARD EULER
+        
+        """
+        
+        # Ten periods, error over the last five
+        wd = np.sqrt(1/4 - (0.2/4)**2)
+        t_stop = 10*2*np.pi/wd
+        
+        be_error = self.capacitor_error(DiscretizationType.BACKWARD_EULER, 
+                                        0.2, t_stop, 1600, t_stop/2)
+        for scheme in (DiscretizationType.TRAPEZOIDAL, 
+                       DiscretizationType.TR_BDF2):
+            error = self.capacitor_error(scheme, 0.2, t_stop, 200, t_stop/2)
+            self.assertLess(error, be_error, msg=scheme.name)
+        
+        # TR-BDF2 error constant is half the trapezoidal one
+        self.assertLess(self.capacitor_error(DiscretizationType.TR_BDF2, 
+                                             0.2, t_stop, 400, t_stop/2),
+                        0.6*self.capacitor_error(
+                            DiscretizationType.TRAPEZOIDAL, 0.2, t_stop, 
+                            400, t_stop/2))
 
     
 # -----------------------------------------------------------------------------
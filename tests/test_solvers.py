@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 15:06:22 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built-in
+import unittest
+import numpy as np
+
+# Custom modules
+from config_classes.numeric_checks import MathChecks
+from enums.discretization_type import DiscretizationType
+from enums.solver_backend import SolverBackend
+from examples.rlc_network import build_rlc_network
+from networks.input_driver import InputDriver
+from solvers.dense_lu_solver import DenseLUSolver
+from solvers.iterative_solver import IterativeSolver
+from solvers.superlu_solver import SuperLUSolver
+from solvers.umfpack_solver import UmfpackSolver
+
+# -----------------------------------------------------------------------------
+# Define unit test cases
+# -----------------------------------------------------------------------------
+
+class SolverBackendTests(unittest.TestCase):
+
+    def run_transient(self, numerics=None, solver=None):
+
+        net, _, _, _ = build_rlc_network(
+            discretization=DiscretizationType.BDF2)
+        if numerics is not None:
+            net.numerics = numerics
+        net.solver_choice = solver
+
+        time = np.linspace(0, 1.0, 51)
+        driver = InputDriver(sources={'V1': lambda t: 12.0})
+        net.solve(time=time, input_driver=driver)
+
+        return net
+
+    def check_backend(self, reference, **kwargs):
+
+        net = self.run_transient(**kwargs)
+        np.testing.assert_allclose(net.sim_data.node_v,
+                                   reference.sim_data.node_v,
+                                   rtol=1e-9, atol=1e-10)
+        return net
+
+    def test_backends_match_dense_lu(self):
+        """
+        TEST 1: EVERY BUILT-IN BACKEND REPRODUCES THE DENSE LU TRANSIENT
+
+        """
+        reference = self.run_transient(solver=SolverBackend.DENSE_LU)
+        self.assertIsInstance(reference.solver, DenseLUSolver)
+        self.assertFalse(reference.engine.sparse)
+
+        for ordering in SuperLUSolver.ORDERINGS:
+            net = self.check_backend(reference, numerics=MathChecks(
+                solver_backend=SolverBackend.SUPERLU,
+                superlu_ordering=ordering))
+            self.assertIsInstance(net.solver, SuperLUSolver)
+            self.assertEqual(net.solver.ordering, ordering)
+            self.assertTrue(net.engine.sparse)
+
+        net = self.check_backend(reference, solver=SolverBackend.ITERATIVE)
+        self.assertIsInstance(net.solver, IterativeSolver)
+
+        if UmfpackSolver.available():
+            self.check_backend(reference, solver=SolverBackend.UMFPACK)
+        else:
+            with self.assertRaises(ImportError):
+                self.run_transient(solver=SolverBackend.UMFPACK)
+
+    def test_network_choice_overrides_numerics(self):
+        """
+        TEST 2: A SOLVER PASSED TO THE NETWORK WINS OVER MATHCHECKS
+
+        """
+        solver = SuperLUSolver(ordering='MMD_AT_PLUS_A')
+        net = self.run_transient(
+            numerics=MathChecks(solver_backend=SolverBackend.DENSE_LU),
+            solver=solver)
+
+        self.assertIs(net.solver, solver)
+        self.assertEqual(solver.locked.num_orderings, 1)
+
+        with self.assertRaises(ValueError):
+            SuperLUSolver(ordering='AMD')
+
+    def test_solve_many_matches_column_solves(self):
+        """
+        TEST 3: SOLVE_MANY EQUALS ONE SOLVE PER RIGHT HAND SIDE
+
+        """
+        rng = np.random.default_rng(3)
+        A = rng.normal(size=(6, 6)) + 6*np.eye(6)
+        B = rng.normal(size=(6, 3))
+
+        for solver in (DenseLUSolver(), SuperLUSolver(), IterativeSolver()):
+            factor = solver.factor(A)
+            X = solver.solve_many(factor, B)
+            for j in range(B.shape[1]):
+                np.testing.assert_allclose(X[:, j],
+                                           solver.solve(factor, B[:, j]),
+                                           rtol=1e-10, atol=1e-12)
+            np.testing.assert_allclose(A @ X, B, rtol=1e-9, atol=1e-10)
+
+# -----------------------------------------------------------------------------
+# Run tests
+# -----------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 18:57:13 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built-in
+import unittest
+import numpy as np
+
+# Custom modules
+from components.capacitor import Capacitor
+from components.resistor import Resistor
+from components.switch import Switch
+from components.voltage_source import VoltageSource
+from data_classes.component_data import (ComponentData, DiscretizationData,
+                                         IdealComponentData)
+from data_classes.stamp_context import StampContext
+from enums.calculation_mode import CalculationMode
+from enums.component_type import ComponentType
+from enums.switch_condition import SwitchCondition
+from examples.switched_ladder_network import build_switched_ladder_network
+from networks.network import Network
+from networks.structural_checks import (cut_sets, structure_edges,
+                                        voltage_source_loops)
+
+# -----------------------------------------------------------------------------
+# Define unit test cases
+# -----------------------------------------------------------------------------
+
+class StructuralCheckTests(unittest.TestCase):
+
+    def resistor(self, name, resistance=10.0):
+        return Resistor(ComponentData(
+            name=name,
+            node1=None,
+            node2=None,
+            resistance=resistance,
+            voltage=0.0,
+            current=0.0,
+            mode=CalculationMode.VOLTAGE,
+            ctype=ComponentType.RESISTOR))
+
+    def source(self, name, int_resistance=0.0):
+        return VoltageSource(ComponentData(
+            name=name,
+            node1=None,
+            node2=None,
+            voltage=0.0,
+            current=0.0,
+            mode=CalculationMode.VOLTAGE,
+            ctype=ComponentType.VOLTAGE_SOURCE,
+            ideal_params=IdealComponentData(ideal_voltage=5.0,
+                                            int_resistance=int_resistance)))
+
+    def capacitor(self, name):
+        return Capacitor(ComponentData(
+            name=name,
+            node1=None,
+            node2=None,
+            voltage=0.0,
+            current=0.0,
+            capacitance=1e-3,
+            discrete_data=DiscretizationData()))
+
+    def test_floating_island_gets_own_reference(self):
+        """
+        TEST 1: SUB-NETWORK WITHOUT A PATH TO GROUND GETS ITS OWN REFERENCE
+
+        """
+        net = Network()
+        net.add_component('n0', 'n1', self.source('V1', 1.0))
+        net.add_component('n1', 'n0', self.resistor('R1'))
+        net.add_component('a', 'b', self.resistor('R2'))
+        net.add_component('b', 'a', self.resistor('R3'))
+        plan = net.compile()
+
+        self.assertEqual(plan.island_grounds, ('n0', 'a'))
+        self.assertEqual(plan.node_unknown[net.node_indices['a']], -1)
+
+    def test_ideal_source_loop_names_sources(self):
+        """
+        TEST 2: LOOPS OF IDEAL VOLTAGE SOURCES ARE REJECTED, LOSSY ARE FINE
+
+        """
+        net = Network()
+        net.add_component('n0', 'n1', self.source('V1'))
+        net.add_component('n1', 'n2', self.source('V2'))
+        net.add_component('n2', 'n0', self.source('V3'))
+        net.add_component('n1', 'n0', self.resistor('R1'))
+
+        with self.assertRaises(ValueError) as err:
+            net.compile()
+        self.assertIn("['V1', 'V2', 'V3']", str(err.exception))
+
+        lossy = Network()
+        lossy.add_component('n0', 'n1', self.source('V1', 0.1))
+        lossy.add_component('n1', 'n0', self.source('V2', 0.1))
+        lossy.add_component('n1', 'n0', self.resistor('R1'))
+        lossy.compile()
+
+    def test_capacitor_cut_set_warning(self):
+        """
+        TEST 3: NODES REACHED ONLY THROUGH CAPACITORS ARE REPORTED
+
+        """
+        net = Network()
+        net.add_component('n0', 'n1', self.source('V1', 1.0))
+        net.add_component('n1', 'n0', self.resistor('R1'))
+        net.add_component('n1', 'n2', self.capacitor('C1'))
+        net.add_component('n2', 'n3', self.resistor('R2'))
+        net.add_component('n3', 'n0', self.capacitor('C2'))
+        net.compile()
+
+        self.assertEqual(len(net.structure_warnings), 1)
+        self.assertIn("['C1', 'C2']", net.structure_warnings[0])
+
+    def test_condition_guard(self):
+        """
+        TEST 4: ONENORMEST GUARD TRACKS COND(RAC) AND REPORTS SINGULAR A
+
+        """
+        net = build_switched_ladder_network(sections=6)
+        net.solve()
+
+        # Row then column equilibrated A
+        A, _ = net.engine.assemble(StampContext())
+        A = A / np.abs(A).max(axis=1)[:, None]
+        A = A / np.abs(A).max(axis=0)[None, :]
+        cond = np.linalg.cond(A, 1)
+        self.assertLessEqual(net.last_condition, cond*(1 + 1e-9))
+        self.assertGreaterEqual(net.last_condition, cond/3)
+        self.assertEqual(net.matrix_warnings, [])
+
+        # Shorting resistor at 1e-18 ohm - singular to working precision,
+        # reported and still solved
+        net.components_by_name['Rs3'].component.resistance = 1e-18
+        net.solve()
+        self.assertEqual(len(net.matrix_warnings), 1)
+        self.assertIn('condition estimate', net.matrix_warnings[0])
+        self.assertTrue(np.all(np.isfinite(net.sim_data.node_v)))
+
+    def test_dead_time_half_bridge_solves(self):
+        """
+        TEST 5: BOTH HALF-BRIDGE SWITCHES OPEN - UNSCALED COND(A) ABOVE
+        max_condition, SOLVED WITHOUT WARNINGS
+
+        """
+        def switch(name):
+            return Switch(ComponentData(
+                name=name, node1=None, node2=None, voltage=0.0,
+                current=0.0, mode=CalculationMode.VOLTAGE,
+                ctype=ComponentType.SWITCH, scond=SwitchCondition.OPEN))
+
+        net = Network()
+        net.add_component('n0', 'n1', self.source('V1', 1e-9))
+        net.add_component('n1', 'm', switch('S1'))
+        net.add_component('m', 'n0', switch('S2'))
+        net.solve()
+
+        A, _ = net.engine.assemble(StampContext())
+        self.assertGreater(np.linalg.cond(A, 1), net.numerics.max_condition)
+        self.assertEqual(net.matrix_warnings, [])
+        self.assertAlmostEqual(net.sim_data.node_v[0, 
+                               net.node_indices['m']], 2.5, places=6)
+
+        # Sources without an internal resistance value count as ideal
+        net = Network()
+        loop = self.source('V1')
+        loop.component.ideal_params.int_resistance = None
+        net.add_component('n0', 'n1', loop)
+        net.add_component('n1', 'n0', self.source('V2'))
+        with self.assertRaises(ValueError) as err:
+            net.compile()
+        self.assertIn("['V1', 'V2']", str(err.exception))
+
+    def test_checks_on_large_mesh(self):
+        """
+        TEST 6: SOURCE LOOP AND CAPACITOR CUT FOUND IN A 40 X 40 MESH FROM
+        ONE EDGE PASS
+
+        """
+        net = Network()
+        size = 40
+        node = lambda i, j: f'm{i}_{j}'
+        for i in range(size):
+            for j in range(size):
+                if i + 1 < size:
+                    net.add_component(node(i, j), node(i + 1, j),
+                                      self.resistor(f'Rv{i}_{j}'))
+                if j + 1 < size:
+                    net.add_component(node(i, j), node(i, j + 1),
+                                      self.resistor(f'Rh{i}_{j}'))
+
+        # Ideal sources around one mesh cell, a node hung on capacitors
+        corners = [(20, 20), (20, 21), (21, 21), (21, 20)]
+        for k, (a, b) in enumerate(zip(corners, corners[1:] + corners[:1])):
+            net.add_component(node(*a), node(*b), self.source(f'V{k}'))
+        net.add_component(node(0, 0), 'c', self.capacitor('C1'))
+        net.add_component('c', node(5, 5), self.capacitor('C2'))
+        net.add_component(node(0, 0), 'ground', self.resistor('Rg'))
+        net.ground_node = 'ground'
+
+        edges = structure_edges(net.graph)
+        self.assertEqual(len(edges), net.graph.number_of_edges())
+        self.assertEqual(voltage_source_loops(net.graph, edges),
+                         [['V0', 'V1', 'V2', 'V3']])
+        self.assertEqual(cut_sets(net.graph, ['ground'],
+                                  (ComponentType.CAPACITOR,), edges),
+                         [['C1', 'C2']])
+        self.assertEqual(cut_sets(net.graph, ['ground'],
+                                  (ComponentType.CURRENT_SOURCE,), edges),
+                         [])
+
+# -----------------------------------------------------------------------------
+# Run tests
+# -----------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
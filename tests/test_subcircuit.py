@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 12:03:40 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built-in
+import unittest
+import numpy as np
+
+# Custom modules
+from components.capacitor import Capacitor
+from components.inductor import Inductor
+from components.resistor import Resistor
+from components.switch import Switch
+from components.voltage_source import VoltageSource
+from data_classes.component_data import (ComponentData, DiscretizationData,
+                                         IdealComponentData)
+from enums.calculation_mode import CalculationMode
+from enums.component_type import ComponentType
+from enums.discretization_type import DiscretizationType
+from networks.input_driver import InputDriver
+from networks.network import Network
+from networks.subcircuit import Subcircuit
+
+# -----------------------------------------------------------------------------
+# Define unit test cases
+# -----------------------------------------------------------------------------
+
+class SubcircuitTests(unittest.TestCase):
+
+    def make(self, kind, name, value):
+
+        data = ComponentData(name=name, node1=None, node2=None,
+                             voltage=0.0, current=0.0,
+                             mode=CalculationMode.VOLTAGE)
+
+        if kind is Resistor:
+            data.resistance = value
+            data.ctype = ComponentType.RESISTOR
+        elif kind is Capacitor:
+            data.capacitance = value
+            data.discrete_data = DiscretizationData()
+        elif kind is Inductor:
+            data.inductance = value
+            data.discrete_data = DiscretizationData()
+        elif kind is Switch:
+            data.ctype = ComponentType.SWITCH
+        else:
+            data.ctype = ComponentType.VOLTAGE_SOURCE
+            data.ideal_params = IdealComponentData(ideal_voltage=value)
+
+        return kind(data)
+
+    def add_cell(self, add, node, reactive=True):
+        """
+        RC / RL cell: R1 (in -> mid), C1 (mid -> gnd), R2 (mid -> x),
+        L1 (x -> out), R3 (x -> gnd). Without reactive parts C1 is dropped
+        and L1 becomes a resistor.
+        """
+
+        add(node('in'), node('mid'), self.make(Resistor, 'R1', 1.0))
+        if reactive:
+            add(node('mid'), node('gnd'), self.make(Capacitor, 'C1', 1e-2))
+            add(node('x'), node('out'), self.make(Inductor, 'L1', 0.05))
+        else:
+            add(node('x'), node('out'), self.make(Resistor, 'L1', 0.5))
+        add(node('mid'), node('x'), self.make(Resistor, 'R2', 2.0))
+        add(node('x'), node('gnd'), self.make(Resistor, 'R3', 20.0))
+
+    def build_board(self, use_subcircuit, reactive=True):
+        """
+        Source V1 (n0 -> n1) driving three cells in cascade into RL
+        (n4 -> n0), as subcircuit instances X1..X3 or flattened
+        """
+
+        net = Network(discretization=DiscretizationType.BDF2)
+        net.add_component('n0', 'n1', self.make(VoltageSource, 'V1', 10.0))
+
+        definition = Subcircuit('cell', ports=('in', 'out', 'gnd'))
+        self.add_cell(definition.add_component, lambda n: n, reactive)
+
+        for i, (a, b) in enumerate((('n1', 'n2'), ('n2', 'n3'),
+                                    ('n3', 'n4'))):
+            ports = {'in': a, 'out': b, 'gnd': 'n0'}
+            if use_subcircuit:
+                net.add_subcircuit(f'X{i+1}', definition, ports)
+                continue
+
+            def add(n1, n2, c_obj, prefix=f'X{i+1}'):
+                c_obj.component.name = f'{prefix}.{c_obj.component.name}'
+                net.add_component(n1, n2, c_obj)
+            self.add_cell(add, lambda n, p=ports, i=i: p.get(n, f'X{i+1}.{n}'),
+                          reactive)
+
+        net.add_component('n4', 'n0', self.make(Resistor, 'RL', 5.0))
+
+        time = np.linspace(0, 0.5, 101)
+        driver = InputDriver(sources={'V1': lambda t: 10.0*np.sin(30*t)})
+        net.solve(time=time, input_driver=driver)
+
+        return net, definition
+
+    def test_instances_match_flat_netlist(self):
+        """
+        TEST 1: KRON REDUCED INSTANCES REPRODUCE THE FLATTENED BOARD, BDF2
+
+        """
+        flat, _ = self.build_board(False)
+        board, definition = self.build_board(True)
+
+        ports = ['n1', 'n2', 'n3', 'n4']
+        k_flat = [flat.node_indices[n] for n in ports]
+        k_board = [board.node_indices[n] for n in ports]
+        np.testing.assert_allclose(board.sim_data.node_v[:, k_board],
+                                   flat.sim_data.node_v[:, k_flat],
+                                   rtol=1e-10, atol=1e-12)
+
+        # Internals with history are advanced every step
+        for name in ('X1', 'X3'):
+            internal = board.subcircuits[name].probe()
+            for node in ('mid', 'x'):
+                self.assertAlmostEqual(
+                    internal[node], flat.node_voltages[f'{name}.{node}'],
+                    places=10)
+            for comp in ('C1', 'L1', 'R2'):
+                self.assertAlmostEqual(
+                    board.components_by_name[f'{name}.{comp}'].component
+                    .current,
+                    flat.components_by_name[f'{name}.{comp}'].component
+                    .current, places=10)
+
+    def test_reduction_cached_per_definition(self):
+        """
+        TEST 2: ONE SCHUR COMPLEMENT PER (DT, SCHEME) FOR ALL INSTANCES
+
+        """
+        board, definition = self.build_board(True)
+
+        # Backward Euler start-up step, then BDF2
+        self.assertEqual(definition.cache.misses, 2)
+        self.assertEqual(definition.cache.hits, 3*100 - 2)
+
+        # Three pairs per instance stamp the 3 x 3 port admittance
+        self.assertEqual(len(board.subcircuits['X2'].branches), 3)
+        Y = board.subcircuits['X2'].reduction.admittance
+        np.testing.assert_allclose(Y.sum(axis=1), 0.0, atol=1e-12)
+
+    def test_resistive_instances_probed_lazily(self):
+        """
+        TEST 3: STATELESS INTERNALS ARE ONLY SOLVED WHEN PROBED
+
+        """
+        flat, _ = self.build_board(False, reactive=False)
+        board, _ = self.build_board(True, reactive=False)
+
+        r2 = board.components_by_name['X2.R2'].component
+        self.assertEqual(r2.voltage, 0.0)
+
+        internal = board.subcircuits['X2'].probe()
+        self.assertAlmostEqual(internal['mid'], flat.node_voltages['X2.mid'],
+                               places=10)
+        self.assertAlmostEqual(
+            r2.current, flat.components_by_name['X2.R2'].component.current,
+            places=10)
+
+        # Definitions reject state dependent and unreachable internals
+        definition = Subcircuit('bad', ports=('a', 'b'))
+        with self.assertRaises(ValueError):
+            definition.add_component('a', 'b', self.make(Switch, 'S1', 0.0))
+        definition.add_component('a', 'b', self.make(Resistor, 'R1', 1.0))
+        definition.add_component('c', 'd', self.make(Resistor, 'R2', 1.0))
+        with self.assertRaises(ValueError) as err:
+            definition.layout()
+        self.assertIn("['c', 'd']", str(err.exception))
+
+    def test_rc_instance_matches_flat_rc_every_scheme(self):
+        """
+        TEST 4: RC SUBCIRCUIT BEHIND A SOURCE RESISTOR TRACKS THE SAME RC
+        WRITTEN OUT FLAT - FIXED GRID IN EVERY SCHEME AND ADAPTIVE STEPS
+
+        """
+        def build(use_subcircuit, discretization):
+            net = Network(discretization=discretization)
+            net.add_component('n0', 'n1', self.make(VoltageSource, 'V1', 10.0))
+            net.add_component('n1', 'n2', self.make(Resistor, 'Rs', 2.0))
+            if use_subcircuit:
+                definition = Subcircuit('rc', ports=('a', 'g'))
+                definition.add_component('a', 'm',
+                                         self.make(Resistor, 'R1', 1.0))
+                definition.add_component('m', 'g',
+                                         self.make(Capacitor, 'C1', 0.05))
+                net.add_subcircuit('X1', definition, {'a': 'n2', 'g': 'n0'})
+            else:
+                net.add_component('n2', 'X1.m',
+                                  self.make(Resistor, 'X1.R1', 1.0))
+                net.add_component('X1.m', 'n0',
+                                  self.make(Capacitor, 'X1.C1', 0.05))
+            return net
+
+        def compare(flat, board):
+            k_flat, k_board = flat.node_indices['n2'], board.node_indices['n2']
+            np.testing.assert_allclose(board.sim_data.node_v[:, k_board],
+                                       flat.sim_data.node_v[:, k_flat],
+                                       rtol=1e-10, atol=1e-10)
+            for name in ('X1.C1', 'X1.R1'):
+                ours = board.components_by_name[name].component
+                theirs = flat.components_by_name[name].component
+                self.assertAlmostEqual(ours.voltage, theirs.voltage,
+                                       places=10)
+                self.assertAlmostEqual(ours.current, theirs.current,
+                                       places=10)
+
+        driver = InputDriver(sources={'V1': lambda t: 10.0*np.sin(30*t)})
+        for scheme in (DiscretizationType.BACKWARD_EULER,
+                       DiscretizationType.TRAPEZOIDAL,
+                       DiscretizationType.BDF2,
+                       DiscretizationType.TR_BDF2):
+            nets = []
+            for use_subcircuit in (False, True):
+                net = build(use_subcircuit, scheme)
+                net.solve(time=np.linspace(0, 0.5, 101), input_driver=driver)
+                nets.append(net)
+            compare(*nets)
+
+            # Capacitor charged well away from its initial state
+            self.assertGreater(abs(nets[1].components_by_name['X1.C1']
+                                   .component.voltage), 0.1)
+
+        nets = []
+        for use_subcircuit in (False, True):
+            net = build(use_subcircuit, DiscretizationType.BDF2)
+            net.solve_adaptive(0.0, 0.5, driver)
+            nets.append(net)
+        np.testing.assert_allclose(nets[1].sim_data.time,
+                                   nets[0].sim_data.time, rtol=1e-9)
+        compare(*nets)
+
+# -----------------------------------------------------------------------------
+# Run tests
+# -----------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 24 09:17:36 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built-in
+import unittest
+import numpy as np
+
+# Custom modules
+from components.capacitor import Capacitor
+from components.resistor import Resistor
+from components.switch import Switch
+from components.voltage_source import VoltageSource
+from data_classes.component_data import (ComponentData, DiscretizationData,
+                                         IdealComponentData)
+from enums.calculation_mode import CalculationMode
+from enums.component_type import ComponentType
+from enums.discretization_type import DiscretizationType
+from enums.switch_condition import SwitchCondition
+from networks.input_driver import InputDriver
+from networks.network import Network
+
+# -----------------------------------------------------------------------------
+# Define unit test cases
+# -----------------------------------------------------------------------------
+
+# PWM gate, period 1 s, 37 % duty, edges off any round grid
+PERIOD, DUTY, PHASE = 1.0, 0.37, 0.013
+
+def pwm(t):
+    return ((t - PHASE) % PERIOD) < DUTY*PERIOD
+
+def pwm_edges(t0, t1):
+    n = np.arange(np.floor(t0 - PHASE), np.ceil(t1 - PHASE) + 1)
+    return np.concatenate((PHASE + n, PHASE + DUTY*PERIOD + n))
+
+class SwitchEventTests(unittest.TestCase):
+
+    def build_network(self, discretization=DiscretizationType.BDF2):
+        """
+        V1 (n0 -> n1, 12 V), switch S1 (n1 -> n2), R1 (n2 -> n3) charging
+        C1 (n3 -> n0, 1 F), R2 (n3 -> n0) discharging it.
+        """
+
+        net = Network(discretization=discretization)
+
+        def data(name, n1, n2, **kwargs):
+            return ComponentData(name=name, node1=n1, node2=n2, voltage=0.0,
+                                 current=0.0, mode=CalculationMode.VOLTAGE,
+                                 **kwargs)
+
+        net.add_component('n0', 'n1', VoltageSource(data(
+            'V1', 'n0', 'n1', ctype=ComponentType.VOLTAGE_SOURCE,
+            ideal_params=IdealComponentData(ideal_voltage=12.0))))
+        net.add_component('n1', 'n2', Switch(data(
+            'S1', 'n1', 'n2', ctype=ComponentType.SWITCH,
+            scond=SwitchCondition.OPEN)))
+        net.add_component('n2', 'n3', Resistor(data(
+            'R1', 'n2', 'n3', ctype=ComponentType.RESISTOR, resistance=1.0)))
+        net.add_component('n3', 'n0', Capacitor(data(
+            'C1', 'n3', 'n0', capacitance=1.0,
+            discrete_data=DiscretizationData())))
+        net.add_component('n3', 'n0', Resistor(data(
+            'R2', 'n3', 'n0', ctype=ComponentType.RESISTOR, resistance=2.0)))
+
+        return net
+
+    def capacitor_voltage(self, net):
+
+        for k, (_, _, c) in enumerate(net.branch_list):
+            if c.component.name == 'C1':
+                return net.sim_data.branch_v[:, k]
+
+    def simulate(self, steps, states, breakpoints=None, t_stop=5.0):
+
+        net = self.build_network()
+        time = np.linspace(0, t_stop, steps + 1)
+        net.solve(time=time, input_driver=InputDriver(
+            sources={'V1': lambda t: 12.0}, states=states,
+            breakpoints=breakpoints, locate_events=True))
+        return net, time
+
+    def reference(self, time):
+
+        net, fine = self.simulate(20000, {'S1': pwm})
+        return np.interp(time, fine[1:], self.capacitor_voltage(net))
+
+    def test_next_event(self):
+        """
+        TEST 1: DECLARED AND ROOT FOUND EDGES, STATES HELD BEFORE THE EDGE
+
+        """
+        # Root found to the tolerance, bracket left of the edge
+        driver = InputDriver(states={'S1': pwm}, locate_events=True)
+        t_event, t_left = driver.next_event(0.1, 0.5, tol=1e-12)
+        self.assertAlmostEqual(t_event, PHASE + DUTY, places=11)
+        self.assertLess(t_left, t_event)
+        self.assertTrue(pwm(t_left))
+        self.assertIsNone(driver.next_event(0.4, 1.0, tol=1e-12))
+
+        # Earliest of several edges in the step
+        t_event, _ = driver.next_event(0.0, 0.5, tol=1e-12)
+        self.assertAlmostEqual(t_event, PHASE, places=11)
+
+        # Declared edges - array or function of the interval, edges at the
+        # step start belong to the previous step
+        for points in (pwm_edges(0.0, 5.0), pwm_edges):
+            driver = InputDriver(states={'S1': pwm},
+                                 breakpoints={'S1': points})
+            self.assertEqual(driver.next_event(0.1, 0.5, tol=1e-12)[0],
+                             PHASE + DUTY)
+            self.assertEqual(driver.next_event(PHASE, 0.2, tol=1e-12),
+                             None)
+
+        # Vector driven states change on the grid only
+        driver = InputDriver(states={'S1': np.array([True, False])},
+                             locate_events=True)
+        self.assertFalse(driver.has_events())
+        self.assertIsNone(driver.next_event(0.0, 1.0, tol=1e-12))
+
+        # Callable states are only searched on request
+        calls = []
+        driver = InputDriver(states={'S1': lambda t: calls.append(t) or
+                                     pwm(t)})
+        self.assertFalse(driver.has_events())
+        self.assertIsNone(driver.next_event(0.1, 0.5, tol=1e-12))
+        self.assertEqual(calls, [])
+
+        # Relative tolerance far from t = 0, where the float spacing
+        # exceeds tol
+        edge = 1e4 + 0.3
+        driver = InputDriver(states={'S1': lambda t: t >= edge},
+                             locate_events=True)
+        t_event, t_left = driver.next_event(1e4, 1e4 + 1.0, tol=1e-12)
+        self.assertAlmostEqual(t_event, edge, delta=1e-7)
+        self.assertLess(t_left, t_event)
+        driver.states['S1'] = lambda t: t >= 1e9 + 0.3
+        t_event, _ = driver.next_event(1e9, 1e9 + 1.0, tol=1e-12)
+        self.assertAlmostEqual(t_event, 1e9 + 0.3, delta=1e-5)
+
+        # Sources at t, states at state_time
+        net = self.build_network()
+        net._build_component_lookup()
+        driver = InputDriver(sources={'V1': lambda t: t},
+                             states={'S1': pwm})
+        driver.apply(net, t=0.5, state_time=0.3)
+        self.assertEqual(net.components_by_name['V1'].component.
+                         ideal_params.ideal_voltage, 0.5)
+        self.assertEqual(net.components_by_name['S1'].component.scond,
+                         SwitchCondition.CLOSED)
+
+    def test_fixed_grid_lands_on_edges(self):
+        """
+        TEST 2: PWM ON A COARSE GRID - LANDED EDGES BEAT A 5X FINER GRID
+        OF SNAPPED EDGES
+
+        """
+        net, time = self.simulate(200, {'S1': pwm})
+        self.assertTrue(np.array_equal(net.sim_data.time, time[1:]))
+        reference = self.reference(time[1:])
+        error = np.abs(self.capacitor_voltage(net) - reference).max()
+
+        # Switch sampled on the grid (old behavior)
+        fine = np.linspace(0, 5.0, 1001)
+        snapped, fine = self.simulate(1000, {'S1': pwm(fine[1:])})
+        snapped_error = np.abs(self.capacitor_voltage(snapped) -
+                               self.reference(fine[1:])).max()
+        self.assertLess(error, snapped_error)
+
+        # Declared edges give the root found solution
+        declared, _ = self.simulate(200, {'S1': pwm},
+                                    breakpoints={'S1': pwm_edges})
+        np.testing.assert_allclose(self.capacitor_voltage(declared),
+                                   self.capacitor_voltage(net), atol=1e-9)
+
+    def test_adaptive_lands_on_edges(self):
+        """
+        TEST 3: ADAPTIVE STEPS END ON EVERY EDGE, BACKWARD EULER RESTART,
+        COARSE STEPS BETWEEN EDGES
+
+        """
+        net = self.build_network()
+        net.solve_adaptive(0.0, 5.0, InputDriver(
+            sources={'V1': lambda t: 12.0}, states={'S1': pwm},
+            locate_events=True), rtol=1e-4)
+
+        sim = net.sim_data
+        edges = np.sort(pwm_edges(0.0, 5.0))
+        edges = edges[(edges > 0) & (edges < 5.0)]
+        landed = [np.argmin(np.abs(sim.time - e)) for e in edges]
+        np.testing.assert_allclose(sim.time[landed], edges, atol=1e-9)
+        np.testing.assert_array_equal(sim.integration_order[
+            np.array(landed) + 1], 1)
+        self.assertEqual(sim.integration_order.max(), 2)
+
+        self.assertLess(len(sim.time), 200)
+        error = np.abs(self.capacitor_voltage(net) -
+                       self.reference(sim.time)).max()
+        self.assertLess(error, 5e-3)
+
+# -----------------------------------------------------------------------------
+# Run tests
+# -----------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
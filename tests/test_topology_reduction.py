@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 09:14:06 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built-in
+import unittest
+import numpy as np
+
+# Custom modules
+from components.capacitor import Capacitor
+from components.current_source import CurrentSource
+from components.inductor import Inductor
+from components.resistor import Resistor
+from components.voltage_source import VoltageSource
+from config_classes.numeric_checks import MathChecks
+from data_classes.component_data import (ComponentData, DiscretizationData,
+                                         IdealComponentData)
+from enums.calculation_mode import CalculationMode
+from enums.component_type import ComponentType
+from enums.discretization_type import DiscretizationType
+from examples.switched_ladder_network import build_switched_ladder_network
+from networks.input_driver import InputDriver
+from networks.network import Network
+
+# -----------------------------------------------------------------------------
+# Define unit test cases
+# -----------------------------------------------------------------------------
+
+class TopologyReductionTests(unittest.TestCase):
+
+    def add(self, net, kind, name, n1, n2, value, int_resistance=0.0):
+
+        data = ComponentData(name=name, node1=n1, node2=n2,
+                             voltage=0.0, current=0.0,
+                             mode=CalculationMode.VOLTAGE)
+
+        if kind is Resistor:
+            data.resistance = value
+        elif kind is Capacitor:
+            data.capacitance = value
+            data.discrete_data = DiscretizationData()
+        elif kind is Inductor:
+            data.inductance = value
+            data.discrete_data = DiscretizationData()
+        elif kind is CurrentSource:
+            data.ideal_params = IdealComponentData(ideal_current=value)
+        else:
+            data.ideal_params = IdealComponentData(
+                ideal_voltage=value, int_resistance=int_resistance)
+        data.ctype = {Resistor: ComponentType.RESISTOR,
+                      Capacitor: ComponentType.CAPACITOR,
+                      Inductor: ComponentType.INDUCTOR,
+                      CurrentSource: ComponentType.CURRENT_SOURCE,
+                      VoltageSource: ComponentType.VOLTAGE_SOURCE}[kind]
+
+        net.add_component(n1, n2, kind(data))
+
+    def build_netlist(self, reduce):
+        """
+        Grounded source V1 (n0 -> n1) feeding an RLC chain with a parallel
+        resistor bank, a floating ideal source V2 and a current source
+        injecting into the middle of the chain
+        """
+
+        net = Network(node_reporting=False, branch_reporting=False,
+                      numerics=MathChecks(topology_reduction=reduce),
+                      discretization=DiscretizationType.BDF2)
+
+        self.add(net, VoltageSource, 'V1', 'n0', 'n1', 10.0)
+        self.add(net, Resistor, 'R1', 'n1', 'n2', 1.0)
+        self.add(net, Inductor, 'L1', 'n2', 'n3', 0.05)
+        self.add(net, Resistor, 'R2', 'n4', 'n3', 2.0)
+        self.add(net, Resistor, 'R3', 'n3', 'n4', 3.0)
+        self.add(net, Resistor, 'R4', 'n4', 'n3', 6.0)
+        self.add(net, Capacitor, 'C1', 'n4', 'n5', 1e-2)
+        self.add(net, Resistor, 'R5', 'n5', 'n6', 4.0)
+        self.add(net, Resistor, 'R6', 'n6', 'n0', 5.0)
+        self.add(net, CurrentSource, 'I1', 'n0', 'n6', 0.5)
+        self.add(net, Resistor, 'R7', 'n6', 'n7', 2.0)
+        self.add(net, Capacitor, 'C2', 'n7', 'n8', 5e-3)
+        self.add(net, VoltageSource, 'V2', 'n8', 'n9', 3.0)
+        self.add(net, Resistor, 'R8', 'n9', 'n10', 1.0)
+        self.add(net, Inductor, 'L2', 'n10', 'n0', 0.02)
+
+        return net
+
+    def solve(self, net):
+
+        time = np.linspace(0, 0.5, 101)
+        driver = InputDriver(sources={'V1': lambda t: 10.0*np.sin(30*t),
+                                      'I1': lambda t: 0.5*np.cos(50*t)})
+        net.solve(time=time, input_driver=driver)
+
+        return net.sim_data
+
+    def assert_same(self, full, reduced):
+
+        self.assertEqual(full.branch_names, reduced.branch_names)
+        self.assertEqual(full.node_names, reduced.node_names)
+        for field in ('node_v', 'branch_v', 'branch_i'):
+            np.testing.assert_allclose(getattr(reduced, field),
+                                       getattr(full, field),
+                                       rtol=1e-9, atol=1e-10)
+
+    def test_reduced_netlist_reports_every_component(self):
+        """
+        TEST 1: SERIES CHAINS AND PARALLEL BANKS MERGE EXACTLY, BDF2 RLC
+
+        """
+        full = self.build_netlist(reduce=False)
+        reduced = self.build_netlist(reduce=True)
+        self.assert_same(self.solve(full), self.solve(reduced))
+
+        # n2..n5 and n7 go, n10 is reached through the series L2 / R8
+        # pair once n9 is protected by V2
+        eliminated = {reduced.node_list[n] for n in
+                      reduced.plan.reduction.eliminated}
+        self.assertEqual(eliminated, {'n2', 'n3', 'n4', 'n5', 'n7', 'n10'})
+        self.assertEqual(reduced.plan.num_unknowns,
+                         full.plan.num_unknowns - 6)
+
+    def test_protected_terminals_stay(self):
+        """
+        TEST 2: REFERENCES, FIXED POTENTIALS, SOURCE TERMINALS ARE KEPT
+
+        """
+        net = self.build_netlist(reduce=True)
+        plan = net.compile()
+
+        for node in ('n0', 'n1', 'n6', 'n8', 'n9'):
+            self.assertNotIn(net.node_indices[node],
+                             plan.reduction.eliminated)
+        self.assertEqual(plan.node_unknown[net.node_indices['n1']], -1)
+        self.assertEqual(plan.num_v_sources, 1)
+
+    def test_ladder_with_islands_collapses(self):
+        """
+        TEST 3: SERIES-PARALLEL LADDER AND A SECOND ISLAND REDUCE TO NOTHING
+
+        """
+        results = []
+        for reduce in (False, True):
+            net = build_switched_ladder_network(
+                sections=12, capacitance=1e-3,
+                numerics=MathChecks(topology_reduction=reduce))
+            self.add(net, VoltageSource, 'VB', 'b0', 'b1', 5.0, 0.2)
+            self.add(net, Resistor, 'RB1', 'b1', 'b2', 1.0)
+            self.add(net, Resistor, 'RB2', 'b2', 'b0', 4.0)
+
+            time = np.linspace(0, 0.2, 41)
+            driver = InputDriver(sources={'V1': lambda t: 12*np.cos(20*t)})
+            net.solve(time=time, input_driver=driver)
+            results.append(net)
+
+        full, reduced = results
+        self.assertEqual(reduced.plan.num_islands, 2)
+        self.assertEqual(reduced.plan.num_unknowns, 0)
+        self.assertEqual(reduced.plan.reduction.num_eliminated,
+                         full.plan.num_unknowns)
+        self.assert_same(full.sim_data, reduced.sim_data)
+
+# -----------------------------------------------------------------------------
+# Run tests
+# -----------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 17:58:49 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built-in
+import unittest
+import numpy as np
+
+# Custom modules
+from config_classes.numeric_checks import MathChecks
+from enums.solver_backend import SolverBackend
+from examples.switched_ladder_network import build_switched_ladder_network
+from networks.input_driver import InputDriver
+from networks.unknown_ordering import (fill_statistics, order_unknowns,
+                                      structure_matrix)
+
+# -----------------------------------------------------------------------------
+# Define unit test cases
+# -----------------------------------------------------------------------------
+
+class UnknownOrderingTests(unittest.TestCase):
+
+    def run_ladder(self, ordering):
+
+        net = build_switched_ladder_network(
+            sections=25, capacitance=1e-3,
+            numerics=MathChecks(node_ordering=ordering,
+                                norton_sources=False,
+                                solver_backend=SolverBackend.SUPERLU,
+                                superlu_ordering='NATURAL'))
+        driver = InputDriver(sources={'V1': lambda t: 12.0})
+        net.solve(time=np.linspace(0, 0.2, 41), input_driver=driver)
+
+        return net
+
+    def test_results_stay_in_user_order(self):
+        """
+        TEST 1: REORDERING IS INVISIBLE IN NODE INDICES AND RESULTS
+
+        """
+        reference = self.run_ladder('none')
+
+        for ordering in ('rcm', 'mindegree'):
+            net = self.run_ladder(ordering)
+
+            self.assertFalse(np.array_equal(net.plan.unknown_perm,
+                                            np.arange(net.engine.size)))
+            self.assertEqual(dict(net.node_indices),
+                             dict(reference.node_indices))
+            self.assertEqual(net.sim_data.node_names,
+                             reference.sim_data.node_names)
+            np.testing.assert_allclose(net.sim_data.node_v,
+                                       reference.sim_data.node_v,
+                                       rtol=1e-9, atol=1e-10)
+            np.testing.assert_allclose(net.sim_data.branch_i,
+                                       reference.sim_data.branch_i,
+                                       rtol=1e-9, atol=1e-10)
+
+    def test_report_shows_fill_reduction(self):
+        """
+        TEST 2: ORDERING REPORT SHOWS LESS FILL AFTER REORDERING
+
+        """
+        report = self.run_ladder('rcm').ordering_report()
+
+        self.assertEqual(report.method, 'rcm')
+        self.assertLess(report.bandwidth_after, report.bandwidth_before)
+        self.assertLess(report.lu_nnz_after, report.lu_nnz_before)
+        self.assertGreaterEqual(report.fill_after, 0)
+        self.assertIn('fill-in', str(report))
+
+        unordered = self.run_ladder('none').ordering_report()
+        self.assertEqual(unordered.lu_nnz_after, unordered.lu_nnz_before)
+
+    def test_minimum_degree_on_large_mesh(self):
+        """
+        TEST 3: MINIMUM DEGREE ORDERS A 100 X 100 MESH WITH LESS FILL THAN
+        RCM
+
+        """
+        n = 100
+        index = np.arange(n*n).reshape(n, n)
+        g_n1 = np.concatenate((index[:-1, :].ravel(), index[:, :-1].ravel()))
+        g_n2 = np.concatenate((index[1:, :].ravel(), index[:, 1:].ravel()))
+        none = np.zeros(0, dtype=np.int64)
+        S = structure_matrix(n*n, g_n1, g_n2, none, none, none)
+
+        perm = order_unknowns(S, 'mindegree')
+        np.testing.assert_array_equal(np.sort(perm), np.arange(n*n))
+        self.assertLess(fill_statistics(S, perm)['lu_nnz'],
+                        fill_statistics(S, order_unknowns(S, 'rcm'))
+                        ['lu_nnz'])
+
+# -----------------------------------------------------------------------------
+# Run tests
+# -----------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
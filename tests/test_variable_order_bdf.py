@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Fri Oct 23 08:41:17 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built-in
+import unittest
+import numpy as np
+
+# Custom modules
+from components.capacitor import Capacitor
+from data_classes.component_data import (BDF_HISTORY, ComponentData, 
+                                         DiscretizationData)
+from data_classes.stamp_context import StampContext
+from enums.component_type import ComponentType
+from enums.discretization_type import DiscretizationType
+from examples.rlc_network import build_rlc_network
+from examples.switched_ladder_network import build_switched_ladder_network
+from networks.input_driver import InputDriver
+from networks.step_control import local_truncation_error
+
+# -----------------------------------------------------------------------------
+# Define unit test cases
+# -----------------------------------------------------------------------------
+
+class VariableOrderBDFTests(unittest.TestCase):
+
+    def capacitor(self, history, dts):
+
+        data = ComponentData(name='C1', node1='n1', node2='n0', voltage=0.0,
+                             current=0.0, ctype=ComponentType.CAPACITOR,
+                             capacitance=1.0)
+        data.discrete_data = DiscretizationData(
+            history_voltage=list(history),
+            history_current=[0.0]*len(history),
+            history_dt=list(dts))
+        return Capacitor(data)
+
+    def test_coefficients_history_and_error_estimate(self):
+        """
+        TEST 1: BDF3 COEFFICIENTS, FIVE POINT HISTORY, LTE AT ORDERS 1 - 5
+
+        """
+        h = 0.1
+        cap = self.capacitor([1.0, 2.0, 3.0], [h, h])
+        alpha0, terms, _ = cap._bdf_terms(h, 3)
+        self.assertAlmostEqual(alpha0, 11/(6*h))
+        self.assertAlmostEqual(terms, (-3*1.0 + 1.5*2.0 - 3.0/3)/h)
+
+        # Order capped by the stored points
+        self.assertAlmostEqual(cap._bdf_terms(h, 5)[0], alpha0)
+
+        # post_solve pushes the new point, the first one seeds the history
+        cap = self.capacitor([], [])
+        ctx = StampContext(dt=h, default_dt=False, discretization=
+                           DiscretizationType.BDF_VARIABLE, bdf_order=3)
+        for k in range(7):
+            cap.post_solve(float(k + 1), ctx)
+        d = cap.component.discrete_data
+        self.assertEqual(d.history_voltage, [7.0, 6.0, 5.0, 4.0, 3.0])
+        self.assertEqual(len(d.history_dt), BDF_HISTORY - 1)
+        self.assertAlmostEqual(cap.component.current, 1.0/h)
+
+        # One step of x' = -x from the exact history
+        for order in range(1, 6):
+            t = np.arange(order + 2)*1e-2
+            exact = np.exp(-t)
+            cap = self.capacitor(exact[order::-1], [1e-2]*order)
+            alpha0, terms, _ = cap._bdf_terms(1e-2, order)
+            x_new = -terms / (alpha0 + 1)
+            error = local_truncation_error(
+                t, np.append(exact[:-1], x_new)[:, None], order)
+            self.assertAlmostEqual(error[0] / abs(x_new - exact[-1]), 1.0,
+                                   places=1)
+
+    def test_order_selection_fewer_steps(self):
+        """
+        TEST 2: UNDERDAMPED RLC OVER 60 S - HIGHER ORDERS, A THIRD OF THE 
+        BDF2 STEPS AT THE SAME TOLERANCE
+
+        """
+        v0 = 12.0
+        r_eq, l, c = 1.0, 2.0, 2.0
+        alpha = r_eq/(2*l)
+        wd = np.sqrt(1/(l*c) - alpha**2)
+        driver = InputDriver(sources={'V1': lambda t: v0})
+
+        results = {}
+        for scheme in (DiscretizationType.BDF2,
+                       DiscretizationType.BDF_VARIABLE):
+            net, _, _, _ = build_rlc_network(discretization=scheme,
+                                             eqv_resistance=r_eq,
+                                             inductance=l, capacitance=c)
+            net.solve_adaptive(0.0, 60.0, driver, rtol=1e-5)
+
+            time = net.sim_data.time
+            exact = v0*(1 - np.exp(-alpha*time)*(np.cos(wd*time) +
+                                                 alpha/wd*np.sin(wd*time)))
+            for k, (_, _, m) in enumerate(net.branch_list):
+                if m.component.ctype == ComponentType.CAPACITOR:
+                    error = np.abs(net.sim_data.branch_v[:, k] - exact).max()
+            results[scheme] = (len(time), error, net.sim_data)
+
+        steps, error, sim = results[DiscretizationType.BDF_VARIABLE]
+        bdf2_steps, bdf2_error, _ = results[DiscretizationType.BDF2]
+        self.assertLess(steps, bdf2_steps/3)
+        self.assertLess(error, bdf2_error)
+        self.assertGreaterEqual(sim.integration_order.max(), 3)
+        self.assertEqual(sim.integration_order[0], 1)
+
+    def test_switch_event_restarts_at_order_one(self):
+        """
+        TEST 3: SWITCH CLOSING RESTARTS THE ORDER AT 1, FIXED AND ADAPTIVE
+
+        """
+        driver = InputDriver(sources={'V1': lambda t: 12.0},
+                             states={'S1': lambda t: t >= 5.0},
+                             locate_events=True)
+
+        # Fixed grid - the order climbs again after the event
+        net = build_switched_ladder_network(
+            sections=4, num_switches=1, capacitance=0.1,
+            discretization=DiscretizationType.BDF_VARIABLE)
+        time = np.linspace(0, 10, 401)
+        net.solve(time=time, input_driver=driver)
+        order = net.sim_data.integration_order
+        event = np.flatnonzero(time[1:] > 5.0)[0]
+        self.assertGreater(order[event - 1], 1)
+        self.assertEqual(order[event], 1)
+        self.assertGreater(order[-1], 1)
+
+        # Adaptive - coarse steps of high order on either side
+        steps = {}
+        for scheme in (DiscretizationType.BDF2,
+                       DiscretizationType.BDF_VARIABLE):
+            net = build_switched_ladder_network(
+                sections=4, num_switches=1, capacitance=0.1,
+                discretization=scheme)
+            net.solve_adaptive(0.0, 10.0, driver, rtol=1e-5)
+            steps[scheme] = len(net.sim_data.time)
+
+        sim = net.sim_data
+        event = np.argmin(np.abs(sim.time - 5.0)) + 1
+        self.assertEqual(sim.integration_order[event], 1)
+        self.assertGreater(sim.integration_order[:event].max(), 2)
+        self.assertGreater(sim.integration_order[event:].max(), 2)
+        self.assertLess(steps[DiscretizationType.BDF_VARIABLE],
+                        steps[DiscretizationType.BDF2]/2)
+
+# -----------------------------------------------------------------------------
+# Run tests
+# -----------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
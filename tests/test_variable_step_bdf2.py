@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Thu Oct 22 09:05:41 2026
+
+@author: pmdam
+"""
+
+# -----------------------------------------------------------------------------
+# Import statements
+# -----------------------------------------------------------------------------
+
+# Built-in
+import unittest
+import numpy as np
+
+# Custom modules
+from components.capacitor import Capacitor
+from components.inductor import Inductor
+from data_classes.component_data import ComponentData, DiscretizationData
+from data_classes.stamp_context import StampContext
+from enums.calculation_mode import CalculationMode
+from enums.component_type import ComponentType
+from enums.discretization_type import DiscretizationType
+from examples.rc_network import build_rc_network
+from examples.rl_network import build_rl_network
+from networks.input_driver import InputDriver
+
+# -----------------------------------------------------------------------------
+# Define unit test cases
+# -----------------------------------------------------------------------------
+
+class VariableStepBDF2Tests(unittest.TestCase):
+
+    def branch_trace(self, net, ctype):
+
+        for k, (_, _, c) in enumerate(net.branch_list):
+            if c.component.ctype is ctype:
+                if ctype is ComponentType.INDUCTOR:
+                    return net.sim_data.branch_i[:, k]
+                return net.sim_data.branch_v[:, k]
+
+    def graded_error(self, builder, ctype, steps):
+        """
+        Max error of the step response on t = 5 tau (k / N)^2 - the step
+        ratio changes on every step.
+        """
+
+        v0 = 12.0
+        driver = InputDriver(sources={'V1': lambda t: v0})
+
+        errors = []
+        for n in steps:
+            net, r_eq, x = builder(discretization=DiscretizationType.BDF2)
+            tau = r_eq*x if ctype is ComponentType.CAPACITOR else x/r_eq
+            time = 5*tau*(np.arange(n + 1)/n)**2
+            net.solve(time=time, input_driver=driver)
+
+            final = v0 if ctype is ComponentType.CAPACITOR else v0/r_eq
+            exact = final*(1 - np.exp(-time[1:]/tau))
+            errors.append(np.abs(self.branch_trace(net, ctype) -
+                                 exact).max())
+
+        return np.array(errors)
+
+    def test_companion_coefficients(self):
+        """
+        TEST 1: STEP RATIO FROM THE STORED DT SETS THE BDF2 COEFFICIENTS
+
+        """
+        data = ComponentData(name='C1', node1='n1', node2='n0', voltage=0.0,
+                             current=0.0, mode=CalculationMode.VOLTAGE,
+                             ctype=ComponentType.CAPACITOR, capacitance=2.0)
+        data.discrete_data = DiscretizationData(lpv1_voltage=3.0,
+                                                lpv2_voltage=1.0)
+        cap = Capacitor(data)
+        ctx = StampContext(dt=0.5, default_dt=False,
+                           discretization=DiscretizationType.BDF2)
+
+        # No stored step - constant step coefficients (3, -4, 1) / 2
+        G, J = cap.companion(ctx)
+        self.assertAlmostEqual(G, 1.5*2.0/0.5)
+        self.assertAlmostEqual(J, -(2*3.0 - 0.5*1.0)*2.0/0.5)
+
+        # Twice the previous step, w = 2
+        data.discrete_data.lpv1_dt = 0.25
+        G, J = cap.companion(ctx)
+        self.assertAlmostEqual(G, (5/3)*2.0/0.5)
+        self.assertAlmostEqual(J, -(3*3.0 - (4/3)*1.0)*2.0/0.5)
+
+        # post_solve records the step for the next companion
+        cap.post_solve(4.0, ctx)
+        self.assertEqual(data.discrete_data.lpv1_dt, 0.5)
+        self.assertEqual(data.discrete_data.lpv2_voltage, 3.0)
+
+        data = ComponentData(name='L1', node1='n1', node2='n0', voltage=0.0,
+                             current=0.0, mode=CalculationMode.VOLTAGE,
+                             ctype=ComponentType.INDUCTOR, inductance=2.0)
+        data.discrete_data = DiscretizationData(lpv1_current=3.0,
+                                                lpv2_current=1.0,
+                                                lpv1_dt=0.25)
+        G, J = Inductor(data).companion(ctx)
+        self.assertAlmostEqual(G, 0.5/((5/3)*2.0))
+
+    def test_rc_graded_grid_second_order(self):
+        """
+        TEST 2: RC STEP ON A NON UNIFORM GRID CONVERGES AT SECOND ORDER
+
+        """
+        errors = self.graded_error(build_rc_network,
+                                   ComponentType.CAPACITOR, (40, 80, 160))
+        rates = np.log2(errors[:-1] / errors[1:])
+        np.testing.assert_allclose(rates, 2.0, atol=0.1)
+
+    def test_rl_graded_grid_and_adaptive_steps(self):
+        """
+        TEST 3: RL STEP SECOND ORDER ON A NON UNIFORM GRID, ADAPTIVE BDF2
+        KEEPS ITS HISTORY ACROSS DT CHANGES
+
+        """
+        errors = self.graded_error(build_rl_network,
+                                   ComponentType.INDUCTOR, (40, 80, 160))
+        rates = np.log2(errors[:-1] / errors[1:])
+        np.testing.assert_allclose(rates, 2.0, atol=0.1)
+
+        v0 = 12.0
+        net, r_eq, l = build_rl_network(discretization=
+                                        DiscretizationType.BDF2)
+        tau = l/r_eq
+        net.solve_adaptive(0.0, 50*tau, InputDriver(
+            sources={'V1': lambda t: v0}))
+
+        time = net.sim_data.time
+        exact = v0/r_eq*(1 - np.exp(-time/tau))
+        self.assertLess(len(time), 70)
+        self.assertLess(np.abs(self.branch_trace(
+            net, ComponentType.INDUCTOR) - exact).max(), 0.05*v0/r_eq)
+
+# -----------------------------------------------------------------------------
+# Run tests
+# -----------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()